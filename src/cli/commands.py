@@ -70,7 +70,7 @@ def format_as_api_json(rewards: OperatorRewards, include_validators: bool = Fals
     # Add APY metrics if available
     if rewards.apy:
         # Use actual excess bond for lifetime values (matches Web API)
-        lifetime_bond = float(rewards.excess_bond_eth)
+        lifetime_bond = rewards.excess_bond_eth
         lifetime_net_total = (rewards.apy.lifetime_distribution_eth or 0) + lifetime_bond
 
         result["apy"] = {
@@ -1,16 +1,16 @@
 """Data models for CSM Dashboard."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer
 
-if TYPE_CHECKING:
-    from ..data.beacon import ValidatorInfo
+from ..data.beacon import ValidatorInfo
 
 
-class NodeOperator(BaseModel):
+@dataclass(frozen=True, slots=True)
+class NodeOperator:
     """Node operator data from CSModule contract."""
 
     node_operator_id: int
@@ -31,17 +31,23 @@ class NodeOperator(BaseModel):
     extended_manager_permissions: bool
 
 
-class BondSummary(BaseModel):
-    """Bond information for an operator."""
+@dataclass(frozen=True, slots=True)
+class BondSummary:
+    """Bond information for an operator.
+
+    The *_wei fields are the exact values; the *_eth fields are derived from
+    them for display only.
+    """
 
     current_bond_wei: int
     required_bond_wei: int
-    current_bond_eth: Decimal
-    required_bond_eth: Decimal
-    excess_bond_eth: Decimal
+    current_bond_eth: float
+    required_bond_eth: float
+    excess_bond_eth: float
 
 
-class RewardsInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RewardsInfo:
     """Rewards data from merkle tree."""
 
     cumulative_fee_shares: int
@@ -121,6 +127,9 @@ class APYMetrics(BaseModel):
     which is more accurate than calculating from unclaimed amounts.
     """
 
+    # Frozen: instances are shared between callers via the APY metrics cache
+    model_config = {"frozen": True}
+
     # Previous distribution frame metrics
     previous_distribution_eth: float | None = None
     previous_distribution_apy: float | None = None
@@ -223,21 +232,21 @@ class OperatorRewards(BaseModel):
     curve_id: int = 0  # 0=Permissionless, 1=ICS/Legacy EA
     operator_type: str = "Permissionless"  # Human-readable type
 
-    # Bond information
-    current_bond_eth: Decimal
-    required_bond_eth: Decimal
-    excess_bond_eth: Decimal
+    # Bond information (display values; exact amounts live in BondSummary wei fields)
+    current_bond_eth: float
+    required_bond_eth: float
+    excess_bond_eth: float
 
-    # Rewards information
+    # Rewards information (shares are exact, ETH values are for display)
     cumulative_rewards_shares: int
-    cumulative_rewards_eth: Decimal
+    cumulative_rewards_eth: float
     distributed_shares: int
-    distributed_eth: Decimal
+    distributed_eth: float
     unclaimed_shares: int
-    unclaimed_eth: Decimal
+    unclaimed_eth: float
 
     # Total claimable
-    total_claimable_eth: Decimal
+    total_claimable_eth: float
 
     # Validator counts (from on-chain)
     total_validators: int
@@ -245,7 +254,7 @@ class OperatorRewards(BaseModel):
     exited_validators: int
 
     # Validator details (from beacon chain, optional)
-    validator_details: list[Any] = []  # list[ValidatorInfo]
+    validator_details: list[ValidatorInfo] = []
     validators_by_status: dict[str, int] | None = None
     avg_effectiveness: float | None = None
 
@@ -263,3 +272,8 @@ class OperatorRewards(BaseModel):
 
     # Data quality warnings (populated when distribution data may be incomplete)
     data_warnings: list[str] = []
+
+    @field_serializer("validator_details")
+    def _serialize_validator_details(self, validators: list[ValidatorInfo]) -> list[dict]:
+        # Use the dataclass's own dict form rather than having pydantic walk each element
+        return [v.to_dict() for v in validators]
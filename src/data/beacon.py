@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
@@ -12,11 +13,17 @@ logger = logging.getLogger(__name__)
 
 from ..core.config import get_settings
 from .cache import cached
+from .http import get_client, parse_json
 
 # Beacon Chain constants
 BEACON_GENESIS = datetime(2020, 12, 1, 12, 0, 23, tzinfo=timezone.utc)
 SECONDS_PER_EPOCH = 32 * 12  # 384 seconds (32 slots × 12 seconds per slot)
 
+# beaconcha.in accepts up to 100 comma-separated pubkeys per request
+BEACONCHAIN_BATCH_SIZE = 100
+# Concurrent batch requests when an API key lifts the free-tier rate limit
+BEACONCHAIN_BATCH_CONCURRENCY = 4
+
 
 def epoch_to_datetime(epoch: int) -> datetime:
     """Convert beacon chain epoch to datetime."""
@@ -99,26 +106,17 @@ class ValidatorStatus(str, Enum):
         )
 
 
+@dataclass(frozen=True, slots=True)
 class ValidatorInfo:
     """Information about a single validator."""
 
-    def __init__(
-        self,
-        pubkey: str,
-        index: int | None = None,
-        status: ValidatorStatus = ValidatorStatus.UNKNOWN,
-        balance_gwei: int = 0,
-        effectiveness: float | None = None,
-        activation_epoch: int | None = None,
-        exit_epoch: int | None = None,
-    ):
-        self.pubkey = pubkey
-        self.index = index
-        self.status = status
-        self.balance_gwei = balance_gwei
-        self.effectiveness = effectiveness
-        self.activation_epoch = activation_epoch
-        self.exit_epoch = exit_epoch
+    pubkey: str
+    index: int | None = None
+    status: ValidatorStatus = ValidatorStatus.UNKNOWN
+    balance_gwei: int = 0
+    effectiveness: float | None = None
+    activation_epoch: int | None = None
+    exit_epoch: int | None = None
 
     @property
     def balance_eth(self) -> Decimal:
@@ -154,6 +152,34 @@ class ValidatorInfo:
         }
 
 
+def current_epoch() -> int:
+    """Current beacon chain epoch, derived from wall-clock time."""
+    elapsed = datetime.now(timezone.utc) - BEACON_GENESIS
+    return int(elapsed.total_seconds()) // SECONDS_PER_EPOCH
+
+
+class _EpochValidatorCache:
+    """Validator info by lowercase pubkey, valid for a single epoch.
+
+    Validator status and balance only change at epoch boundaries, so entries
+    are dropped wholesale when the epoch advances instead of using a TTL.
+    """
+
+    def __init__(self):
+        self.epoch: int | None = None
+        self.validators: dict[str, ValidatorInfo] = {}
+
+    def for_epoch(self, epoch: int) -> dict[str, ValidatorInfo]:
+        if epoch != self.epoch:
+            self.epoch = epoch
+            self.validators = {}
+        return self.validators
+
+
+# Module-level so the cache survives the per-request provider instances
+_validator_cache = _EpochValidatorCache()
+
+
 class BeaconDataProvider:
     """Fetches validator data from beaconcha.in API."""
 
@@ -168,92 +194,127 @@ class BeaconDataProvider:
             headers["apikey"] = self.settings.beacon_api_key
         return headers
 
-    @cached(ttl=300)  # Cache for 5 minutes
     async def get_validators_by_pubkeys(
         self, pubkeys: list[str]
     ) -> list[ValidatorInfo]:
         """
         Fetch validator info for multiple pubkeys.
 
-        beaconcha.in supports comma-separated pubkeys (up to 100).
-        Includes retry logic for rate limiting and proper error handling.
+        Results are cached until the end of the current epoch, so only pubkeys
+        not already seen this epoch are requested. beaconcha.in supports
+        comma-separated pubkeys (up to 100), so misses are split into batches.
+        With an API key (higher rate limits) batches are fetched concurrently;
+        without one they are spaced out.
         """
         if not pubkeys:
             return []
 
-        validators = []
-        batch_size = 100  # beaconcha.in limit
-        max_retries = 3
+        cache = _validator_cache.for_epoch(current_epoch())
+        missing = [pk for pk in pubkeys if pk.lower() not in cache]
+        batches = [
+            tuple(missing[i : i + BEACONCHAIN_BATCH_SIZE])
+            for i in range(0, len(missing), BEACONCHAIN_BATCH_SIZE)
+        ]
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for i in range(0, len(pubkeys), batch_size):
-                batch = pubkeys[i : i + batch_size]
-                pubkeys_param = ",".join(batch)
+        if self.settings.beacon_api_key:
+            semaphore = asyncio.Semaphore(BEACONCHAIN_BATCH_CONCURRENCY)
 
+            async def fetch(batch: tuple[str, ...]) -> list[ValidatorInfo]:
+                async with semaphore:
+                    return await self._get_validator_batch(batch)
+
+            results = await asyncio.gather(*(fetch(batch) for batch in batches))
+        else:
+            results = []
+            for i, batch in enumerate(batches):
                 # Add delay between batches to avoid rate limiting
                 if i > 0:
                     await asyncio.sleep(0.5)
+                results.append(await self._get_validator_batch(batch))
 
-                for attempt in range(max_retries):
-                    try:
-                        response = await client.get(
-                            f"{self.base_url}/validator/{pubkeys_param}",
-                            headers=self._get_headers(),
-                        )
+        fetched: dict[str, ValidatorInfo] = {}
+        for batch_validators in results:
+            for v in batch_validators:
+                fetched[v.pubkey.lower()] = v
+                # UNKNOWN marks a failed or rate-limited fetch - retry it next time
+                if v.status != ValidatorStatus.UNKNOWN:
+                    cache[v.pubkey.lower()] = v
 
-                        if response.status_code == 200:
-                            data = response.json().get("data", [])
-                            # API returns single object if only one validator
-                            if isinstance(data, dict):
-                                data = [data]
-
-                            for v in data:
-                                validators.append(self._parse_validator(v))
-                            break  # Success, exit retry loop
-                        elif response.status_code == 404:
-                            # Validators not found - create placeholder entries
-                            for pubkey in batch:
-                                validators.append(
-                                    ValidatorInfo(
-                                        pubkey=pubkey,
-                                        status=ValidatorStatus.PENDING_INITIALIZED,
-                                    )
-                                )
-                            break  # Success, exit retry loop
-                        elif response.status_code == 429:
-                            # Rate limited - wait and retry
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(2**attempt)  # 1s, 2s, 4s
-                                continue
-                            # Max retries reached, add as unknown
-                            for pubkey in batch:
-                                validators.append(
-                                    ValidatorInfo(
-                                        pubkey=pubkey, status=ValidatorStatus.UNKNOWN
-                                    )
-                                )
-                            break
-                        else:
-                            # Other error status - add as unknown
-                            for pubkey in batch:
-                                validators.append(
-                                    ValidatorInfo(
-                                        pubkey=pubkey, status=ValidatorStatus.UNKNOWN
-                                    )
-                                )
-                            break
-                    except Exception:
-                        if attempt < max_retries - 1:
-                            await asyncio.sleep(1)
-                            continue
-                        # On final failure, add unknown status for this batch
-                        for pubkey in batch:
-                            validators.append(
-                                ValidatorInfo(
-                                    pubkey=pubkey, status=ValidatorStatus.UNKNOWN
-                                )
+        validators = []
+        for pk in pubkeys:
+            v = cache.get(pk.lower()) or fetched.get(pk.lower())
+            if v is not None:
+                validators.append(v)
+        return validators
+
+    async def _get_validator_batch(self, batch: tuple[str, ...]) -> list[ValidatorInfo]:
+        """Fetch one batch of up to 100 validators, with retries for rate limiting."""
+        validators = []
+        max_retries = 3
+        pubkeys_param = ",".join(batch)
+        client = await get_client()
+
+        for attempt in range(max_retries):
+            try:
+                response = await client.get(
+                    f"{self.base_url}/validator/{pubkeys_param}",
+                    headers=self._get_headers(),
+                    timeout=30.0,
+                )
+
+                if response.status_code == 200:
+                    data = parse_json(response).get("data", [])
+                    # API returns single object if only one validator
+                    if isinstance(data, dict):
+                        data = [data]
+
+                    for v in data:
+                        validators.append(self._parse_validator(v))
+                    break  # Success, exit retry loop
+                elif response.status_code == 404:
+                    # Validators not found - create placeholder entries
+                    for pubkey in batch:
+                        validators.append(
+                            ValidatorInfo(
+                                pubkey=pubkey,
+                                status=ValidatorStatus.PENDING_INITIALIZED,
                             )
-                        break
+                        )
+                    break  # Success, exit retry loop
+                elif response.status_code == 429:
+                    # Rate limited - wait and retry
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(2**attempt)  # 1s, 2s, 4s
+                        continue
+                    # Max retries reached, add as unknown
+                    for pubkey in batch:
+                        validators.append(
+                            ValidatorInfo(
+                                pubkey=pubkey, status=ValidatorStatus.UNKNOWN
+                            )
+                        )
+                    break
+                else:
+                    # Other error status - add as unknown
+                    for pubkey in batch:
+                        validators.append(
+                            ValidatorInfo(
+                                pubkey=pubkey, status=ValidatorStatus.UNKNOWN
+                            )
+                        )
+                    break
+            except Exception:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(1)
+                    continue
+                # On final failure, add unknown status for this batch
+                for pubkey in batch:
+                    validators.append(
+                        ValidatorInfo(
+                            pubkey=pubkey, status=ValidatorStatus.UNKNOWN
+                        )
+                    )
+                break
 
         return validators
 
@@ -291,7 +352,7 @@ class BeaconDataProvider:
                 )
 
                 if response.status_code == 200:
-                    return response.json().get("data")
+                    return parse_json(response).get("data")
             except Exception as e:
                 logger.debug(f"Failed to get validator performance for index {validator_index}: {e}")
 
@@ -333,7 +394,7 @@ class BeaconDataProvider:
                     )
 
                     if response.status_code == 200:
-                        data = response.json().get("data", [])
+                        data = parse_json(response).get("data", [])
                         # Handle single validator response (dict instead of list)
                         if isinstance(data, dict):
                             data = [data]
@@ -360,13 +421,29 @@ class BeaconDataProvider:
         }
 
 
-def aggregate_validator_status(validators: list[ValidatorInfo]) -> dict[str, int]:
-    """
-    Aggregate validator statuses into counts.
+def _status_bucket(status: ValidatorStatus) -> str:
+    """Map a validator status to its aggregate_validator_status() bucket."""
+    if status.is_active and status != ValidatorStatus.ACTIVE_SLASHED:
+        if status == ValidatorStatus.ACTIVE_EXITING:
+            return "exiting"
+        return "active"
+    elif status in (ValidatorStatus.PENDING_INITIALIZED, ValidatorStatus.PENDING_QUEUED):
+        return "pending"
+    elif status.is_exited:
+        if status == ValidatorStatus.EXITED_SLASHED:
+            return "slashed"
+        return "exited"
+    elif status == ValidatorStatus.ACTIVE_SLASHED:
+        return "slashed"
+    return "unknown"
 
-    Returns dict like: {"active": 198, "pending": 1, "exited": 1, "slashed": 0}
-    """
-    counts = {
+
+# Precomputed so per-validator aggregation is a dict lookup
+_STATUS_BUCKETS = {status: _status_bucket(status) for status in ValidatorStatus}
+
+
+def _empty_status_counts() -> dict[str, int]:
+    return {
         "active": 0,
         "pending": 0,
         "exiting": 0,
@@ -375,24 +452,16 @@ def aggregate_validator_status(validators: list[ValidatorInfo]) -> dict[str, int
         "unknown": 0,
     }
 
-    for v in validators:
-        if v.status.is_active and v.status != ValidatorStatus.ACTIVE_SLASHED:
-            if v.status == ValidatorStatus.ACTIVE_EXITING:
-                counts["exiting"] += 1
-            else:
-                counts["active"] += 1
-        elif v.status in (ValidatorStatus.PENDING_INITIALIZED, ValidatorStatus.PENDING_QUEUED):
-            counts["pending"] += 1
-        elif v.status.is_exited:
-            if v.status == ValidatorStatus.EXITED_SLASHED:
-                counts["slashed"] += 1
-            else:
-                counts["exited"] += 1
-        elif v.status == ValidatorStatus.ACTIVE_SLASHED:
-            counts["slashed"] += 1
-        else:
-            counts["unknown"] += 1
 
+def aggregate_validator_status(validators: list[ValidatorInfo]) -> dict[str, int]:
+    """
+    Aggregate validator statuses into counts.
+
+    Returns dict like: {"active": 198, "pending": 1, "exited": 1, "slashed": 0}
+    """
+    counts = _empty_status_counts()
+    for v in validators:
+        counts[_STATUS_BUCKETS[v.status]] += 1
     return counts
 
 
@@ -409,6 +478,30 @@ def calculate_avg_effectiveness(validators: list[ValidatorInfo]) -> float | None
     return total / len(active_with_effectiveness)
 
 
+def summarize_validators(
+    validators: list[ValidatorInfo],
+) -> tuple[dict[str, int], float | None]:
+    """Status counts and average effectiveness in a single pass.
+
+    Equivalent to (aggregate_validator_status(v), calculate_avg_effectiveness(v)).
+    """
+    counts = _empty_status_counts()
+    effectiveness_total = 0.0
+    effectiveness_count = 0
+
+    for v in validators:
+        status = v.status
+        counts[_STATUS_BUCKETS[status]] += 1
+        if v.effectiveness is not None and status.is_active:
+            effectiveness_total += v.effectiveness
+            effectiveness_count += 1
+
+    avg_effectiveness = (
+        effectiveness_total / effectiveness_count if effectiveness_count else None
+    )
+    return counts, avg_effectiveness
+
+
 def count_at_risk_validators(validators: list[ValidatorInfo]) -> int:
     """Count validators with balance < 32 ETH (at risk of withdrawal penalty)."""
     return sum(1 for v in validators if v.at_risk)
@@ -1,11 +1,12 @@
 """Simple in-memory cache with TTL support and LRU eviction."""
 
+import asyncio
 import hashlib
 import logging
 from collections import OrderedDict
 from datetime import datetime, timedelta
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Awaitable, Callable
 
 from ..core.config import get_settings
 
@@ -57,6 +58,10 @@ class SimpleCache:
         expiry = datetime.now() + timedelta(seconds=ttl or self._default_ttl)
         self._cache[key] = (value, expiry)
 
+    def delete(self, key: str) -> None:
+        """Remove a value from the cache if present."""
+        self._cache.pop(key, None)
+
     def clear(self) -> None:
         """Clear all cached values."""
         self._cache.clear()
@@ -80,14 +85,49 @@ class SimpleCache:
 # Global cache instance
 _cache = SimpleCache()
 
+# Calls currently being computed by @cached/@coalesced, keyed like _cache
+_in_flight: dict[str, asyncio.Future] = {}
 
-def cached(ttl: int | None = None) -> Callable:
-    """Decorator for caching async function results."""
 
-    def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Create cache key from function name and arguments
+async def _track(cache_key: str, coro: Awaitable) -> Any:
+    """Await coro, then drop it from the in-flight table."""
+    try:
+        return await coro
+    finally:
+        if _in_flight.get(cache_key) is asyncio.current_task():
+            del _in_flight[cache_key]
+
+
+async def _join_in_flight(cache_key: str, start: Callable[[], Awaitable]) -> Any:
+    """Await the call running under cache_key, starting it if there is none.
+
+    Callers arriving while the same call is already running await it instead
+    of issuing a duplicate request.
+    """
+    task = _in_flight.get(cache_key)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_track(cache_key, start()))
+        _in_flight[cache_key] = task
+    # Shield so one caller being cancelled doesn't cancel the shared call
+    return await asyncio.shield(task)
+
+
+async def _fill(cache_key: str, func: Callable, args: tuple, kwargs: dict, ttl: int | None) -> Any:
+    """Run func and store its result, unless the call was invalidated meanwhile."""
+    result = await func(*args, **kwargs)
+    if _in_flight.get(cache_key) is asyncio.current_task():
+        _cache.set(cache_key, result, ttl)
+    return result
+
+
+def _key_builder(func: Callable, key: Callable[..., Any] | None) -> Callable[[tuple, dict], str]:
+    """Build the function turning a call's arguments into its cache key."""
+
+    def make_key(args: tuple, kwargs: dict) -> str:
+        # Create cache key from function name and arguments
+        if key is not None:
+            key_data = f"{func.__module__}.{func.__name__}:{repr(key(*args, **kwargs))}"
+        else:
             # Skip 'self' in args to allow cache sharing across instances (for methods)
             # Detect 'self' by checking if first arg is an instance with the decorated method
             cache_args = args
@@ -95,15 +135,70 @@ def cached(ttl: int | None = None) -> Callable:
                 # First arg is likely 'self' - skip it for cache key
                 cache_args = args[1:]
             key_data = f"{func.__module__}.{func.__name__}:{repr(cache_args)}:{repr(sorted(kwargs.items()))}"
-            cache_key = hashlib.md5(key_data.encode()).hexdigest()
+        return hashlib.md5(key_data.encode()).hexdigest()
+
+    return make_key
+
+
+def cached(ttl: int | None = None, key: Callable[..., Any] | None = None) -> Callable:
+    """Decorator for caching async function results.
+
+    Concurrent calls with the same arguments share one execution (see coalesced).
+
+    Args:
+        ttl: Time to live in seconds (defaults to the configured cache TTL)
+        key: Optional function called with the same arguments as the decorated
+            function (including 'self' for methods) returning the value to key on.
+            Use it to bucket arguments that vary more often than the result does.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        make_key = _key_builder(func, key)
+
+        def invalidate(*args: Any, **kwargs: Any) -> None:
+            """Drop the cached result for these arguments (pass 'self' for methods).
+
+            A call still running for them is detached too: later callers start a
+            fresh one, and the stale call's result is not stored.
+            """
+            cache_key = make_key(args, kwargs)
+            _cache.delete(cache_key)
+            _in_flight.pop(cache_key, None)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_key = make_key(args, kwargs)
 
             cached_result = _cache.get(cache_key)
             if cached_result is not _MISSING:
                 return cached_result
 
-            result = await func(*args, **kwargs)
-            _cache.set(cache_key, result, ttl)
-            return result
+            return await _join_in_flight(
+                cache_key, lambda: _fill(cache_key, func, args, kwargs, ttl)
+            )
+
+        wrapper.invalidate = invalidate
+        return wrapper
+
+    return decorator
+
+
+def coalesced(key: Callable[..., Any] | None = None) -> Callable:
+    """Decorator sharing one execution between concurrent identical async calls.
+
+    Like @cached without keeping the result: once the call finishes, the next
+    caller starts a fresh one.
+
+    Args:
+        key: Optional function returning the value to key on (see cached)
+    """
+
+    def decorator(func: Callable) -> Callable:
+        make_key = _key_builder(func, key)
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await _join_in_flight(make_key(args, kwargs), lambda: func(*args, **kwargs))
 
         return wrapper
 
@@ -8,6 +8,7 @@ import httpx
 from web3 import Web3
 
 from ..core.config import get_settings
+from .http import parse_json
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +55,7 @@ class EtherscanProvider:
             )
 
             try:
-                data = response.json()
+                data = parse_json(response)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse Etherscan response: {e}")
                 return []
@@ -130,7 +131,7 @@ class EtherscanProvider:
             )
 
             try:
-                data = response.json()
+                data = parse_json(response)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse Etherscan transfer events response: {e}")
                 return []
@@ -213,7 +214,7 @@ class EtherscanProvider:
             )
 
             try:
-                data = response.json()
+                data = parse_json(response)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse Etherscan withdrawal requested events: {e}")
                 return []
@@ -296,7 +297,7 @@ class EtherscanProvider:
             )
 
             try:
-                data = response.json()
+                data = parse_json(response)
             except json.JSONDecodeError as e:
                 logger.warning(f"Failed to parse Etherscan withdrawal claimed events: {e}")
                 return []
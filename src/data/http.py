@@ -0,0 +1,104 @@
+"""Shared pooled HTTP client for external API calls."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+import httpx
+import orjson
+
+from ..core.version import __version__
+
+logger = logging.getLogger(__name__)
+
+# Keep-alive pooling so repeated dashboard refreshes reuse sockets
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=15.0,
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+HTTP_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": f"csm-dashboard/{__version__}",
+}
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+_logged_http_version = False
+
+
+async def _log_http_version(response: httpx.Response) -> None:
+    """Log the negotiated protocol once, to confirm HTTP/2 is in use."""
+    global _logged_http_version
+
+    if not _logged_http_version:
+        _logged_http_version = True
+        logger.info(f"Shared HTTP client negotiated {response.http_version} with {response.url.host}")
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient, creating it lazily.
+
+    Pooled connections are bound to the event loop that opened them, so a new
+    client is created when called from a different loop (e.g. successive
+    asyncio.run() calls in the CLI).
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # HTTP/2 multiplexes concurrent requests to the same host over one connection
+        _client = httpx.AsyncClient(
+            http2=True,
+            headers=HTTP_HEADERS,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            event_hooks={"response": [_log_http_version]},
+        )
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (call on application shutdown)."""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
+def loads_json(data: bytes) -> Any:
+    """Decode JSON bytes with orjson.
+
+    orjson silently decodes integers beyond 64 bits as floats, so use
+    loads_json_exact for payloads carrying uint256 amounts. Raises
+    json.JSONDecodeError (orjson's error is a subclass of it).
+    """
+    return orjson.loads(data)
+
+
+def loads_json_exact(data: bytes | str) -> Any:
+    """Decode JSON with the stdlib, keeping integers of any width exact.
+
+    For uint256 share amounts (rewards proofs, IPFS distribution logs, saved
+    operators), which routinely exceed what orjson decodes as an integer.
+    """
+    return json.loads(data)
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (see loads_json).
+
+    Faster than response.json() for API responses whose numbers fit in 64 bits
+    (beacon validator batches, Etherscan, price and APR lookups).
+    """
+    return loads_json(response.content)
+
+
+def parse_json_exact(response: httpx.Response) -> Any:
+    """Decode a JSON response body keeping wide integers exact (see loads_json_exact)."""
+    return loads_json_exact(response.content)
@@ -12,6 +12,7 @@ from pathlib import Path
 import httpx
 
 from ..core.config import get_settings
+from .http import loads_json_exact, parse_json_exact
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +66,7 @@ class IPFSLogProvider:
         cache_path = self._get_cache_path(cid)
         if cache_path.exists():
             try:
-                with open(cache_path) as f:
-                    return json.load(f)
+                return loads_json_exact(cache_path.read_bytes())
             except (json.JSONDecodeError, OSError):
                 # Corrupted cache, remove it
                 cache_path.unlink(missing_ok=True)
@@ -119,7 +119,7 @@ class IPFSLogProvider:
                     response = await client.get(url)
                     if response.status_code == 200:
                         try:
-                            data = response.json()
+                            data = parse_json_exact(response)
                         except json.JSONDecodeError as e:
                             logger.warning(f"Failed to parse IPFS JSON from {gateway}: {e}")
                             continue
@@ -1,14 +1,18 @@
 """Lido protocol API for stETH APR and other metrics."""
 
 import logging
-
-import httpx
+from bisect import bisect_left, bisect_right
 
 from .cache import cached
+from .http import get_client, parse_json
 
 logger = logging.getLogger(__name__)
 
 LIDO_API_BASE = "https://eth-api.lido.fi/v1"
+STETH_APR_URL = f"{LIDO_API_BASE}/protocol/steth/apr/sma"
+
+# Upper bound on memoized APR range averages per historical APR dataset
+_MAX_CACHED_RANGES = 4096
 
 
 class LidoAPIProvider:
@@ -21,22 +25,20 @@ class LidoAPIProvider:
 
         Returns 7-day SMA (simple moving average) APR.
         """
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            try:
-                response = await client.get(
-                    f"{LIDO_API_BASE}/protocol/steth/apr/sma"
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    # Handle case where data["data"] could be explicitly None
-                    data_obj = data.get("data") or {}
-                    return {
-                        "apr": float(data_obj.get("smaApr", 0) or 0),
-                        "timestamp": data_obj.get("timeUnix"),
-                    }
-            except Exception as e:
-                logger.warning(f"Failed to fetch stETH APR from Lido API: {e}")
+        try:
+            client = await get_client()
+            response = await client.get(STETH_APR_URL)
+
+            if response.status_code == 200:
+                data = parse_json(response)
+                # Handle case where data["data"] could be explicitly None
+                data_obj = data.get("data") or {}
+                return {
+                    "apr": float(data_obj.get("smaApr", 0) or 0),
+                    "timestamp": data_obj.get("timeUnix"),
+                }
+        except Exception as e:
+            logger.warning(f"Failed to fetch stETH APR from Lido API: {e}")
 
         return {"apr": None, "timestamp": None}
 
@@ -48,24 +50,11 @@ class LidoAPIProvider:
         if not apr_data:
             return None
 
-        # Find the closest report at or before target_block
-        closest = None
-        for entry in apr_data:
-            try:
-                block = int(entry.get("block", 0))
-            except (ValueError, TypeError):
-                continue
-            if block <= target_block:
-                closest = entry
-            else:
-                break  # apr_data is sorted ascending
-
-        if closest:
-            try:
-                return float(closest.get("apr", 0))
-            except (ValueError, TypeError):
-                return None
-        return None
+        index = _index_apr_data(apr_data)
+        idx = bisect_right(index.blocks, target_block) - 1
+        if idx < 0:
+            return None
+        return index.block_aprs[idx]
 
     def get_average_apr_for_range(
         self, apr_data: list[dict], start_timestamp: int, end_timestamp: int
@@ -86,37 +75,72 @@ class LidoAPIProvider:
         if not apr_data:
             return None
 
-        # Find all APR reports within the time range
-        reports_in_range = []
-        closest_before = None
+        return _index_apr_data(apr_data).average_for_range(start_timestamp, end_timestamp)
+
+
+class _AprIndex:
+    """Parallel sorted key/APR arrays extracted from historical APR data."""
+
+    __slots__ = ("blocks", "block_aprs", "block_times", "time_aprs", "_range_averages")
+
+    def __init__(self, apr_data: list[dict]):
+        self.blocks: list[int] = []
+        self.block_aprs: list[float | None] = []
+        self.block_times: list[int] = []
+        self.time_aprs: list[float | None] = []
+        # Frame ranges repeat across operators, so memoize averages per range
+        self._range_averages: dict[tuple[int, int], float | None] = {}
 
         for entry in apr_data:
             try:
-                block_time = int(entry.get("blockTime", 0))
+                apr = float(entry.get("apr", 0))
             except (ValueError, TypeError):
-                continue
-            if block_time < start_timestamp:
-                closest_before = entry  # Keep track of most recent before range
-            elif block_time <= end_timestamp:
-                reports_in_range.append(entry)
-            else:
-                break  # Past the range, stop searching
-
-        if reports_in_range:
-            # Average all reports within the range
-            valid_aprs = []
-            for r in reports_in_range:
-                try:
-                    valid_aprs.append(float(r.get("apr", 0)))
-                except (ValueError, TypeError):
-                    continue
-            if valid_aprs:
-                return sum(valid_aprs) / len(valid_aprs)
-        elif closest_before:
-            # No reports in range, use the closest one before
+                apr = None
+            try:
+                self.blocks.append(int(entry.get("block", 0)))
+                self.block_aprs.append(apr)
+            except (ValueError, TypeError):
+                pass
             try:
-                return float(closest_before.get("apr", 0))
+                self.block_times.append(int(entry.get("blockTime", 0)))
+                self.time_aprs.append(apr)
             except (ValueError, TypeError):
                 pass
 
-        return None
+    def average_for_range(self, start_timestamp: int, end_timestamp: int) -> float | None:
+        """Average APR of reports within [start, end], or the closest one before."""
+        key = (start_timestamp, end_timestamp)
+        if key in self._range_averages:
+            return self._range_averages[key]
+
+        lo = bisect_left(self.block_times, start_timestamp)
+        hi = bisect_right(self.block_times, end_timestamp, lo=lo)
+
+        result = None
+        if hi > lo:
+            # Average all reports within the range
+            valid_aprs = [apr for apr in self.time_aprs[lo:hi] if apr is not None]
+            if valid_aprs:
+                result = sum(valid_aprs) / len(valid_aprs)
+        elif lo > 0:
+            # No reports in range, use the closest one before
+            result = self.time_aprs[lo - 1]
+
+        if len(self._range_averages) >= _MAX_CACHED_RANGES:
+            self._range_averages.clear()
+        self._range_averages[key] = result
+        return result
+
+
+# Index for the most recently seen apr_data list. get_historical_apr_data() is
+# cached, so the same list object is passed for every frame and operator.
+_apr_index: tuple[list[dict], _AprIndex] | None = None
+
+
+def _index_apr_data(apr_data: list[dict]) -> _AprIndex:
+    """Get the lookup index for apr_data, rebuilding it when the list changes."""
+    global _apr_index
+
+    if _apr_index is None or _apr_index[0] is not apr_data:
+        _apr_index = (apr_data, _AprIndex(apr_data))
+    return _apr_index[1]
@@ -2,10 +2,14 @@
 
 import asyncio
 import logging
+from dataclasses import dataclass
 from decimal import Decimal
-from functools import partial
+from functools import lru_cache, partial
+from operator import itemgetter
 
 from web3 import Web3
+from web3.contract import Contract
+from web3.exceptions import BadResponseFormat, ContractLogicError, Web3RPCError
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +22,7 @@ from ..core.contracts import (
     WITHDRAWAL_QUEUE_ABI,
 )
 from ..core.types import BondSummary, NodeOperator
-from .cache import SimpleCache, cached
+from .cache import _MISSING, SimpleCache, cached
 from .discovered_cids import load_discovered_cids, merge_cid_sources, record_new_cids
 from .etherscan import EtherscanProvider
 from .known_cids import KNOWN_DISTRIBUTION_LOGS
@@ -26,6 +30,103 @@ from .known_cids import KNOWN_DISTRIBUTION_LOGS
 # Manual cache for distribution log history (adaptive TTL)
 _distribution_cache = SimpleCache()
 
+# Deposited signing keys per CSModule address and operator ID. Deposited keys
+# are append-only, so later lookups only fetch keys deposited since the last one.
+# Bounded LRU so lookups of many operators can't grow memory without limit.
+DEPOSITED_KEYS_CACHE_TTL = 86400
+DEPOSITED_KEYS_CACHE_SIZE = 256
+_deposited_keys_cache = SimpleCache(
+    default_ttl=DEPOSITED_KEYS_CACHE_TTL, max_size=DEPOSITED_KEYS_CACHE_SIZE
+)
+
+# Concurrent getSigningKeys calls per operator, so large operators don't fire
+# dozens of RPC requests at once
+SIGNING_KEYS_BATCH_CONCURRENCY = 4
+
+# RPC URLs that rejected a JSON-RPC batch. Providers are built per request, so
+# this is remembered per URL rather than per instance to avoid re-probing.
+_batch_unsupported_rpcs: set[str] = set()
+
+
+def _note_batch_failure(rpc_url: str, error: Exception) -> None:
+    """Remember rpc_url as batch-incapable if error says so.
+
+    An RPC that doesn't do batching answers with a single error object (or
+    something else that isn't a list) instead of one response per call. Any
+    other failure - timeouts, rate limits, dropped connections - only makes
+    the current call fall back; batching is tried again next time.
+    """
+    unsupported = isinstance(error, BadResponseFormat) or (
+        isinstance(error, Web3RPCError) and "batch" in str(error).lower()
+    )
+    if unsupported:
+        logger.debug(f"JSON-RPC batch requests unsupported, using individual calls: {error}")
+        _batch_unsupported_rpcs.add(rpc_url)
+    else:
+        logger.debug(f"JSON-RPC batch request failed, using individual calls this time: {error}")
+
+
+@dataclass(frozen=True, slots=True)
+class OperatorReads:
+    """Per-operator contract reads fetched together by batch_operator_reads()."""
+
+    operator: NodeOperator
+    curve_id: int
+    bond: BondSummary
+    distributed_shares: int
+
+
+@lru_cache(maxsize=8)
+def get_web3(rpc_url: str) -> Web3:
+    """Get the shared Web3 instance for an RPC URL.
+
+    HTTPProvider keeps one requests session per thread, so the instance is
+    safe to use from the asyncio.to_thread() workers.
+    """
+    return Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": 30}))
+
+
+@dataclass(frozen=True, slots=True)
+class _Contracts:
+    """CSM and Lido contract objects bound to one Web3 instance."""
+
+    w3: Web3
+    csmodule: Contract
+    csaccounting: Contract
+    csfeedistributor: Contract
+    steth: Contract
+    withdrawal_queue: Contract
+
+
+@lru_cache(maxsize=8)
+def _get_contracts(rpc_url: str) -> _Contracts:
+    """Build (once per RPC URL) the contract objects OnChainDataProvider uses."""
+    settings = get_settings()
+    w3 = get_web3(rpc_url)
+    return _Contracts(
+        w3=w3,
+        csmodule=w3.eth.contract(
+            address=Web3.to_checksum_address(settings.csmodule_address),
+            abi=CSMODULE_ABI,
+        ),
+        csaccounting=w3.eth.contract(
+            address=Web3.to_checksum_address(settings.csaccounting_address),
+            abi=CSACCOUNTING_ABI,
+        ),
+        csfeedistributor=w3.eth.contract(
+            address=Web3.to_checksum_address(settings.csfeedistributor_address),
+            abi=CSFEEDISTRIBUTOR_ABI,
+        ),
+        steth=w3.eth.contract(
+            address=Web3.to_checksum_address(settings.steth_address),
+            abi=STETH_ABI,
+        ),
+        withdrawal_queue=w3.eth.contract(
+            address=Web3.to_checksum_address(settings.withdrawal_queue_address),
+            abi=WITHDRAWAL_QUEUE_ABI,
+        ),
+    )
+
 
 class OnChainDataProvider:
     """Fetches data from Ethereum contracts."""
@@ -33,34 +134,17 @@ class OnChainDataProvider:
     def __init__(self, rpc_url: str | None = None):
         self.settings = get_settings()
         self._data_warnings: list[str] = []
-        self.w3 = Web3(
-            Web3.HTTPProvider(
-                rpc_url or self.settings.eth_rpc_url,
-                request_kwargs={"timeout": 30},
-            )
-        )
-
-        # Initialize contracts
-        self.csmodule = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csmodule_address),
-            abi=CSMODULE_ABI,
-        )
-        self.csaccounting = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csaccounting_address),
-            abi=CSACCOUNTING_ABI,
-        )
-        self.csfeedistributor = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csfeedistributor_address),
-            abi=CSFEEDISTRIBUTOR_ABI,
-        )
-        self.steth = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.steth_address),
-            abi=STETH_ABI,
-        )
-        self.withdrawal_queue = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.withdrawal_queue_address),
-            abi=WITHDRAWAL_QUEUE_ABI,
-        )
+        self._rpc_url = rpc_url or self.settings.eth_rpc_url
+        # Web3 and contract objects are shared per RPC URL: building the contracts
+        # dominates construction cost, and a shared provider keeps its HTTP
+        # session (and pooled RPC connections) warm across requests
+        contracts = _get_contracts(self._rpc_url)
+        self.w3 = contracts.w3
+        self.csmodule = contracts.csmodule
+        self.csaccounting = contracts.csaccounting
+        self.csfeedistributor = contracts.csfeedistributor
+        self.steth = contracts.steth
+        self.withdrawal_queue = contracts.withdrawal_queue
 
     @cached(ttl=60)
     async def get_node_operators_count(self) -> int:
@@ -75,6 +159,11 @@ class OnChainDataProvider:
         data = await asyncio.to_thread(
             self.csmodule.functions.getNodeOperator(operator_id).call
         )
+        return self._parse_node_operator(operator_id, data)
+
+    @staticmethod
+    def _parse_node_operator(operator_id: int, data: tuple) -> NodeOperator:
+        """Build a NodeOperator from a getNodeOperator() result tuple."""
         return NodeOperator(
             node_operator_id=operator_id,
             total_added_keys=data[0],
@@ -101,7 +190,7 @@ class OnChainDataProvider:
         Tries batch requests first (faster if RPC supports JSON-RPC batching).
         Falls back to sequential calls with rate limiting if batch fails.
         """
-        address = Web3.to_checksum_address(address)
+        address = address.lower()
         total = await self.get_node_operators_count()
 
         # Try batch requests first (not all RPCs support this)
@@ -125,7 +214,7 @@ class OnChainDataProvider:
                         op_id = start + i
                         manager = data[10]
                         reward = data[12]
-                        if manager.lower() == address.lower() or reward.lower() == address.lower():
+                        if manager.lower() == address or reward.lower() == address:
                             return op_id
                     continue  # Batch succeeded, move to next batch
                 except Exception:
@@ -140,7 +229,7 @@ class OnChainDataProvider:
                     )
                     manager = data[10]
                     reward = data[12]
-                    if manager.lower() == address.lower() or reward.lower() == address.lower():
+                    if manager.lower() == address or reward.lower() == address:
                         return op_id
                     # Small delay to avoid rate limiting on public RPCs
                     await asyncio.sleep(0.05)
@@ -237,17 +326,17 @@ class OnChainDataProvider:
         current, required = await asyncio.to_thread(
             self.csaccounting.functions.getBondSummary(operator_id).call
         )
+        return self._build_bond_summary(current, required)
 
-        current_eth = Decimal(current) / Decimal(10**18)
-        required_eth = Decimal(required) / Decimal(10**18)
-        excess_eth = max(Decimal(0), current_eth - required_eth)
-
+    @staticmethod
+    def _build_bond_summary(current: int, required: int) -> BondSummary:
+        """Build a BondSummary from getBondSummary() wei amounts."""
         return BondSummary(
             current_bond_wei=current,
             required_bond_wei=required,
-            current_bond_eth=current_eth,
-            required_bond_eth=required_eth,
-            excess_bond_eth=excess_eth,
+            current_bond_eth=current / 1e18,
+            required_bond_eth=required / 1e18,
+            excess_bond_eth=max(0, current - required) / 1e18,
         )
 
     @cached(ttl=60)
@@ -257,6 +346,53 @@ class OnChainDataProvider:
             self.csfeedistributor.functions.distributedShares(operator_id).call
         )
 
+    @cached(ttl=60)
+    async def batch_operator_reads(self, operator_id: int) -> OperatorReads:
+        """Read operator info, bond curve, bond summary and distributed shares.
+
+        Sends all four eth_calls in a single JSON-RPC batch (one round trip)
+        when the RPC supports it, otherwise falls back to concurrent individual
+        calls. Raises ContractLogicError if the operator doesn't exist.
+        """
+        if self._rpc_url not in _batch_unsupported_rpcs:
+            def run_batch():
+                with self.w3.batch_requests() as batch:
+                    batch.add(self.csmodule.functions.getNodeOperator(operator_id))
+                    batch.add(self.csaccounting.functions.getBondCurveId(operator_id))
+                    batch.add(self.csaccounting.functions.getBondSummary(operator_id))
+                    batch.add(self.csfeedistributor.functions.distributedShares(operator_id))
+                    return batch.execute()
+
+            try:
+                data, curve_id, (current, required), distributed = await asyncio.to_thread(
+                    run_batch
+                )
+                return OperatorReads(
+                    operator=self._parse_node_operator(operator_id, data),
+                    curve_id=curve_id,
+                    bond=self._build_bond_summary(current, required),
+                    distributed_shares=distributed,
+                )
+            except ContractLogicError:
+                # A call reverted (e.g. unknown operator) - retry individually so
+                # get_bond_curve_id() can apply its fallback
+                pass
+            except Exception as e:
+                _note_batch_failure(self._rpc_url, e)
+
+        operator, curve_id, bond, distributed = await asyncio.gather(
+            self.get_node_operator(operator_id),
+            self.get_bond_curve_id(operator_id),
+            self.get_bond_summary(operator_id),
+            self.get_distributed_shares(operator_id),
+        )
+        return OperatorReads(
+            operator=operator,
+            curve_id=curve_id,
+            bond=bond,
+            distributed_shares=distributed,
+        )
+
     @cached(ttl=60)
     async def shares_to_eth(self, shares: int) -> Decimal:
         """Convert stETH shares to ETH value."""
@@ -267,23 +403,62 @@ class OnChainDataProvider:
         )
         return Decimal(eth_wei) / Decimal(10**18)
 
+    @cached(ttl=60)
+    async def shares_to_eth_many(self, shares: tuple[int, ...]) -> tuple[Decimal, ...]:
+        """Convert several stETH share amounts to ETH in one JSON-RPC batch.
+
+        Zero and repeated amounts are not sent. Falls back to concurrent
+        shares_to_eth() calls when the RPC doesn't support batches.
+        """
+        unique = [s for s in dict.fromkeys(shares) if s != 0]
+        wei_by_shares: dict[int, int] = {}
+        if unique and self._rpc_url not in _batch_unsupported_rpcs:
+            def run_batch():
+                with self.w3.batch_requests() as batch:
+                    for amount in unique:
+                        batch.add(self.steth.functions.getPooledEthByShares(amount))
+                    return batch.execute()
+
+            try:
+                wei_by_shares = dict(zip(unique, await asyncio.to_thread(run_batch)))
+            except Exception as e:
+                _note_batch_failure(self._rpc_url, e)
+
+        if len(wei_by_shares) != len(unique):
+            eth_values = await asyncio.gather(*(self.shares_to_eth(s) for s in unique))
+            eth_by_shares = dict(zip(unique, eth_values))
+        else:
+            eth_by_shares = {
+                s: Decimal(wei) / Decimal(10**18) for s, wei in wei_by_shares.items()
+            }
+        return tuple(eth_by_shares.get(s, Decimal(0)) for s in shares)
+
     async def get_signing_keys(
         self, operator_id: int, start: int = 0, count: int = 100
     ) -> list[str]:
         """Get validator pubkeys for an operator.
 
-        Fetches in batches of 100 to avoid RPC limits on large operators.
+        Fetches in batches of 100 to avoid RPC limits on large operators;
+        up to SIGNING_KEYS_BATCH_CONCURRENCY batches are requested at once.
         """
-        keys = []
         batch_size = 100
+        semaphore = asyncio.Semaphore(SIGNING_KEYS_BATCH_CONCURRENCY)
 
-        for batch_start in range(start, start + count, batch_size):
+        async def fetch_batch(batch_start: int) -> bytes:
             batch_count = min(batch_size, start + count - batch_start)
-            keys_bytes = await asyncio.to_thread(
-                self.csmodule.functions.getSigningKeys(
-                    operator_id, batch_start, batch_count
-                ).call
-            )
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.csmodule.functions.getSigningKeys(
+                        operator_id, batch_start, batch_count
+                    ).call
+                )
+
+        batches = await asyncio.gather(
+            *(fetch_batch(b) for b in range(start, start + count, batch_size))
+        )
+
+        keys = []
+        for keys_bytes in batches:
             # Each key is 48 bytes
             for i in range(0, len(keys_bytes), 48):
                 key = "0x" + keys_bytes[i : i + 48].hex()
@@ -291,12 +466,42 @@ class OnChainDataProvider:
 
         return keys
 
+    async def get_deposited_signing_keys(
+        self, operator_id: int, total_deposited_keys: int
+    ) -> list[str]:
+        """Get pubkeys of an operator's deposited validators.
+
+        Deposited keys are never removed or reordered, so keys fetched by an
+        earlier call are reused and only the new tail is requested.
+        """
+        cache_key = f"{self.csmodule.address}:{operator_id}"
+        known = _deposited_keys_cache.get(cache_key)
+        if known is _MISSING:
+            known = []
+        if len(known) >= total_deposited_keys:
+            return known[:total_deposited_keys]
+
+        new_keys = await self.get_signing_keys(
+            operator_id, len(known), total_deposited_keys - len(known)
+        )
+        # Build a new list rather than appending, so a concurrent call that read
+        # the old list never sees it change underneath it
+        keys = known + new_keys
+        _deposited_keys_cache.set(cache_key, keys)
+        return keys
+
     def get_and_clear_warnings(self) -> list[str]:
         """Return accumulated data warnings and clear the list."""
         warnings = self._data_warnings.copy()
         self._data_warnings.clear()
         return warnings
 
+    async def get_tree_cid(self) -> str:
+        """Get the current rewards tree CID from the contract (changes each distribution)."""
+        return await asyncio.to_thread(
+            self.csfeedistributor.functions.treeCid().call
+        )
+
     async def get_current_log_cid(self) -> str:
         """Get the current distribution log CID from the contract."""
         return await asyncio.to_thread(
@@ -521,7 +726,7 @@ class OnChainDataProvider:
 
         # Combine and sort by block number
         all_events = steth_events + unsteth_events
-        all_events.sort(key=lambda x: x["block_number"])
+        all_events.sort(key=itemgetter("block_number"))
 
         return all_events
 
@@ -956,7 +1161,7 @@ class OnChainDataProvider:
                         break
 
         # Sort by block number and enrich with timestamps
-        all_events.sort(key=lambda x: x["block_number"])
+        all_events.sort(key=itemgetter("block_number"))
 
         # Batch-fetch timestamps for unique blocks
         unique_blocks = list({e["block_number"] for e in all_events})
@@ -1,46 +1,69 @@
 """Price fetching from CoinGecko API."""
 
+import asyncio
 import logging
 import time
 
-import httpx
+from .http import get_client, parse_json
 
 logger = logging.getLogger(__name__)
 
+COINGECKO_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+COINGECKO_PRICE_PARAMS = {"ids": "ethereum", "vs_currencies": "usd"}
+
 # Cache ETH price for 5 minutes
-_price_cache: dict = {"eth_usd": None, "timestamp": 0}
 CACHE_TTL = 300  # 5 minutes
 
 
+class _PriceCache:
+    """Cached ETH price with a lock so only one fetch runs per TTL window."""
+
+    def __init__(self):
+        self.value: float | None = None
+        self.timestamp = 0.0
+        self.fetch_count = 0  # Bumped after every fetch attempt, successful or not
+        self.lock = asyncio.Lock()
+
+    def is_fresh(self, now: float) -> bool:
+        return self.value is not None and (now - self.timestamp) < CACHE_TTL
+
+
+_price_cache = _PriceCache()
+
+
 async def get_eth_price() -> float | None:
     """Fetch current ETH price in USD from CoinGecko.
 
     Returns:
         ETH price in USD, or None if fetch fails
     """
-    global _price_cache
-
-    # Check cache
-    now = time.time()
-    if _price_cache["eth_usd"] is not None and (now - _price_cache["timestamp"]) < CACHE_TTL:
-        return _price_cache["eth_usd"]
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": "ethereum", "vs_currencies": "usd"},
-            )
+    # Fast path: fresh cache, no lock needed
+    if _price_cache.is_fresh(time.time()):
+        return _price_cache.value
+
+    fetch_count = _price_cache.fetch_count
+    async with _price_cache.lock:
+        # Another coroutine fetched while we waited — share its result, even
+        # if it failed, rather than queueing up repeated requests
+        if _price_cache.fetch_count != fetch_count:
+            return _price_cache.value
+
+        now = time.time()
+        try:
+            client = await get_client()
+            response = await client.get(COINGECKO_PRICE_URL, params=COINGECKO_PRICE_PARAMS)
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 price = data.get("ethereum", {}).get("usd")
                 if price:
-                    _price_cache["eth_usd"] = float(price)
-                    _price_cache["timestamp"] = now
+                    _price_cache.value = float(price)
+                    _price_cache.timestamp = now
                     logger.info(f"Fetched ETH price: ${price}")
-                    return float(price)
-    except Exception as e:
-        logger.warning(f"Failed to fetch ETH price: {e}")
+                    return _price_cache.value
+        except Exception as e:
+            logger.warning(f"Failed to fetch ETH price: {e}")
+        finally:
+            _price_cache.fetch_count += 1
 
-    # Return cached value if available (even if stale)
-    return _price_cache["eth_usd"]
+        # Return cached value if available (even if stale)
+        return _price_cache.value
@@ -8,6 +8,7 @@ import httpx
 from ..core.config import get_settings
 from ..core.types import RewardsInfo
 from .cache import cached
+from .http import get_client, parse_json_exact
 
 logger = logging.getLogger(__name__)
 
@@ -30,20 +31,36 @@ class RewardsTreeProvider:
             ...
         }
         """
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            try:
-                response = await client.get(self.settings.rewards_proofs_url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.warning(f"Failed to fetch rewards tree: HTTP {e.response.status_code}")
-                return {}
-            except httpx.RequestError as e:
-                logger.warning(f"Failed to fetch rewards tree: {e}")
-                return {}
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse rewards tree JSON: {e}")
-                return {}
+        client = await get_client()
+        try:
+            # Large file, so allow longer than the shared client's default timeout
+            response = await client.get(self.settings.rewards_proofs_url, timeout=30.0)
+            response.raise_for_status()
+            return parse_json_exact(response)
+        except httpx.HTTPStatusError as e:
+            logger.warning(f"Failed to fetch rewards tree: HTTP {e.response.status_code}")
+            return {}
+        except httpx.RequestError as e:
+            logger.warning(f"Failed to fetch rewards tree: {e}")
+            return {}
+        except json.JSONDecodeError as e:
+            logger.warning(f"Failed to parse rewards tree JSON: {e}")
+            return {}
+
+    async def refresh(self) -> dict:
+        """Re-download the rewards tree, replacing the cached copy.
+
+        Returns the downloaded tree ({} if the download failed). The published
+        proofs file can lag the on-chain update, so callers should compare it
+        against the tree they last handled rather than the cached copy, which a
+        request may already have replaced with the new tree.
+        """
+        self.fetch_rewards_data.invalidate(self)
+        data = await self.fetch_rewards_data()
+        if not data:
+            # Download failed - don't keep the empty result cached for an hour
+            self.fetch_rewards_data.invalidate(self)
+        return data
 
     async def get_operator_rewards(self, operator_id: int) -> RewardsInfo | None:
         """Get rewards info for a specific operator."""
@@ -55,8 +72,8 @@ class RewardsTreeProvider:
 
         entry = data[key]
         return RewardsInfo(
-            cumulative_fee_shares=entry["cumulativeFeeShares"],
-            proof=entry["proof"],
+            cumulative_fee_shares=int(entry["cumulativeFeeShares"]),
+            proof=list(entry["proof"]),
         )
 
     async def get_all_operators_with_rewards(self) -> list[int]:
@@ -6,13 +6,17 @@ import logging
 import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import httpx
 from web3 import Web3
+from web3.contract import Contract
 
 from ..core.config import get_settings
 from .cache import cached
+from .http import loads_json, parse_json
+from .onchain import get_web3
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +45,15 @@ def is_valid_validator_pubkey(pubkey: str) -> bool:
     return bool(VALIDATOR_PUBKEY_RE.fullmatch(pubkey))
 
 
+@lru_cache(maxsize=8)
+def _get_csstrikes(rpc_url: str, address: str) -> Contract:
+    """Build (once per RPC URL and address) the CSStrikes contract object."""
+    return get_web3(rpc_url).eth.contract(
+        address=Web3.to_checksum_address(address),
+        abi=StrikesProvider.CSSTRIKES_ABI,
+    )
+
+
 @dataclass
 class ValidatorStrikes:
     """Strike information for a single validator."""
@@ -73,17 +86,15 @@ class StrikesProvider:
         self.settings = get_settings()
         # Use configurable gateways from settings (comma-separated)
         self.gateways = [g.strip() for g in self.settings.ipfs_gateways.split(",") if g.strip()]
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url or self.settings.eth_rpc_url))
+        rpc_url = rpc_url or self.settings.eth_rpc_url
+        self.w3 = get_web3(rpc_url)
         self.cache_dir = cache_dir or Path.home() / ".cache" / "csm-dashboard" / "strikes"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._last_request_time = 0.0
         self._rate_limit_lock = asyncio.Lock()
 
-        # Initialize CSStrikes contract
-        self.csstrikes = self.w3.eth.contract(
-            address=Web3.to_checksum_address(self.settings.csstrikes_address),
-            abi=self.CSSTRIKES_ABI,
-        )
+        # CSStrikes contract, shared across the per-request providers
+        self.csstrikes = _get_csstrikes(rpc_url, self.settings.csstrikes_address)
 
     def _get_cache_path(self, cid: str) -> Path:
         """Get the cache file path for a CID."""
@@ -94,8 +105,7 @@ class StrikesProvider:
         cache_path = self._get_cache_path(cid)
         if cache_path.exists():
             try:
-                with open(cache_path) as f:
-                    return json.load(f)
+                return loads_json(cache_path.read_bytes())
             except (json.JSONDecodeError, OSError):
                 cache_path.unlink(missing_ok=True)
         return None
@@ -149,7 +159,7 @@ class StrikesProvider:
                     response = await client.get(url)
                     if response.status_code == 200:
                         try:
-                            data = response.json()
+                            data = parse_json(response)
                         except json.JSONDecodeError as e:
                             logger.warning(f"Failed to parse strikes tree JSON from {gateway}: {e}")
                             continue
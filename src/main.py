@@ -27,22 +27,39 @@ def serve(
     host: str = typer.Option("127.0.0.1", help="Host to bind to"),
     port: int = typer.Option(8080, help="Port to bind to"),
     reload: bool = typer.Option(False, "--reload", help="Enable auto-reload for development"),
+    workers: int = typer.Option(
+        1, help="Worker processes (each keeps its own in-memory cache)"
+    ),
+    access_log: bool = typer.Option(
+        False, "--access-log/--no-access-log", help="Enable uvicorn's per-request access log"
+    ),
 ):
     """Start the web dashboard server."""
     import uvicorn
 
-    from .web.app import create_app
-
     logger = logging.getLogger(__name__)
     logger.info(f"Starting CSM Dashboard server on {host}:{port}")
 
-    web_app = create_app()
+    # uvicorn's "auto" loop and HTTP implementations pick uvloop and httptools
+    # when they are installed (pip install "csm-dashboard[speed]"). Requests are
+    # already logged by the app's own middleware, so the access log is off by default.
+    if reload or workers > 1:
+        # Reload and multiple workers need an import string to re-create the app
+        target = "src.web.app:create_app"
+    else:
+        from .web.app import create_app
+
+        target = create_app()
     uvicorn.run(
-        web_app if not reload else "src.web.app:create_app",
+        target,
         host=host,
         port=port,
         reload=reload,
-        factory=reload,
+        workers=workers,
+        factory=isinstance(target, str),
+        loop="auto",
+        http="auto",
+        access_log=access_log,
         log_level="info",
     )
 
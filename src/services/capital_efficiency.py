@@ -3,7 +3,26 @@
 Pure functions - no async, no RPC calls. Easy to test.
 """
 
+import math
 from datetime import datetime, timezone
+from functools import lru_cache
+from heapq import merge
+from operator import itemgetter
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(ts: str) -> datetime | None:
+    """Parse an ISO timestamp, returning None if empty or invalid.
+
+    Cached because the same bond event timestamps are parsed by both
+    calculate_capital_efficiency() and _build_xirr_cash_flows().
+    """
+    if not ts:
+        return None
+    try:
+        return datetime.fromisoformat(ts)
+    except (ValueError, TypeError):
+        return None
 
 
 def calculate_capital_efficiency(
@@ -32,32 +51,46 @@ def calculate_capital_efficiency(
     Returns:
         Dict with capital efficiency fields (matching CapitalEfficiency model)
     """
-    deposits = [e for e in bond_events if e["flow_direction"] == 1]
-    if not deposits:
-        return {}
-
     now = datetime.now(timezone.utc)
-
-    # First deposit date
-    first_deposit_ts = deposits[0].get("timestamp", "")
-    if not first_deposit_ts:
-        return {}
-    try:
-        first_deposit_dt = datetime.fromisoformat(first_deposit_ts)
-    except (ValueError, TypeError):
+    now_ts = now.timestamp()
+
+    # Single pass over events: net deposits (deposits - claims - burns), total
+    # capital deployed, and each deposit's timestamp parsed once for weighting
+    first_deposit_ts: str | None = None
+    first_deposit_dt: datetime | None = None
+    signed_amounts: list[float] = []
+    deposit_amounts: list[float] = []
+    dated_deposits: list[tuple[float, float]] = []  # (unix seconds, amount_eth)
+    for e in bond_events:
+        amount = e["amount_eth"]
+        signed_amounts.append(amount * e["flow_direction"])
+        if e["flow_direction"] != 1:
+            continue
+        deposit_amounts.append(amount)
+        dep_ts = e.get("timestamp", "")
+        dep_dt = _parse_timestamp(dep_ts)
+        if first_deposit_ts is None:
+            first_deposit_ts = dep_ts
+            first_deposit_dt = dep_dt
+        if dep_dt is not None:
+            dated_deposits.append((dep_dt.timestamp(), amount))
+
+    # No deposits, or the first deposit has no usable date
+    if first_deposit_dt is None:
         return {}
 
-    total_days = (now - first_deposit_dt).total_seconds() / 86400
+    total_seconds = now_ts - first_deposit_dt.timestamp()
+    total_days = total_seconds / 86400
     if total_days < 1:
         return {}
 
-    # Sum of all deposits
-    total_capital_deployed = sum(e["amount_eth"] for e in deposits)
+    # Sum of all deposits; fsum avoids rounding drift over long event histories
+    total_capital_deployed = math.fsum(deposit_amounts)
     if total_capital_deployed <= 0:
         return {}
 
     # Net deposits (deposits - claims - burns)
-    net_deposits = sum(e["amount_eth"] * e["flow_direction"] for e in bond_events)
+    net_deposits = math.fsum(signed_amounts)
 
     # Bond appreciation = current bond value - net deposits
     bond_appreciation = current_bond_eth - net_deposits
@@ -67,17 +100,9 @@ def calculate_capital_efficiency(
 
     # Time-weighted average capital for annualization
     # For each deposit, calculate: amount * (days_since_deposit / total_days)
-    time_weighted_capital = 0.0
-    for dep in deposits:
-        dep_ts = dep.get("timestamp", "")
-        if not dep_ts:
-            continue
-        try:
-            dep_dt = datetime.fromisoformat(dep_ts)
-        except (ValueError, TypeError):
-            continue
-        days_deployed = (now - dep_dt).total_seconds() / 86400
-        time_weighted_capital += dep["amount_eth"] * (days_deployed / total_days)
+    time_weighted_capital = math.fsum(
+        [amount * ((now_ts - dep_ts) / total_seconds) for dep_ts, amount in dated_deposits]
+    )
 
     if time_weighted_capital <= 0:
         time_weighted_capital = total_capital_deployed
@@ -89,7 +114,7 @@ def calculate_capital_efficiency(
     steth_benchmark = None
     if historical_apr_data and get_average_apr_for_range:
         start_ts = int(first_deposit_dt.timestamp())
-        end_ts = int(now.timestamp())
+        end_ts = int(now_ts)
         avg_apr = get_average_apr_for_range(historical_apr_data, start_ts, end_ts)
         if avg_apr is not None:
             steth_benchmark = avg_apr
@@ -137,51 +162,54 @@ def _build_xirr_cash_flows(
     implicitly reflected in the lower terminal_value_eth. This is a simplification that
     ignores the timing of burns; for operators with infrequent/small burns the impact is
     negligible.
+
+    Both bond_events (sorted by block) and distribution_flows (sorted by frame) must
+    already be in chronological order; they are merged rather than re-sorted.
     """
-    cash_flows = []
+    has_negative = False
+    has_positive = False
 
     # Bond events -> deposits are negative, claims are positive
     _CLAIM_TYPES = {"claim_steth", "claim_unsteth", "claim_wsteth"}
+    bond_flows = []
     for e in bond_events:
-        ts = e.get("timestamp", "")
-        if not ts:
-            continue
-        try:
-            dt = datetime.fromisoformat(ts)
-        except (ValueError, TypeError):
+        dt = _parse_timestamp(e.get("timestamp", ""))
+        if dt is None:
             continue
         if e["flow_direction"] == 1:
             # Deposit = capital deployed (negative cash flow)
-            cash_flows.append((dt, -e["amount_eth"]))
+            bond_flows.append((dt, -e["amount_eth"]))
+            has_negative = has_negative or e["amount_eth"] > 0
         elif e["event_type"] in _CLAIM_TYPES:
             # Bond claim = capital returned (positive cash flow)
-            cash_flows.append((dt, e["amount_eth"]))
+            bond_flows.append((dt, e["amount_eth"]))
+            has_positive = has_positive or e["amount_eth"] > 0
         # Burns/penalties skipped — see docstring for why
 
     # Reward distributions -> positive cash flows
+    dist_flows = []
     for flow in distribution_flows:
         dt = flow.get("date")
         amount = flow.get("amount_eth", 0)
         if dt and amount > 0:
             if isinstance(dt, str):
-                try:
-                    dt = datetime.fromisoformat(dt)
-                except (ValueError, TypeError):
+                dt = _parse_timestamp(dt)
+                if dt is None:
                     continue
-            cash_flows.append((dt, amount))
+            dist_flows.append((dt, amount))
+            has_positive = True
 
     # Terminal value: bond + unclaimed rewards at today's date
-    now = datetime.now(timezone.utc)
     if terminal_value_eth > 0:
-        cash_flows.append((now, terminal_value_eth))
+        has_positive = True
 
     # Need at least one negative and one positive flow
-    has_negative = any(cf[1] < 0 for cf in cash_flows)
-    has_positive = any(cf[1] > 0 for cf in cash_flows)
     if not (has_negative and has_positive):
         return []
 
-    cash_flows.sort(key=lambda x: x[0])
+    cash_flows = list(merge(bond_flows, dist_flows, key=itemgetter(0)))
+    if terminal_value_eth > 0:
+        cash_flows.append((datetime.now(timezone.utc), terminal_value_eth))
     return cash_flows
 
 
@@ -193,42 +221,78 @@ def _newton_xirr(
     max_iter: int,
 ) -> float | None:
     """Single Newton-Raphson attempt for XIRR. Returns rate (decimal) or None."""
+    # Pair the flows once rather than re-zipping on every iteration
+    flows = list(zip(amounts, day_fracs))
     rate = guess
     for _ in range(max_iter):
         npv = 0.0
-        dnpv = 0.0
-        for amt, t in zip(amounts, day_fracs):
-            denom = (1 + rate) ** t
+        weighted_pv = 0.0
+        base = 1 + rate
+        for amt, t in flows:
+            # One power per flow: d/dr of amt/(1+r)^t is -t*amt/((1+r)^t * (1+r)),
+            # so the derivative is -sum(t * pv) / (1+r), divided once below.
+            # The t == 0 flow contributes zero to the derivative on its own.
+            denom = base ** t
             if denom == 0:
                 return None
-            npv += amt / denom
-            if t != 0:
-                dnpv -= t * amt / ((1 + rate) ** (t + 1))
+            pv = amt / denom
+            npv += pv
+            weighted_pv += t * pv
+        dnpv = -weighted_pv / base
 
         if abs(dnpv) < 1e-12:
             return None
 
-        new_rate = rate - npv / dnpv
+        delta = npv / dnpv
+
+        # Converged when the Newton step is tiny AND NPV is near zero
+        if abs(delta) < tol and abs(npv) < 1e-8:
+            return rate - delta
 
-        # Clamp to avoid divergence
-        if new_rate < -0.99:
-            new_rate = -0.99
+        new_rate = rate - delta
+
+        # A step past -100% would make (1+r)^t undefined: move halfway towards
+        # -1 instead, so large losses still converge rather than sticking at a
+        # fixed clamp. Cap the other side to avoid divergence.
+        if new_rate <= -1.0:
+            new_rate = (rate - 1.0) / 2
         if new_rate > 10:
             new_rate = 10
 
-        # Converged when rate barely changes AND NPV is near zero
-        if abs(new_rate - rate) < tol and abs(npv) < 1e-8:
-            return new_rate
-
         rate = new_rate
 
     return None
 
 
+# 365.25-day years, as a multiplier for elapsed Unix seconds
+_YEARS_PER_SECOND = 1 / (365.25 * 86400)
+
+# Rates probed by _find_initial_guess(), in increasing order
+_GUESS_GRID = (-0.9, -0.5, 0.0, 0.1, 0.5, 1.0)
+
+
+def _find_initial_guess(amounts: list[float], day_fracs: list[float]) -> float | None:
+    """Seed Newton's method from where NPV changes sign on a coarse rate grid.
+
+    Returns the point where the straight line between the first bracketing
+    pair crosses zero (a single regula falsi step, closer to the root than the
+    midpoint), or None if NPV has the same sign at every probed rate.
+    """
+    flows = list(zip(amounts, day_fracs))
+    prev_rate = prev_npv = None
+    for rate in _GUESS_GRID:
+        base = 1 + rate
+        npv = sum(amt / base ** t for amt, t in flows)
+        if prev_npv is not None and (npv > 0) != (prev_npv > 0):
+            return prev_rate + (rate - prev_rate) * prev_npv / (prev_npv - npv)
+        prev_rate, prev_npv = rate, npv
+    return None
+
+
 def calculate_xirr(
     cash_flows: list[tuple[datetime, float]],
     tol: float = 1e-6,
-    max_iter: int = 100,
+    max_iter: int = 50,
 ) -> float | None:
     """Calculate XIRR using Newton's method with multiple initial guesses.
 
@@ -240,19 +304,42 @@ def calculate_xirr(
     Returns:
         XIRR as percentage (e.g., 8.5 for 8.5%), or None if doesn't converge.
         Uses 365.25 days/year (vs Excel's 365), so results may differ by ~0.07%/year.
+        Cash flows that never change sign have no IRR and return None at once.
     """
     if not cash_flows or len(cash_flows) < 2:
         return None
 
-    dates, amounts = zip(*cash_flows)
-    d0 = dates[0]
-    # Year fractions from the first cash flow date (365.25 accounts for leap years;
-    # Excel XIRR uses 365, so results may differ slightly from spreadsheet validation)
-    day_fracs = [(d - d0).total_seconds() / (365.25 * 86400) for d in dates]
+    # Split amounts and year fractions from the first cash flow date in one pass
+    # (365.25 accounts for leap years; Excel XIRR uses 365, so results may differ
+    # slightly from spreadsheet validation)
+    # Subtract Unix timestamps as plain floats rather than building a timedelta
+    # per flow (the dates are timezone-aware, so this is exact)
+    t0 = cash_flows[0][0].timestamp()
+    n = len(cash_flows)
+    amounts = [0.0] * n
+    day_fracs = [0.0] * n
+    has_negative = has_positive = False
+    for i, (d, a) in enumerate(cash_flows):
+        amounts[i] = a
+        day_fracs[i] = (d.timestamp() - t0) * _YEARS_PER_SECOND
+        if a < 0:
+            has_negative = True
+        elif a > 0:
+            has_positive = True
+
+    # Without both an outflow and an inflow NPV has no root; don't spend every
+    # initial guess's iterations finding that out
+    if not (has_negative and has_positive):
+        return None
 
     # Try multiple starting points — Newton's method for XIRR can diverge if the
-    # initial guess is far from the true solution.
-    for guess in (0.1, 0.0, 0.5, -0.5, 2.0):
+    # initial guess is far from the true solution. A seed bracketed by an NPV
+    # sign change goes first, which usually converges in fewer iterations.
+    guesses = (0.1, 0.0, 0.5, -0.5, 2.0)
+    seed = _find_initial_guess(amounts, day_fracs)
+    if seed is not None:
+        guesses = (seed, *guesses)
+    for guess in guesses:
         result = _newton_xirr(amounts, day_fracs, guess, tol, max_iter)
         if result is not None:
             return float(result * 100)  # Convert to percentage
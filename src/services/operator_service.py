@@ -1,9 +1,12 @@
 """Main service for computing operator rewards."""
 
+import asyncio
 from datetime import datetime, timezone
 import logging
 from decimal import Decimal
 
+from web3.exceptions import ContractLogicError
+
 logger = logging.getLogger(__name__)
 
 from ..core.types import (
@@ -20,19 +23,89 @@ from .capital_efficiency import calculate_capital_efficiency
 from ..data.beacon import (
     BeaconDataProvider,
     ValidatorInfo,
-    aggregate_validator_status,
-    calculate_avg_effectiveness,
+    ValidatorStatus,
     count_at_risk_validators,
     count_slashed_validators,
     epoch_to_datetime,
     get_earliest_activation,
+    summarize_validators,
 )
+from ..data.cache import _MISSING, SimpleCache, cached, coalesced
 from ..data.ipfs_logs import BEACON_GENESIS, IPFSLogProvider, epoch_to_datetime as epoch_to_dt
 from ..data.lido_api import LidoAPIProvider
 from ..data.onchain import OnChainDataProvider
 from ..data.rewards_tree import RewardsTreeProvider
 from ..data.strikes import StrikesProvider
 
+# Default cap on concurrent operator lookups in get_operators_batch()
+DEFAULT_BATCH_CONCURRENCY = 20
+
+# Beacon details of fully exited operators whose validators are all withdrawn.
+# That state is final, so it is kept far longer than the per-epoch validator cache.
+WITHDRAWN_VALIDATORS_CACHE_TTL = 86400
+_withdrawn_validators_cache = SimpleCache(default_ttl=WITHDRAWN_VALIDATORS_CACHE_TTL)
+
+# Minimum bond for APY calculations: 0.01 ETH (dust amounts produce nonsensical APY)
+MIN_BOND_ETH = 0.01
+
+
+# APY metrics only change once per oracle frame; cache them for an hour
+APY_METRICS_CACHE_TTL = 3600
+
+# Part of the APY metrics cache key: bumping the global epoch (new rewards
+# tree) or an operator's epoch (explicit refresh) retires the cached entries
+_apy_metrics_epoch = 0
+_apy_metrics_operator_epochs: dict[int, int] = {}
+
+
+def invalidate_apy_metrics(operator_id: int | None = None) -> None:
+    """Drop cached APY metrics for one operator, or for all operators if None."""
+    global _apy_metrics_epoch
+    if operator_id is None:
+        _apy_metrics_epoch += 1
+        _apy_metrics_operator_epochs.clear()
+    else:
+        _apy_metrics_operator_epochs[operator_id] = (
+            _apy_metrics_operator_epochs.get(operator_id, 0) + 1
+        )
+
+
+def _operator_lookup_key(
+    self,
+    operator_id: int,
+    include_validators: bool = False,
+    include_history: bool = False,
+    include_withdrawals: bool = False,
+) -> tuple:
+    """Coalescing key for get_operator_by_id(), the same for positional and default flags."""
+    return (operator_id, include_validators, include_history, include_withdrawals)
+
+
+def _apy_metrics_cache_key(
+    self,
+    operator_id: int,
+    bond_eth: float,
+    curve_id: int = 0,
+    include_history: bool = False,
+    distributed_shares: int = 0,
+    unclaimed_shares: int = 0,
+) -> tuple:
+    """Cache key for _cached_apy_metrics().
+
+    The bond is bucketed to 0.01 ETH so stETH rebases between refreshes
+    don't invalidate the cached result.
+    """
+    return (
+        _apy_metrics_epoch,
+        _apy_metrics_operator_epochs.get(operator_id, 0),
+        operator_id,
+        int(bond_eth * 100),
+        curve_id,
+        include_history,
+        distributed_shares,
+        unclaimed_shares,
+    )
+
 
 def allocate_claimed_shares_to_frames(
     frame_shares: list[int],
@@ -80,42 +153,52 @@ class OperatorService:
 
         return await self.get_operator_by_id(operator_id, include_validators, include_history, include_withdrawals)
 
+    @coalesced(key=_operator_lookup_key)
     async def get_operator_by_id(
         self, operator_id: int, include_validators: bool = False, include_history: bool = False, include_withdrawals: bool = False
     ) -> OperatorRewards | None:
-        """Get complete rewards data for an operator ID."""
-        from web3.exceptions import ContractLogicError
+        """Get complete rewards data for an operator ID.
 
-        # Step 1: Get operator info
-        try:
-            operator = await self.onchain.get_node_operator(operator_id)
-        except ContractLogicError:
+        With include_validators, operators whose deposited keys have all exited
+        skip the beacon chain lookup; their validators are reported as exited
+        from the on-chain key counts.
+
+        Concurrent lookups of the same operator with the same options share a
+        single fetch, across the per-request service instances.
+        """
+        # Steps 1-5: Operator info, bond curve, bond summary and already
+        # distributed (claimed) shares come from one batched RPC round trip;
+        # the merkle tree rewards are fetched concurrently alongside it
+        reads, rewards_info = await asyncio.gather(
+            self.onchain.batch_operator_reads(operator_id),
+            self.rewards_tree.get_operator_rewards(operator_id),
+            return_exceptions=True,
+        )
+        if isinstance(reads, ContractLogicError):
             # Operator ID doesn't exist on-chain
             return None
-
-        # Step 2: Get bond curve and operator type
-        curve_id = await self.onchain.get_bond_curve_id(operator_id)
+        for result in (reads, rewards_info):
+            if isinstance(result, BaseException):
+                raise result
+        operator = reads.operator
+        curve_id = reads.curve_id
+        bond = reads.bond
+        distributed = reads.distributed_shares
         operator_type = self.onchain.get_operator_type_name(curve_id)
 
-        # Step 3: Get bond summary
-        bond = await self.onchain.get_bond_summary(operator_id)
-
-        # Step 4: Get rewards from merkle tree
-        rewards_info = await self.rewards_tree.get_operator_rewards(operator_id)
-
-        # Step 5: Get already distributed (claimed) shares
-        distributed = await self.onchain.get_distributed_shares(operator_id)
-
         # Step 6: Calculate unclaimed
         cumulative_shares = (
             rewards_info.cumulative_fee_shares if rewards_info else 0
         )
-        unclaimed_shares = max(0, cumulative_shares - distributed)
+        unclaimed_shares = cumulative_shares - distributed if cumulative_shares > distributed else 0
 
-        # Step 7: Convert shares to ETH
-        unclaimed_eth = await self.onchain.shares_to_eth(unclaimed_shares)
-        cumulative_eth = await self.onchain.shares_to_eth(cumulative_shares)
-        distributed_eth = await self.onchain.shares_to_eth(distributed)
+        # Step 7: Convert shares to ETH (float, for display) in one RPC batch
+        unclaimed_eth, cumulative_eth, distributed_eth = (
+            float(eth)
+            for eth in await self.onchain.shares_to_eth_many(
+                (unclaimed_shares, cumulative_shares, distributed)
+            )
+        )
 
         # Step 8: Calculate total claimable
         total_claimable = bond.excess_bond_eth + unclaimed_eth
@@ -130,25 +213,32 @@ class OperatorService:
         withdrawals: list[WithdrawalEvent] | None = None
 
         if include_validators and operator.total_deposited_keys > 0:
-            # Get validator pubkeys
-            pubkeys = await self.onchain.get_signing_keys(
-                operator_id, 0, operator.total_deposited_keys
-            )
-            # Fetch validator status from beacon chain
-            validator_details = await self.beacon.get_validators_by_pubkeys(pubkeys)
-            validators_by_status = aggregate_validator_status(validator_details)
-            avg_effectiveness = calculate_avg_effectiveness(validator_details)
-            active_since = get_earliest_activation(validator_details)
+            # Fully exited operators' beacon state stops changing once every
+            # validator is withdrawn, so theirs can be served from a long-lived cache
+            if operator.total_deposited_keys > operator.total_exited_keys:
+                fetch_validators = self._get_validator_details(
+                    operator_id, operator.total_deposited_keys
+                )
+            else:
+                fetch_validators = self._get_exited_validator_details(
+                    operator_id, operator.total_deposited_keys
+                )
 
-            # Step 10: Calculate APY metrics (using historical IPFS data)
-            apy_metrics = await self.calculate_apy_metrics(
-                operator_id=operator_id,
-                bond_eth=bond.current_bond_eth,
-                curve_id=curve_id,
-                include_history=include_history,
-                distributed_shares=distributed,
-                unclaimed_shares=unclaimed_shares,
+            # Step 10: Validator status (beacon chain) and APY metrics (historical
+            # IPFS data) don't depend on each other - run them concurrently
+            validator_details, apy_metrics = await asyncio.gather(
+                fetch_validators,
+                self.calculate_apy_metrics(
+                    operator_id=operator_id,
+                    bond_eth=bond.current_bond_eth,
+                    curve_id=curve_id,
+                    include_history=include_history,
+                    distributed_shares=distributed,
+                    unclaimed_shares=unclaimed_shares,
+                ),
             )
+            validators_by_status, avg_effectiveness = summarize_validators(validator_details)
+            active_since = get_earliest_activation(validator_details)
 
             # Step 11: Calculate health status
             health_status = await self.calculate_health_status(
@@ -166,7 +256,8 @@ class OperatorService:
         # Collect any data quality warnings from the on-chain provider
         data_warnings = self.onchain.get_and_clear_warnings()
 
-        return OperatorRewards(
+        # trusted: every field was built above from decoded on-chain data
+        return OperatorRewards.model_construct(
             node_operator_id=operator_id,
             manager_address=operator.manager_address,
             reward_address=operator.reward_address,
@@ -195,6 +286,58 @@ class OperatorService:
             data_warnings=data_warnings,
         )
 
+    async def get_operators_batch(
+        self,
+        operator_ids: list[int],
+        include_validators: bool = False,
+        include_history: bool = False,
+        include_withdrawals: bool = False,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> list[OperatorRewards | None]:
+        """Get rewards data for many operators concurrently.
+
+        At most `concurrency` lookups run at once so the RPC provider isn't
+        overwhelmed. Results are returned in the same order as operator_ids;
+        an operator that doesn't exist or fails to load yields None.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(operator_id: int) -> OperatorRewards | None:
+            async with semaphore:
+                try:
+                    return await self.get_operator_by_id(
+                        operator_id, include_validators, include_history, include_withdrawals
+                    )
+                except Exception as e:
+                    logger.warning(f"Failed to fetch operator {operator_id}: {e}")
+                    return None
+
+        return await asyncio.gather(*(fetch_one(op_id) for op_id in operator_ids))
+
+    async def _get_validator_details(
+        self, operator_id: int, total_deposited_keys: int
+    ) -> list[ValidatorInfo]:
+        """Fetch beacon chain status for all of an operator's deposited keys."""
+        pubkeys = await self.onchain.get_deposited_signing_keys(operator_id, total_deposited_keys)
+        return await self.beacon.get_validators_by_pubkeys(pubkeys)
+
+    async def _get_exited_validator_details(
+        self, operator_id: int, total_deposited_keys: int
+    ) -> list[ValidatorInfo]:
+        """Beacon status for an operator whose deposited keys have all exited.
+
+        Once every validator reports withdrawal_done nothing about them can
+        change, so the result is kept for a day instead of re-fetched each epoch.
+        """
+        cache_key = f"{operator_id}:{total_deposited_keys}"
+        details = _withdrawn_validators_cache.get(cache_key)
+        if details is not _MISSING:
+            return details
+        details = await self._get_validator_details(operator_id, total_deposited_keys)
+        if details and all(v.status is ValidatorStatus.WITHDRAWAL_DONE for v in details):
+            _withdrawn_validators_cache.set(cache_key, details)
+        return details
+
     async def get_all_operators_with_rewards(self) -> list[int]:
         """Get list of all operator IDs that have rewards in the tree."""
         return await self.rewards_tree.get_all_operators_with_rewards()
@@ -202,7 +345,51 @@ class OperatorService:
     async def calculate_apy_metrics(
         self,
         operator_id: int,
-        bond_eth: Decimal,
+        bond_eth: float,
+        curve_id: int = 0,
+        include_history: bool = False,
+        distributed_shares: int = 0,
+        unclaimed_shares: int = 0,
+    ) -> APYMetrics:
+        """Calculate APY metrics for an operator (see _compute_apy_metrics).
+
+        Results are cached for an hour together with the data warnings raised
+        while computing them; the warnings are re-emitted on every call so a
+        cached, partially degraded result is still flagged in the response.
+        """
+        apy_metrics, warnings = await self._cached_apy_metrics(
+            operator_id, bond_eth, curve_id, include_history, distributed_shares, unclaimed_shares
+        )
+        self.onchain._data_warnings.extend(warnings)
+        return apy_metrics
+
+    @cached(ttl=APY_METRICS_CACHE_TTL, key=_apy_metrics_cache_key)
+    async def _cached_apy_metrics(
+        self,
+        operator_id: int,
+        bond_eth: float,
+        curve_id: int,
+        include_history: bool,
+        distributed_shares: int,
+        unclaimed_shares: int,
+    ) -> tuple[APYMetrics, list[str]]:
+        """Compute APY metrics, returning them with the warnings they raised.
+
+        The warnings are moved off the provider so calculate_apy_metrics() can
+        re-emit them for this and every later (cached or coalesced) caller.
+        """
+        start = len(self.onchain._data_warnings)
+        apy_metrics = await self._compute_apy_metrics(
+            operator_id, bond_eth, curve_id, include_history, distributed_shares, unclaimed_shares
+        )
+        warnings = self.onchain._data_warnings[start:]
+        del self.onchain._data_warnings[start:]
+        return apy_metrics, warnings
+
+    async def _compute_apy_metrics(
+        self,
+        operator_id: int,
+        bond_eth: float,
         curve_id: int = 0,
         include_history: bool = False,
         distributed_shares: int = 0,
@@ -221,109 +408,52 @@ class OperatorService:
             include_history: If True, populate the frames list with all historical data
                             and calculate accurate per-frame lifetime APY
         """
-        historical_reward_apy_28d = None
+        if bond_eth == 0 and unclaimed_shares == 0:
+            # Never bonded and nothing to claim: there is no APY to show,
+            # so don't wait on the Lido API either
+            return APYMetrics()
+
+        # Bond APY (stETH protocol rebase rate) and historical APR data from
+        # TokenRebased events are independent network fetches - run them
+        # concurrently, together with the IPFS distribution history
+        if bond_eth < MIN_BOND_ETH:
+            # Dust bonds produce nonsensical reward APY, so skip the IPFS
+            # history; only the protocol bond APY applies
+            steth_data, historical_apr_data = await asyncio.gather(
+                self.lido_api.get_steth_apr(),
+                self.onchain.get_historical_apr_data(),
+            )
+            history = {"frames": []}
+        else:
+            history, steth_data, historical_apr_data = await asyncio.gather(
+                self._get_distribution_history(operator_id, bond_eth),
+                self.lido_api.get_steth_apr(),
+                self.onchain.get_historical_apr_data(),
+            )
+        frames = history["frames"]
+        previous_distribution_eth = history.get("previous_distribution_eth")
+        previous_distribution_apy = history.get("previous_distribution_apy")
+        current_distribution_eth = history.get("current_distribution_eth")
+        current_distribution_apy = history.get("current_distribution_apy")
+        next_distribution_date = history.get("next_distribution_date")
+        next_distribution_est_eth = history.get("next_distribution_est_eth")
+        lifetime_distribution_eth = history.get("lifetime_distribution_eth")
+        # Calculate 28-day APY (current frame)
+        historical_reward_apy_28d = current_distribution_apy
+        # NOTE: Lifetime APY is intentionally NOT calculated because:
+        # - It uses current bond as denominator for all historical rewards
+        # - This produces misleading values for operators who grew over time
+        # - We keep lifetime_distribution_eth (ETH totals are accurate)
+        # historical_reward_apy_ltd remains None
+
         historical_reward_apy_ltd = None
-        previous_distribution_eth = None
-        previous_distribution_apy = None
         previous_net_apy = None
-        current_distribution_eth = None
-        current_distribution_apy = None
-        next_distribution_date = None
-        next_distribution_est_eth = None
-        lifetime_distribution_eth = None
         # Accurate lifetime APY (calculated with per-frame bond when include_history=True)
         lifetime_reward_apy = None
         lifetime_bond_apy = None
         lifetime_net_apy = None
         frame_list: list[DistributionFrame] | None = None
-        frames = []
-
-        # 1. Try to get historical APY from IPFS distribution logs
-        # Minimum bond threshold: 0.01 ETH (dust amounts produce nonsensical APY)
-        MIN_BOND_ETH = Decimal("0.01")
-        if bond_eth >= MIN_BOND_ETH:
-            try:
-                # Query historical log CIDs from contract events
-                log_history = await self.onchain.get_distribution_log_history()
-
-                if log_history:
-                    # Fetch operator's historical frame data
-                    frames, ipfs_failures = await self.ipfs_logs.get_operator_history(
-                        operator_id, log_history
-                    )
-
-                    if ipfs_failures > 0:
-                        self.onchain._data_warnings.append(
-                            f"Failed to fetch {ipfs_failures}/{len(log_history)} "
-                            f"distribution logs from IPFS. Some frame data may be missing."
-                        )
-
-                    if frames:
-                        # Convert all frame shares to ETH values
-                        # IPFS logs store distributed_rewards in stETH shares, not ETH
-                        # We need to convert shares to ETH for accurate display and APY calculation
-                        total_shares = sum(f.distributed_rewards for f in frames)
-                        lifetime_distribution_eth = float(
-                            await self.onchain.shares_to_eth(total_shares)
-                        )
 
-                        # Extract current frame data (most recent)
-                        current_frame = frames[-1]
-                        current_eth = await self.onchain.shares_to_eth(
-                            current_frame.distributed_rewards
-                        )
-                        current_days = self.ipfs_logs.calculate_frame_duration_days(current_frame)
-                        current_distribution_eth = float(current_eth)
-                        if current_days > 0 and bond_eth >= MIN_BOND_ETH:
-                            current_distribution_apy = round(
-                                float(current_eth / bond_eth) * (365.0 / current_days) * 100, 2
-                            )
-
-                        # Extract previous frame data (second-to-last)
-                        if len(frames) >= 2:
-                            previous_frame = frames[-2]
-                            prev_eth = await self.onchain.shares_to_eth(
-                                previous_frame.distributed_rewards
-                            )
-                            prev_days = self.ipfs_logs.calculate_frame_duration_days(previous_frame)
-                            previous_distribution_eth = float(prev_eth)
-                            if prev_days > 0 and bond_eth >= MIN_BOND_ETH:
-                                previous_distribution_apy = round(
-                                    float(prev_eth / bond_eth) * (365.0 / prev_days) * 100, 2
-                                )
-
-                        # Calculate APY using ETH values (now that we have them)
-                        # Calculate 28-day APY (current frame)
-                        if current_distribution_apy is not None:
-                            historical_reward_apy_28d = current_distribution_apy
-                        # NOTE: Lifetime APY is intentionally NOT calculated because:
-                        # - It uses current bond as denominator for all historical rewards
-                        # - This produces misleading values for operators who grew over time
-                        # - We keep lifetime_distribution_eth (ETH totals are accurate)
-                        # historical_reward_apy_ltd remains None
-
-                        # Estimate next distribution date using actual frame epoch span
-                        # If IPFS logs are behind, keep advancing until we get a future date
-                        now = datetime.now(timezone.utc)
-                        frame_epoch_duration = current_frame.end_epoch - current_frame.start_epoch
-                        next_epoch = current_frame.end_epoch + frame_epoch_duration
-                        next_dt = epoch_to_dt(next_epoch)
-                        while next_dt < now:
-                            next_epoch += frame_epoch_duration
-                            next_dt = epoch_to_dt(next_epoch)
-                        next_distribution_date = next_dt.isoformat()
-
-                        # Estimate next distribution ETH based on current daily rate
-                        if current_days > 0:
-                            daily_rate = current_eth / Decimal(current_days)
-                            next_distribution_est_eth = float(daily_rate * Decimal(current_days))
-
-            except Exception as e:
-                # If historical APY calculation fails, continue without it
-                logger.warning(f"Historical APY calculation failed for operator {operator_id}: {e}")
-
-        # 2. Bond APY (stETH protocol rebase rate)
-        steth_data = await self.lido_api.get_steth_apr()
         bond_apy = steth_data.get("apr")
 
         # 3. Net APY calculations (initialized here, calculated after historical APR section)
@@ -351,151 +481,139 @@ class OperatorService:
         current_bond_apr = None
         previous_bond_apy = None  # Bond APY for previous frame (for accurate previous_net_apy)
 
-        # Fetch historical APR data from TokenRebased events
-        historical_apr_data = await self.onchain.get_historical_apr_data()
-
-        if bond_eth >= MIN_BOND_ETH:
-            # Previous frame bond earnings
-            if frames and len(frames) >= 2:
-                prev_frame = frames[-2]
-                prev_days = self.ipfs_logs.calculate_frame_duration_days(prev_frame)
-                if prev_days > 0:
-                    # Use average historical APR for the frame period
-                    prev_start_ts = BEACON_GENESIS + (prev_frame.start_epoch * 384)
-                    prev_end_ts = BEACON_GENESIS + (prev_frame.end_epoch * 384)
-                    prev_apr = self.lido_api.get_average_apr_for_range(
-                        historical_apr_data, prev_start_ts, prev_end_ts
+        # Previous frame bond earnings
+        if frames and len(frames) >= 2:
+            prev_frame = frames[-2]
+            prev_days = self.ipfs_logs.calculate_frame_duration_days(prev_frame)
+            if prev_days > 0:
+                # Use average historical APR for the frame period
+                prev_start_ts = BEACON_GENESIS + (prev_frame.start_epoch * 384)
+                prev_end_ts = BEACON_GENESIS + (prev_frame.end_epoch * 384)
+                prev_apr = self.lido_api.get_average_apr_for_range(
+                    historical_apr_data, prev_start_ts, prev_end_ts
+                )
+                if prev_apr is None:
+                    prev_apr = bond_apy
+                if prev_apr is not None:
+                    previous_bond_apr = round(prev_apr, 2)
+                    previous_bond_apy = previous_bond_apr  # Same value, used for net APY
+
+                    # When include_history=True and we have validator count, use per-frame bond
+                    if include_history and prev_frame.validator_count > 0:
+                        prev_bond = float(self.onchain.calculate_required_bond(
+                            prev_frame.validator_count, curve_id
+                        ))
+                        previous_bond_eth = round(prev_bond * (prev_apr / 100) * (prev_days / 365), 6)
+                    else:
+                        previous_bond_eth = round(bond_eth * (prev_apr / 100) * (prev_days / 365), 6)
+
+        # Current frame bond earnings
+        if frames:
+            curr_frame = frames[-1]
+            curr_days = self.ipfs_logs.calculate_frame_duration_days(curr_frame)
+            if curr_days > 0:
+                # Use average historical APR for the frame period
+                curr_start_ts = BEACON_GENESIS + (curr_frame.start_epoch * 384)
+                curr_end_ts = BEACON_GENESIS + (curr_frame.end_epoch * 384)
+                curr_apr = self.lido_api.get_average_apr_for_range(
+                    historical_apr_data, curr_start_ts, curr_end_ts
+                )
+                if curr_apr is None:
+                    curr_apr = bond_apy
+                if curr_apr is not None:
+                    current_bond_apr = round(curr_apr, 2)
+                    current_bond_eth = round(bond_eth * (curr_apr / 100) * (curr_days / 365), 6)
+
+        # Lifetime bond earnings (sum of all frame durations with per-frame APR)
+        # When include_history=True, calculate accurate lifetime APY with per-frame bond
+        # Also build frame_list here to avoid duplicate loop
+        if frames:
+            lifetime_bond_sum = 0.0
+            # For accurate lifetime APY calculation (duration-weighted)
+            frame_reward_apys = []
+            frame_bond_apys = []
+            frame_durations = []
+            frame_list = []  # Build frame_list here instead of separate loop
+
+            for i, f in enumerate(frames):
+                f_days = self.ipfs_logs.calculate_frame_duration_days(f)
+                f_eth = float(await self.onchain.shares_to_eth(f.distributed_rewards))
+                f_apy = None
+                f_bond_apy = None
+                f_net_apy = None
+
+                if f_days > 0:
+                    # Use average historical APR for each frame period
+                    f_start_ts = BEACON_GENESIS + (f.start_epoch * 384)
+                    f_end_ts = BEACON_GENESIS + (f.end_epoch * 384)
+                    f_apr = self.lido_api.get_average_apr_for_range(
+                        historical_apr_data, f_start_ts, f_end_ts
                     )
-                    if prev_apr is None:
-                        prev_apr = bond_apy
-                    if prev_apr is not None:
-                        previous_bond_apr = round(prev_apr, 2)
-                        previous_bond_apy = previous_bond_apr  # Same value, used for net APY
+                    if f_apr is None:
+                        f_apr = bond_apy
 
+                    if f_apr is not None:
                         # When include_history=True and we have validator count, use per-frame bond
-                        if include_history and prev_frame.validator_count > 0:
-                            prev_bond = self.onchain.calculate_required_bond(
-                                prev_frame.validator_count, curve_id
-                            )
-                            # Keep calculation in Decimal for precision
-                            previous_bond_eth = round(
-                                float(prev_bond * Decimal(prev_apr / 100) * Decimal(prev_days / 365)), 6
-                            )
+                        if include_history and f.validator_count > 0:
+                            f_bond = float(self.onchain.calculate_required_bond(
+                                f.validator_count, curve_id
+                            ))
+                            lifetime_bond_sum += f_bond * (f_apr / 100) * (f_days / 365)
+
+                            # Calculate per-frame reward APY using accurate per-frame bond
+                            if f_bond > 0:
+                                f_apy = round((f_eth / f_bond) * (365.0 / f_days) * 100, 2)
+                                f_bond_apy = round(f_apr, 2)
+                                f_net_apy = round(f_apy + f_bond_apy, 2)
+
+                                frame_reward_apys.append(f_apy)
+                                frame_bond_apys.append(f_apr)
+                                frame_durations.append(f_days)
                         else:
-                            previous_bond_eth = round(
-                                float(bond_eth * Decimal(prev_apr / 100) * Decimal(prev_days / 365)), 6
-                            )
-
-            # Current frame bond earnings
-            if frames:
-                curr_frame = frames[-1]
-                curr_days = self.ipfs_logs.calculate_frame_duration_days(curr_frame)
-                if curr_days > 0:
-                    # Use average historical APR for the frame period
-                    curr_start_ts = BEACON_GENESIS + (curr_frame.start_epoch * 384)
-                    curr_end_ts = BEACON_GENESIS + (curr_frame.end_epoch * 384)
-                    curr_apr = self.lido_api.get_average_apr_for_range(
-                        historical_apr_data, curr_start_ts, curr_end_ts
-                    )
-                    if curr_apr is None:
-                        curr_apr = bond_apy
-                    if curr_apr is not None:
-                        current_bond_apr = round(curr_apr, 2)
-                        # Keep calculation in Decimal for precision
-                        current_bond_eth = round(
-                            float(bond_eth * Decimal(curr_apr / 100) * Decimal(curr_days / 365)), 6
-                        )
-
-            # Lifetime bond earnings (sum of all frame durations with per-frame APR)
-            # When include_history=True, calculate accurate lifetime APY with per-frame bond
-            # Also build frame_list here to avoid duplicate loop
-            if frames:
-                lifetime_bond_sum = 0.0
-                # For accurate lifetime APY calculation (duration-weighted)
-                frame_reward_apys = []
-                frame_bond_apys = []
-                frame_durations = []
-                frame_list = []  # Build frame_list here instead of separate loop
-
-                for i, f in enumerate(frames):
-                    f_days = self.ipfs_logs.calculate_frame_duration_days(f)
-                    f_eth = await self.onchain.shares_to_eth(f.distributed_rewards)
-                    f_apy = None
-                    f_bond_apy = None
-                    f_net_apy = None
-
-                    if f_days > 0:
-                        # Use average historical APR for each frame period
-                        f_start_ts = BEACON_GENESIS + (f.start_epoch * 384)
-                        f_end_ts = BEACON_GENESIS + (f.end_epoch * 384)
-                        f_apr = self.lido_api.get_average_apr_for_range(
-                            historical_apr_data, f_start_ts, f_end_ts
-                        )
-                        if f_apr is None:
-                            f_apr = bond_apy
-
-                        if f_apr is not None:
-                            # When include_history=True and we have validator count, use per-frame bond
-                            if include_history and f.validator_count > 0:
-                                f_bond = self.onchain.calculate_required_bond(
-                                    f.validator_count, curve_id
-                                )
-                                # Keep calculations in Decimal for precision
-                                lifetime_bond_sum += float(f_bond * Decimal(f_apr / 100) * Decimal(f_days / 365))
-
-                                # Calculate per-frame reward APY using accurate per-frame bond
-                                if f_bond > 0:
-                                    f_apy = round(float((f_eth / f_bond) * Decimal(365.0 / f_days) * Decimal(100)), 2)
-                                    f_bond_apy = round(f_apr, 2)
-                                    f_net_apy = round(f_apy + f_bond_apy, 2)
-
-                                    frame_reward_apys.append(f_apy)
-                                    frame_bond_apys.append(f_apr)
-                                    frame_durations.append(f_days)
-                            else:
-                                lifetime_bond_sum += float(bond_eth * Decimal(f_apr / 100) * Decimal(f_days / 365))
-                                # Fallback: use current bond for APY calc
-                                if bond_eth >= MIN_BOND_ETH:
-                                    f_apy = round(float(f_eth / bond_eth) * (365.0 / f_days) * 100, 2)
-
-                    # Build frame_list entry if history requested
-                    if include_history:
-                        frame_list.append(
-                            DistributionFrame(
-                                frame_number=i + 1,
-                                start_date=epoch_to_dt(f.start_epoch).isoformat(),
-                                end_date=epoch_to_dt(f.end_epoch).isoformat(),
-                                rewards_eth=float(f_eth),
-                                rewards_shares=f.distributed_rewards,
-                                duration_days=round(f_days, 1),
-                                validator_count=f.validator_count,
-                                apy=f_apy,
-                                bond_apy=f_bond_apy,
-                                net_apy=f_net_apy,
-                            )
+                            lifetime_bond_sum += bond_eth * (f_apr / 100) * (f_days / 365)
+                            # Fallback: use current bond for APY calc
+                            if bond_eth >= MIN_BOND_ETH:
+                                f_apy = round((f_eth / bond_eth) * (365.0 / f_days) * 100, 2)
+
+                # Build frame_list entry if history requested (values are
+                # already typed, so skip pydantic validation per frame)
+                if include_history:
+                    frame_list.append(
+                        DistributionFrame.model_construct(
+                            frame_number=i + 1,
+                            start_date=epoch_to_dt(f.start_epoch).isoformat(),
+                            end_date=epoch_to_dt(f.end_epoch).isoformat(),
+                            rewards_eth=f_eth,
+                            rewards_shares=f.distributed_rewards,
+                            duration_days=round(f_days, 1),
+                            validator_count=f.validator_count,
+                            apy=f_apy,
+                            bond_apy=f_bond_apy,
+                            net_apy=f_net_apy,
                         )
+                    )
 
-                if lifetime_bond_sum > 0:
-                    lifetime_bond_eth = round(lifetime_bond_sum, 6)
-
-                # Calculate duration-weighted lifetime APYs when include_history=True
-                if include_history and frame_durations:
-                    total_duration = sum(frame_durations)
-                    if total_duration > 0:
-                        # Duration-weighted average reward APY
-                        lifetime_reward_apy = round(
-                            sum(apy * dur for apy, dur in zip(frame_reward_apys, frame_durations))
-                            / total_duration,
-                            2
-                        )
-                        # Duration-weighted average bond APY
-                        lifetime_bond_apy = round(
-                            sum(apy * dur for apy, dur in zip(frame_bond_apys, frame_durations))
-                            / total_duration,
-                            2
-                        )
-                        # Net = Reward + Bond
-                        lifetime_net_apy = round(lifetime_reward_apy + lifetime_bond_apy, 2)
+            if lifetime_bond_sum > 0:
+                lifetime_bond_eth = round(lifetime_bond_sum, 6)
+
+            # Calculate duration-weighted lifetime APYs when include_history=True
+            if include_history and frame_durations:
+                total_duration = sum(frame_durations)
+                if total_duration > 0:
+                    # Duration-weighted average reward APY
+                    lifetime_reward_apy = round(
+                        sum(apy * dur for apy, dur in zip(frame_reward_apys, frame_durations))
+                        / total_duration,
+                        2
+                    )
+                    # Duration-weighted average bond APY
+                    lifetime_bond_apy = round(
+                        sum(apy * dur for apy, dur in zip(frame_bond_apys, frame_durations))
+                        / total_duration,
+                        2
+                    )
+                    # Net = Reward + Bond
+                    lifetime_net_apy = round(lifetime_reward_apy + lifetime_bond_apy, 2)
 
         # 4b. Previous frame net APY (now that we have previous_bond_apy)
         # Uses the actual APR from the previous frame period instead of current bond_apy
@@ -554,12 +672,12 @@ class OperatorService:
                     unclaimed_reward_eth = float(
                         await self.onchain.shares_to_eth(unclaimed_shares)
                     )
-                    terminal_value = float(bond_eth) + unclaimed_reward_eth
+                    terminal_value = bond_eth + unclaimed_reward_eth
 
                     ce_result = calculate_capital_efficiency(
                         bond_events=bond_events,
                         total_rewards_eth=lifetime_distribution_eth,
-                        current_bond_eth=float(bond_eth),
+                        current_bond_eth=bond_eth,
                         steth_apr=bond_apy,
                         historical_apr_data=historical_apr_data,
                         distribution_flows=distribution_flows,
@@ -571,7 +689,8 @@ class OperatorService:
             except Exception as e:
                 logger.warning(f"Capital efficiency calculation failed for operator {operator_id}: {e}")
 
-        return APYMetrics(
+        # trusted: every field was computed above
+        return APYMetrics.model_construct(
             previous_distribution_eth=previous_distribution_eth,
             previous_distribution_apy=previous_distribution_apy,
             previous_net_apy=previous_net_apy,
@@ -601,6 +720,90 @@ class OperatorService:
             capital_efficiency=capital_efficiency,
         )
 
+    async def _get_distribution_history(self, operator_id: int, bond_eth: float) -> dict:
+        """Fetch the operator's distribution frames from IPFS logs.
+
+        Returns a dict with the frame list plus current/previous frame reward
+        figures and the next distribution estimate. Fields that couldn't be
+        computed are absent; failures are logged, not raised.
+        """
+        history: dict = {"frames": []}
+        try:
+            # Query historical log CIDs from contract events
+            log_history = await self.onchain.get_distribution_log_history()
+            if not log_history:
+                return history
+
+            # Fetch operator's historical frame data
+            frames, ipfs_failures = await self.ipfs_logs.get_operator_history(
+                operator_id, log_history
+            )
+            history["frames"] = frames
+
+            if ipfs_failures > 0:
+                self.onchain._data_warnings.append(
+                    f"Failed to fetch {ipfs_failures}/{len(log_history)} "
+                    f"distribution logs from IPFS. Some frame data may be missing."
+                )
+
+            if not frames:
+                return history
+
+            # Convert all frame shares to ETH values
+            # IPFS logs store distributed_rewards in stETH shares, not ETH
+            # We need to convert shares to ETH for accurate display and APY calculation
+            total_shares = sum(f.distributed_rewards for f in frames)
+            history["lifetime_distribution_eth"] = float(
+                await self.onchain.shares_to_eth(total_shares)
+            )
+
+            # Extract current frame data (most recent)
+            current_frame = frames[-1]
+            current_eth = float(await self.onchain.shares_to_eth(
+                current_frame.distributed_rewards
+            ))
+            current_days = self.ipfs_logs.calculate_frame_duration_days(current_frame)
+            history["current_distribution_eth"] = current_eth
+            if current_days > 0:
+                history["current_distribution_apy"] = round(
+                    (current_eth / bond_eth) * (365.0 / current_days) * 100, 2
+                )
+
+            # Extract previous frame data (second-to-last)
+            if len(frames) >= 2:
+                previous_frame = frames[-2]
+                prev_eth = float(await self.onchain.shares_to_eth(
+                    previous_frame.distributed_rewards
+                ))
+                prev_days = self.ipfs_logs.calculate_frame_duration_days(previous_frame)
+                history["previous_distribution_eth"] = prev_eth
+                if prev_days > 0:
+                    history["previous_distribution_apy"] = round(
+                        (prev_eth / bond_eth) * (365.0 / prev_days) * 100, 2
+                    )
+
+            # Estimate next distribution date using actual frame epoch span
+            # If IPFS logs are behind, keep advancing until we get a future date
+            now = datetime.now(timezone.utc)
+            frame_epoch_duration = current_frame.end_epoch - current_frame.start_epoch
+            next_epoch = current_frame.end_epoch + frame_epoch_duration
+            next_dt = epoch_to_dt(next_epoch)
+            while next_dt < now:
+                next_epoch += frame_epoch_duration
+                next_dt = epoch_to_dt(next_epoch)
+            history["next_distribution_date"] = next_dt.isoformat()
+
+            # Estimate next distribution ETH based on current daily rate
+            if current_days > 0:
+                daily_rate = current_eth / current_days
+                history["next_distribution_est_eth"] = daily_rate * current_days
+
+        except Exception as e:
+            # If historical APY calculation fails, continue without it
+            logger.warning(f"Historical APY calculation failed for operator {operator_id}: {e}")
+
+        return history
+
     async def calculate_health_status(
         self,
         operator_id: int,
@@ -614,8 +817,8 @@ class OperatorService:
         Includes bond health, stuck validators, slashing, at-risk validators, and strikes.
         """
         # Bond health
-        bond_healthy = bond.current_bond_eth >= bond.required_bond_eth
-        bond_deficit = max(Decimal(0), bond.required_bond_eth - bond.current_bond_eth)
+        bond_healthy = bond.current_bond_wei >= bond.required_bond_wei
+        bond_deficit = Decimal(max(0, bond.required_bond_wei - bond.current_bond_wei)) / Decimal(10**18)
 
         # Count slashed and at-risk validators
         slashed_count = count_slashed_validators(validator_details)
@@ -731,8 +934,10 @@ class OperatorService:
         try:
             operator = await self.onchain.get_node_operator(operator_id)
             events = await self.onchain.get_withdrawal_history(operator.reward_address)
+            # The provider already returns native ints/floats/strs, so build the
+            # models without re-validating every event
             return [
-                WithdrawalEvent(
+                WithdrawalEvent.model_construct(
                     block_number=e["block_number"],
                     timestamp=e["timestamp"],
                     shares=e["shares"],
@@ -0,0 +1,59 @@
+"""Background prefetch of the rewards tree when a new distribution lands."""
+
+import asyncio
+import logging
+
+from ..data.onchain import OnChainDataProvider
+from ..data.rewards_tree import RewardsTreeProvider
+from .operator_service import invalidate_apy_metrics
+
+logger = logging.getLogger(__name__)
+
+# How often to check CSFeeDistributor.treeCid() for a new distribution
+TREE_POLL_INTERVAL_SECONDS = 600
+
+# Polls to wait for the proofs file of a new CID to change before accepting it
+# as-is (the tree may legitimately be unchanged between distributions)
+MAX_UNCHANGED_TREE_POLLS = 6
+
+
+async def watch_rewards_tree(interval: float = TREE_POLL_INTERVAL_SECONDS) -> None:
+    """Keep the rewards tree cache warm across distributions.
+
+    Polls the on-chain tree CID; when it changes, re-downloads the proofs so the
+    first dashboard request after a distribution doesn't pay for the download.
+    The published proofs file can trail the on-chain update, so a CID only
+    counts as handled once the downloaded tree differs from the one recorded
+    at the last handled CID, or after MAX_UNCHANGED_TREE_POLLS tries. Runs
+    until cancelled.
+    """
+    onchain = OnChainDataProvider()
+    rewards_tree = RewardsTreeProvider()
+    known_cid: str | None = None
+    known_tree: dict = {}
+    unchanged_polls = 0
+
+    while True:
+        try:
+            tree_cid = await onchain.get_tree_cid()
+            if known_cid is None:
+                # First poll: just warm the cache
+                known_tree = await rewards_tree.fetch_rewards_data()
+                known_cid = tree_cid
+            elif tree_cid != known_cid:
+                data = await rewards_tree.refresh()
+                if data and data == known_tree:
+                    unchanged_polls += 1
+                if data and (data != known_tree or unchanged_polls >= MAX_UNCHANGED_TREE_POLLS):
+                    logger.info(f"Prefetched rewards tree for new distribution {tree_cid}")
+                    # A new distribution changes every operator's APY figures
+                    invalidate_apy_metrics()
+                    known_cid = tree_cid
+                    known_tree = data
+                    unchanged_polls = 0
+                else:
+                    logger.info(f"Rewards tree for {tree_cid} not published yet, will retry")
+        except Exception as e:
+            logger.warning(f"Rewards tree prefetch failed: {e}")
+
+        await asyncio.sleep(interval)
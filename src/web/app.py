@@ -1,13 +1,21 @@
 """FastAPI application factory."""
 
+import asyncio
+import gzip
+import hashlib
 import logging
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.datastructures import Headers
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from ..core.version import __version__
+from ..data.http import close_client
+from ..services.rewards_prefetch import watch_rewards_tree
+from .responses import ORJSONResponse
 from .routes import router
 
 # Configure logging
@@ -18,50 +26,54 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_app() -> FastAPI:
-    """Create and configure the FastAPI application."""
-    app = FastAPI(
-        title="CSM Operator Dashboard",
-        description="Track your Lido CSM validator earnings",
-        version=__version__,
-    )
-
-    # Add request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        logger.info(f"Request: {request.method} {request.url.path}")
-        try:
-            response = await call_next(request)
-            logger.info(f"Response: {request.method} {request.url.path} -> {response.status_code}")
-            return response
-        except Exception as e:
-            logger.error(f"Request failed: {request.method} {request.url.path} -> {e}")
-            raise
-
-    app.include_router(router, prefix="/api")
-
-    # Mount static files for favicon and images
-    img_dir = Path(__file__).parent.parent.parent / "img"
-    if img_dir.exists():
-        app.mount("/img", StaticFiles(directory=str(img_dir)), name="img")
-
-    @app.on_event("startup")
-    async def startup_event():
-        logger.info("CSM Dashboard starting up")
-
-    @app.on_event("shutdown")
-    async def shutdown_event():
-        logger.info("CSM Dashboard shutting down")
-
-    @app.get("/", response_class=HTMLResponse)
-    async def index():
-        logger.debug("Serving index page")
-        html = """
+# Dashboard page, rendered and encoded once at import rather than per request
+_INDEX_HTML = """
 <html>
 <head>
     <title>CSM Operator Dashboard</title>
     <link rel="icon" type="image/x-icon" href="/img/favicon.ico">
-    <script src="https://cdn.tailwindcss.com"></script>
+    <link rel="preconnect" href="https://cdn.tailwindcss.com" crossorigin>
+    <!-- Requested by the script on every load; start them while it downloads and parses -->
+    <link rel="preload" as="fetch" href="/api/price/eth" crossorigin>
+    <link rel="preload" as="fetch" href="/api/saved-operators" crossorigin>
+    <!-- Critical styles for what is visible before the first lookup, matching the
+         Tailwind utilities they stand in for, so the header and form paint (and the
+         hidden panels stay hidden) without waiting for the deferred Tailwind runtime -->
+    <style>
+        *, ::before, ::after { box-sizing: border-box; border: 0 solid #e5e7eb; }
+        body { margin: 0; line-height: 1.5; font-family: ui-sans-serif, system-ui, sans-serif, "Apple Color Emoji", "Segoe UI Emoji"; }
+        h1, h2, p { margin: 0; font-size: inherit; }
+        input, button { font: inherit; color: inherit; margin: 0; padding: 0; background-color: transparent; }
+        .hidden { display: none; }
+        .bg-gray-900 { background-color: #111827; }
+        .text-white { color: #fff; }
+        .min-h-screen { min-height: 100vh; }
+        .p-8 { padding: 2rem; }
+        .max-w-4xl { max-width: 56rem; }
+        .mx-auto { margin-left: auto; margin-right: auto; }
+        .flex { display: flex; }
+        .flex-1 { flex: 1 1 0%; }
+        .justify-between { justify-content: space-between; }
+        .items-start { align-items: flex-start; }
+        .gap-4 { gap: 1rem; }
+        .mb-2 { margin-bottom: 0.5rem; }
+        .mb-8 { margin-bottom: 2rem; }
+        .p-3 { padding: 0.75rem; }
+        .px-6 { padding-left: 1.5rem; padding-right: 1.5rem; }
+        .py-3 { padding-top: 0.75rem; padding-bottom: 0.75rem; }
+        .text-3xl { font-size: 1.875rem; line-height: 2.25rem; }
+        .text-xs { font-size: 0.75rem; line-height: 1rem; }
+        .font-bold { font-weight: 700; }
+        .font-medium { font-weight: 500; }
+        .text-gray-400 { color: #9ca3af; }
+        .text-gray-500 { color: #6b7280; }
+        .bg-gray-800 { background-color: #1f2937; }
+        .bg-blue-600 { background-color: #2563eb; }
+        .rounded { border-radius: 0.25rem; }
+        .border { border-width: 1px; }
+        .border-gray-700 { border-color: #374151; }
+    </style>
+    <script defer src="https://cdn.tailwindcss.com"></script>
 </head>
 <body class="bg-gray-900 text-white min-h-screen p-8">
     <div class="max-w-4xl mx-auto">
@@ -81,6 +93,10 @@ def create_app() -> FastAPI:
                     Check Rewards
                 </button>
             </div>
+            <label class="inline-flex items-center gap-2 mt-2 text-sm text-gray-400">
+                <input type="checkbox" id="auto-load-details" class="accent-blue-600" />
+                Always load validator details
+            </label>
         </form>
 
         <!-- Saved Operators Section -->
@@ -453,18 +469,22 @@ def create_app() -> FastAPI:
     </div>
 
     <script>
-        const form = document.getElementById('lookup-form');
-        const loading = document.getElementById('loading');
-        const error = document.getElementById('error');
-        const errorMessage = document.getElementById('error-message');
-        const results = document.getElementById('results');
-        const loadDetailsBtn = document.getElementById('load-details');
-        const detailsLoading = document.getElementById('details-loading');
-        const validatorStatus = document.getElementById('validator-status');
-        const beaconchainLink = document.getElementById('beaconchain-link');
-        const apySection = document.getElementById('apy-section');
-        const healthSection = document.getElementById('health-section');
-        const historySection = document.getElementById('history-section');
+        // Every element with an id, looked up once (the markup above is static)
+        const els = {};
+        document.querySelectorAll('[id]').forEach(el => { els[el.id] = el; });
+
+        const form = els['lookup-form'];
+        const loading = els['loading'];
+        const error = els['error'];
+        const errorMessage = els['error-message'];
+        const results = els['results'];
+        const loadDetailsBtn = els['load-details'];
+        const detailsLoading = els['details-loading'];
+        const validatorStatus = els['validator-status'];
+        const beaconchainLink = els['beaconchain-link'];
+        const apySection = els['apy-section'];
+        const healthSection = els['health-section'];
+        const historySection = els['history-section'];
 
         // Global abort controller for canceling requests on page unload
         let pageAbortController = new AbortController();
@@ -487,8 +507,8 @@ def create_app() -> FastAPI:
                 const data = await response.json();
                 if (data.price) {
                     ethPriceUsd = data.price;
-                    document.getElementById('eth-price-value').textContent = ethPriceUsd.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
-                    document.getElementById('eth-price-display').classList.remove('hidden');
+                    els['eth-price-value'].textContent = ethPriceUsd.toLocaleString('en-US', { minimumFractionDigits: 2, maximumFractionDigits: 2 });
+                    els['eth-price-display'].classList.remove('hidden');
                     // Update any displayed USD values
                     updateUsdDisplays();
                     // Re-render saved operator cards to show USD
@@ -526,8 +546,8 @@ def create_app() -> FastAPI:
             ];
 
             fields.forEach(({ eth, usd }) => {
-                const ethEl = document.getElementById(eth);
-                const usdEl = document.getElementById(usd);
+                const ethEl = els[eth];
+                const usdEl = els[usd];
                 if (ethEl && usdEl) {
                     const ethVal = parseFloat(ethEl.textContent);
                     usdEl.textContent = formatUsd(ethVal);
@@ -537,16 +557,16 @@ def create_app() -> FastAPI:
 
         // Fetch ETH price on page load
         fetchEthPrice();
-        const loadHistoryBtn = document.getElementById('load-history-btn');
-        const historyLoading = document.getElementById('history-loading');
-        const historyTable = document.getElementById('history-table');
-        const historyTbody = document.getElementById('history-tbody');
-        const nextDistribution = document.getElementById('next-distribution');
-        const withdrawalSection = document.getElementById('withdrawal-section');
-        const loadWithdrawalsBtn = document.getElementById('load-withdrawals-btn');
-        const withdrawalLoading = document.getElementById('withdrawal-loading');
-        const withdrawalTable = document.getElementById('withdrawal-table');
-        const withdrawalTbody = document.getElementById('withdrawal-tbody');
+        const loadHistoryBtn = els['load-history-btn'];
+        const historyLoading = els['history-loading'];
+        const historyTable = els['history-table'];
+        const historyTbody = els['history-tbody'];
+        const nextDistribution = els['next-distribution'];
+        const withdrawalSection = els['withdrawal-section'];
+        const loadWithdrawalsBtn = els['load-withdrawals-btn'];
+        const withdrawalLoading = els['withdrawal-loading'];
+        const withdrawalTable = els['withdrawal-table'];
+        const withdrawalTbody = els['withdrawal-tbody'];
 
         // State variables for history/withdrawal loading
         let historyLoaded = false;
@@ -557,12 +577,12 @@ def create_app() -> FastAPI:
         }
 
         function renderCapitalEfficiency(ce) {
-            const ceSection = document.getElementById('capital-efficiency-section');
-            const xirrEl = document.getElementById('ce-xirr');
-            const stethReturnEl = document.getElementById('ce-steth-return');
-            const advEl = document.getElementById('ce-advantage');
-            const csmReturnEl = document.getElementById('ce-csm-return');
-            const daysEl = document.getElementById('ce-days');
+            const ceSection = els['capital-efficiency-section'];
+            const xirrEl = els['ce-xirr'];
+            const stethReturnEl = els['ce-steth-return'];
+            const advEl = els['ce-advantage'];
+            const csmReturnEl = els['ce-csm-return'];
+            const daysEl = els['ce-days'];
 
             // Reset defaults first to avoid stale values when switching operators
             xirrEl.textContent = '--%';
@@ -619,18 +639,18 @@ def create_app() -> FastAPI:
             loadWithdrawalsBtn.textContent = 'Load Withdrawals';
             beaconchainLink.classList.add('hidden');
             beaconchainLink.href = '#';
-            document.getElementById('apy-lifetime-header').classList.add('hidden');
-            document.getElementById('reward-apy-ltd').classList.add('hidden');
-            document.getElementById('bond-apy-ltd').classList.add('hidden');
-            document.getElementById('net-apy-ltd').classList.add('hidden');
-            document.getElementById('active-since-row').classList.add('hidden');
-            document.getElementById('effectiveness-section').classList.add('hidden');
+            els['apy-lifetime-header'].classList.add('hidden');
+            els['reward-apy-ltd'].classList.add('hidden');
+            els['bond-apy-ltd'].classList.add('hidden');
+            els['net-apy-ltd'].classList.add('hidden');
+            els['active-since-row'].classList.add('hidden');
+            els['effectiveness-section'].classList.add('hidden');
             loadDetailsBtn.classList.remove('hidden');
             loadDetailsBtn.disabled = false;
             loadDetailsBtn.textContent = 'Load Validator Status & APY (Beacon Chain)';
 
-            const strikesDetailDiv = document.getElementById('strikes-detail');
-            const strikesList = document.getElementById('strikes-list');
+            const strikesDetailDiv = els['strikes-detail'];
+            const strikesList = els['strikes-list'];
             if (strikesDetailDiv) strikesDetailDiv.classList.add('hidden');
             if (strikesList) {
                 strikesList.classList.add('hidden');
@@ -646,35 +666,35 @@ def create_app() -> FastAPI:
         // Display operator data in UI (handles both basic and detailed data)
         function displayOperatorData(data) {
             // Basic info
-            document.getElementById('operator-id').textContent = data.operator_id;
-            document.getElementById('manager-address').textContent = data.manager_address;
-            document.getElementById('reward-address').textContent = data.reward_address;
+            els['operator-id'].textContent = data.operator_id;
+            els['manager-address'].textContent = data.manager_address;
+            els['reward-address'].textContent = data.reward_address;
 
             // Active Since
             if (data.active_since) {
                 const activeSince = new Date(data.active_since);
                 const options = { year: 'numeric', month: 'short', day: 'numeric' };
-                document.getElementById('active-since').textContent = activeSince.toLocaleDateString('en-US', options);
-                document.getElementById('active-since-row').classList.remove('hidden');
+                els['active-since'].textContent = activeSince.toLocaleDateString('en-US', options);
+                els['active-since-row'].classList.remove('hidden');
             }
 
             // Tip
-            document.getElementById('tip-operator-id').textContent = data.operator_id;
-            document.getElementById('lookup-tip').classList.remove('hidden');
+            els['tip-operator-id'].textContent = data.operator_id;
+            els['lookup-tip'].classList.remove('hidden');
 
             // Validators
-            document.getElementById('total-validators').textContent = data.validators?.total ?? 0;
-            document.getElementById('active-validators').textContent = data.validators?.active ?? 0;
-            document.getElementById('exited-validators').textContent = data.validators?.exited ?? 0;
+            els['total-validators'].textContent = data.validators?.total ?? 0;
+            els['active-validators'].textContent = data.validators?.active ?? 0;
+            els['exited-validators'].textContent = data.validators?.exited ?? 0;
 
             // Rewards
-            document.getElementById('current-bond').textContent = parseFloat(data.rewards?.current_bond_eth ?? 0).toFixed(6);
-            document.getElementById('required-bond').textContent = parseFloat(data.rewards?.required_bond_eth ?? 0).toFixed(6);
-            document.getElementById('excess-bond').textContent = parseFloat(data.rewards?.excess_bond_eth ?? 0).toFixed(6);
-            document.getElementById('cumulative-rewards').textContent = parseFloat(data.rewards?.cumulative_rewards_eth ?? 0).toFixed(6);
-            document.getElementById('distributed-rewards').textContent = parseFloat(data.rewards?.distributed_eth ?? 0).toFixed(6);
-            document.getElementById('unclaimed-rewards').textContent = parseFloat(data.rewards?.unclaimed_eth ?? 0).toFixed(6);
-            document.getElementById('total-claimable').textContent = parseFloat(data.rewards?.total_claimable_eth ?? 0).toFixed(6);
+            els['current-bond'].textContent = parseFloat(data.rewards?.current_bond_eth ?? 0).toFixed(6);
+            els['required-bond'].textContent = parseFloat(data.rewards?.required_bond_eth ?? 0).toFixed(6);
+            els['excess-bond'].textContent = parseFloat(data.rewards?.excess_bond_eth ?? 0).toFixed(6);
+            els['cumulative-rewards'].textContent = parseFloat(data.rewards?.cumulative_rewards_eth ?? 0).toFixed(6);
+            els['distributed-rewards'].textContent = parseFloat(data.rewards?.distributed_eth ?? 0).toFixed(6);
+            els['unclaimed-rewards'].textContent = parseFloat(data.rewards?.unclaimed_eth ?? 0).toFixed(6);
+            els['total-claimable'].textContent = parseFloat(data.rewards?.total_claimable_eth ?? 0).toFixed(6);
 
             // Update USD equivalents
             updateUsdDisplays();
@@ -683,12 +703,12 @@ def create_app() -> FastAPI:
 
             // Detailed data (if available)
             if (data.validators?.by_status) {
-                document.getElementById('status-active').textContent = data.validators.by_status.active || 0;
-                document.getElementById('status-pending').textContent = data.validators.by_status.pending || 0;
-                document.getElementById('status-exiting').textContent = data.validators.by_status.exiting || 0;
-                document.getElementById('status-exited').textContent = data.validators.by_status.exited || 0;
-                document.getElementById('status-slashed').textContent = data.validators.by_status.slashed || 0;
-                document.getElementById('status-unknown').textContent = data.validators.by_status.unknown || 0;
+                els['status-active'].textContent = data.validators.by_status.active || 0;
+                els['status-pending'].textContent = data.validators.by_status.pending || 0;
+                els['status-exiting'].textContent = data.validators.by_status.exiting || 0;
+                els['status-exited'].textContent = data.validators.by_status.exited || 0;
+                els['status-slashed'].textContent = data.validators.by_status.slashed || 0;
+                els['status-unknown'].textContent = data.validators.by_status.unknown || 0;
                 validatorStatus.classList.remove('hidden');
                 // Hide the load button since we have detailed data
                 loadDetailsBtn.classList.add('hidden');
@@ -696,27 +716,27 @@ def create_app() -> FastAPI:
 
             // Performance/effectiveness
             if (data.performance && data.performance.avg_effectiveness !== null) {
-                document.getElementById('avg-effectiveness').textContent = data.performance.avg_effectiveness.toFixed(1);
-                document.getElementById('effectiveness-section').classList.remove('hidden');
+                els['avg-effectiveness'].textContent = data.performance.avg_effectiveness.toFixed(1);
+                els['effectiveness-section'].classList.remove('hidden');
             }
 
             // APY
             if (data.apy) {
-                document.getElementById('reward-apy-28d').textContent = formatApy(data.apy.historical_reward_apy_28d);
-                document.getElementById('reward-apy-ltd').textContent = formatApy(data.apy.historical_reward_apy_ltd);
-                document.getElementById('bond-apy-28d').textContent = formatApy(data.apy.bond_apy);
-                document.getElementById('bond-apy-ltd').textContent = formatApy(data.apy.bond_apy);
-                document.getElementById('net-apy-28d').textContent = formatApy(data.apy.net_apy_28d);
-                document.getElementById('net-apy-ltd').textContent = formatApy(data.apy.net_apy_ltd);
+                els['reward-apy-28d'].textContent = formatApy(data.apy.historical_reward_apy_28d);
+                els['reward-apy-ltd'].textContent = formatApy(data.apy.historical_reward_apy_ltd);
+                els['bond-apy-28d'].textContent = formatApy(data.apy.bond_apy);
+                els['bond-apy-ltd'].textContent = formatApy(data.apy.bond_apy);
+                els['net-apy-28d'].textContent = formatApy(data.apy.net_apy_28d);
+                els['net-apy-ltd'].textContent = formatApy(data.apy.net_apy_ltd);
 
                 if (data.apy.next_distribution_date || data.apy.next_distribution_est_eth) {
                     if (data.apy.next_distribution_date) {
                         const nextDate = new Date(data.apy.next_distribution_date);
                         const options = { year: 'numeric', month: 'short', day: 'numeric' };
-                        document.getElementById('next-dist-date').textContent = nextDate.toLocaleDateString('en-US', options);
+                        els['next-dist-date'].textContent = nextDate.toLocaleDateString('en-US', options);
                     }
                     if (data.apy.next_distribution_est_eth) {
-                        document.getElementById('next-dist-eth').textContent = data.apy.next_distribution_est_eth.toFixed(4);
+                        els['next-dist-eth'].textContent = data.apy.next_distribution_est_eth.toFixed(4);
                     }
                     nextDistribution.classList.remove('hidden');
                 }
@@ -731,33 +751,33 @@ def create_app() -> FastAPI:
                 const h = data.health;
 
                 if (h.bond_healthy) {
-                    document.getElementById('health-bond').innerHTML = '<span class="text-green-400">HEALTHY</span>';
+                    els['health-bond'].innerHTML = '<span class="text-green-400">HEALTHY</span>';
                 } else {
-                    document.getElementById('health-bond').innerHTML = `<span class="text-red-400">DEFICIT -${parseFloat(h.bond_deficit_eth).toFixed(4)} ETH</span>`;
+                    els['health-bond'].innerHTML = `<span class="text-red-400">DEFICIT -${parseFloat(h.bond_deficit_eth).toFixed(4)} ETH</span>`;
                 }
 
                 if (h.stuck_validators_count === 0) {
-                    document.getElementById('health-stuck').innerHTML = '<span class="text-green-400">0</span>';
+                    els['health-stuck'].innerHTML = '<span class="text-green-400">0</span>';
                 } else {
-                    document.getElementById('health-stuck').innerHTML = `<span class="text-red-400">${h.stuck_validators_count} (exit within 4 days!)</span>`;
+                    els['health-stuck'].innerHTML = `<span class="text-red-400">${h.stuck_validators_count} (exit within 4 days!)</span>`;
                 }
 
                 if (h.slashed_validators_count === 0) {
-                    document.getElementById('health-slashed').innerHTML = '<span class="text-green-400">0</span>';
+                    els['health-slashed'].innerHTML = '<span class="text-green-400">0</span>';
                 } else {
-                    document.getElementById('health-slashed').innerHTML = `<span class="text-red-400">${h.slashed_validators_count}</span>`;
+                    els['health-slashed'].innerHTML = `<span class="text-red-400">${h.slashed_validators_count}</span>`;
                 }
 
                 if (h.validators_at_risk_count === 0) {
-                    document.getElementById('health-at-risk').innerHTML = '<span class="text-green-400">0</span>';
+                    els['health-at-risk'].innerHTML = '<span class="text-green-400">0</span>';
                 } else {
-                    document.getElementById('health-at-risk').innerHTML = `<span class="text-yellow-400">${h.validators_at_risk_count}</span>`;
+                    els['health-at-risk'].innerHTML = `<span class="text-yellow-400">${h.validators_at_risk_count}</span>`;
                 }
 
                 // Strikes
-                const strikesDetailDiv = document.getElementById('strikes-detail');
+                const strikesDetailDiv = els['strikes-detail'];
                 if (h.strikes && h.strikes.total_validators_with_strikes === 0) {
-                    document.getElementById('health-strikes').innerHTML = '<span class="text-green-400">0 validators</span>';
+                    els['health-strikes'].innerHTML = '<span class="text-green-400">0 validators</span>';
                     strikesDetailDiv.classList.add('hidden');
                 } else if (h.strikes) {
                     const strikeParts = [];
@@ -770,7 +790,7 @@ def create_app() -> FastAPI:
                     const strikeStatus = strikeParts.length > 0 ? strikeParts.join(', ') : 'monitoring';
                     const strikeColor = h.strikes.validators_at_risk > 0 ? 'text-red-400' :
                         (h.strikes.validators_near_ejection > 0 ? 'text-orange-400' : 'text-yellow-400');
-                    document.getElementById('health-strikes').innerHTML =
+                    els['health-strikes'].innerHTML =
                         `<span class="${strikeColor}">${h.strikes.total_validators_with_strikes} validators (${strikeStatus})</span>`;
                     strikesDetailDiv.classList.remove('hidden');
                 }
@@ -805,14 +825,14 @@ def create_app() -> FastAPI:
                 const lifetimeRewardApy = data.apy.lifetime_reward_apy !== null && data.apy.lifetime_reward_apy !== undefined ? data.apy.lifetime_reward_apy.toFixed(2) + '%' : '--';
                 const lifetimeBondApy = data.apy.lifetime_bond_apy !== null && data.apy.lifetime_bond_apy !== undefined ? data.apy.lifetime_bond_apy.toFixed(2) + '%' : '--';
                 const lifetimeNetApy = data.apy.lifetime_net_apy !== null && data.apy.lifetime_net_apy !== undefined ? data.apy.lifetime_net_apy.toFixed(2) + '%' : '--';
-                historyTbody.innerHTML += `<tr class="border-t-2 border-gray-600 font-bold">
+                historyTbody.insertAdjacentHTML('beforeend', `<tr class="border-t-2 border-gray-600 font-bold">
                     <td class="py-2" colspan="2">Lifetime</td>
                     <td class="py-2 text-right text-yellow-400">${totalEth.toFixed(4)}</td>
                     <td class="py-2 text-right">--</td>
                     <td class="py-2 text-right text-green-400">${lifetimeRewardApy}</td>
                     <td class="py-2 text-right text-green-400">${lifetimeBondApy}</td>
                     <td class="py-2 text-right text-yellow-400">${lifetimeNetApy}</td>
-                </tr>`;
+                </tr>`);
 
                 historyTable.classList.remove('hidden');
                 historyLoaded = true;
@@ -871,9 +891,28 @@ def create_app() -> FastAPI:
             }
         }
 
+        // Recent lookups by request URL, so re-submitting skips the round trip
+        const LOOKUP_CACHE_TTL_MS = 30000;
+        const lookupCache = new Map();
+        const AUTO_LOAD_DETAILS_KEY = 'autoLoadDetails';
+        const autoLoadDetailsToggle = els['auto-load-details'];
+        autoLoadDetailsToggle.checked = localStorage.getItem(AUTO_LOAD_DETAILS_KEY) === '1';
+        autoLoadDetailsToggle.addEventListener('change', () => {
+            if (autoLoadDetailsToggle.checked) {
+                localStorage.setItem(AUTO_LOAD_DETAILS_KEY, '1');
+            } else {
+                localStorage.removeItem(AUTO_LOAD_DETAILS_KEY);
+            }
+        });
+
+        function showLookupResult(data, detailed) {
+            displayOperatorData(data);
+            if (detailed) renderDetails(data);
+        }
+
         form.addEventListener('submit', async (e) => {
             e.preventDefault();
-            const input = document.getElementById('address').value.trim();
+            const input = els['address'].value.trim();
 
             if (!input) return;
 
@@ -881,8 +920,19 @@ def create_app() -> FastAPI:
             loading.classList.remove('hidden');
             resetUI();
 
+            // Users who opted in to always seeing the details get them in the same request
+            const autoLoadDetails = autoLoadDetailsToggle.checked;
+            const url = `/api/operator/${input}` + (autoLoadDetails ? '?detailed=true' : '');
+
             try {
-                const response = await fetch(`/api/operator/${input}`, { signal: pageAbortController.signal });
+                const hit = lookupCache.get(url);
+                if (hit && Date.now() - hit.ts < LOOKUP_CACHE_TTL_MS) {
+                    loading.classList.add('hidden');
+                    showLookupResult(hit.data, autoLoadDetails);
+                    return;
+                }
+
+                const response = await fetch(url, { signal: pageAbortController.signal });
                 const data = await response.json();
 
                 loading.classList.add('hidden');
@@ -893,7 +943,8 @@ def create_app() -> FastAPI:
                     return;
                 }
 
-                displayOperatorData(data);
+                lookupCache.set(url, { data, ts: Date.now() });
+                showLookupResult(data, autoLoadDetails);
             } catch (err) {
                 if (isAbortError(err)) return;  // Page is unloading, ignore
                 loading.classList.add('hidden');
@@ -902,307 +953,312 @@ def create_app() -> FastAPI:
             }
         });
 
-        let isLoadingDetails = false;
-
-        loadDetailsBtn.addEventListener('click', async () => {
-            if (isLoadingDetails) return;
-            isLoadingDetails = true;
-
-            const operatorId = document.getElementById('operator-id').textContent;
+        // Populate the validator status, APY and health panels from a detailed response
+        function renderDetails(data) {
+            // Populate validator status
+            if (data.validators.by_status) {
+                els['status-active'].textContent = data.validators.by_status.active || 0;
+                els['status-pending'].textContent = data.validators.by_status.pending || 0;
+                els['status-exiting'].textContent = data.validators.by_status.exiting || 0;
+                els['status-exited'].textContent = data.validators.by_status.exited || 0;
+                els['status-slashed'].textContent = data.validators.by_status.slashed || 0;
+                els['status-unknown'].textContent = data.validators.by_status.unknown || 0;
+            }
 
-            // Show loading, hide button
-            loadDetailsBtn.classList.add('hidden');
-            detailsLoading.classList.remove('hidden');
+            // Show effectiveness if available
+            if (data.performance && data.performance.avg_effectiveness !== null) {
+                els['avg-effectiveness'].textContent = data.performance.avg_effectiveness.toFixed(1);
+                els['effectiveness-section'].classList.remove('hidden');
+            }
 
-            try {
-                const response = await fetch(`/api/operator/${operatorId}?detailed=true`, { signal: pageAbortController.signal });
-                const data = await response.json();
+            validatorStatus.classList.remove('hidden');
 
-                detailsLoading.classList.add('hidden');
+            // Build beaconcha.in dashboard URL with validator indices
+            if (data.validator_details && data.validator_details.length > 0) {
+                const validatorIds = data.validator_details
+                    .map(v => v.index !== null && v.index !== undefined ? v.index : v.pubkey)
+                    .slice(0, 100)
+                    .join(',');
+                beaconchainLink.href = `https://beaconcha.in/dashboard?validators=${validatorIds}`;
+                beaconchainLink.classList.remove('hidden');
+            }
 
-                if (!response.ok) {
-                    loadDetailsBtn.classList.remove('hidden');
-                    loadDetailsBtn.textContent = 'Failed - Click to Retry';
-                    return;
+            // Populate APY metrics if available
+            if (data.apy) {
+                els['reward-apy-28d'].textContent = formatApy(data.apy.historical_reward_apy_28d);
+                els['reward-apy-ltd'].textContent = formatApy(data.apy.historical_reward_apy_ltd);
+                els['bond-apy-28d'].textContent = formatApy(data.apy.bond_apy);
+                els['bond-apy-ltd'].textContent = formatApy(data.apy.bond_apy);
+                els['net-apy-28d'].textContent = formatApy(data.apy.net_apy_28d);
+                els['net-apy-ltd'].textContent = formatApy(data.apy.net_apy_ltd);
+
+                // Show next distribution info if available
+                if (data.apy.next_distribution_date || data.apy.next_distribution_est_eth) {
+                    if (data.apy.next_distribution_date) {
+                        const nextDate = new Date(data.apy.next_distribution_date);
+                        const options = { year: 'numeric', month: 'short', day: 'numeric' };
+                        els['next-dist-date'].textContent = nextDate.toLocaleDateString('en-US', options);
+                    }
+                    if (data.apy.next_distribution_est_eth) {
+                        els['next-dist-eth'].textContent = data.apy.next_distribution_est_eth.toFixed(4);
+                    }
+                    nextDistribution.classList.remove('hidden');
                 }
 
-                // Populate validator status
-                if (data.validators.by_status) {
-                    document.getElementById('status-active').textContent = data.validators.by_status.active || 0;
-                    document.getElementById('status-pending').textContent = data.validators.by_status.pending || 0;
-                    document.getElementById('status-exiting').textContent = data.validators.by_status.exiting || 0;
-                    document.getElementById('status-exited').textContent = data.validators.by_status.exited || 0;
-                    document.getElementById('status-slashed').textContent = data.validators.by_status.slashed || 0;
-                    document.getElementById('status-unknown').textContent = data.validators.by_status.unknown || 0;
-                }
+                apySection.classList.remove('hidden');
+                // Show history and withdrawal sections with toggles
+                historySection.classList.remove('hidden');
+                withdrawalSection.classList.remove('hidden');
+            }
 
-                // Show effectiveness if available
-                if (data.performance && data.performance.avg_effectiveness !== null) {
-                    document.getElementById('avg-effectiveness').textContent = data.performance.avg_effectiveness.toFixed(1);
-                    document.getElementById('effectiveness-section').classList.remove('hidden');
-                }
+            // Display Active Since date if available
+            if (data.active_since) {
+                const activeSince = new Date(data.active_since);
+                const options = { year: 'numeric', month: 'short', day: 'numeric' };
+                els['active-since'].textContent = activeSince.toLocaleDateString('en-US', options);
+                els['active-since-row'].classList.remove('hidden');
+            }
 
-                validatorStatus.classList.remove('hidden');
+            // Populate health status if available
+            if (data.health) {
+                const h = data.health;
 
-                // Build beaconcha.in dashboard URL with validator indices
-                if (data.validator_details && data.validator_details.length > 0) {
-                    const validatorIds = data.validator_details
-                        .map(v => v.index !== null && v.index !== undefined ? v.index : v.pubkey)
-                        .slice(0, 100)
-                        .join(',');
-                    beaconchainLink.href = `https://beaconcha.in/dashboard?validators=${validatorIds}`;
-                    beaconchainLink.classList.remove('hidden');
+                // Bond health
+                if (h.bond_healthy) {
+                    els['health-bond'].innerHTML = '<span class="text-green-400">HEALTHY</span>';
+                } else {
+                    els['health-bond'].innerHTML = `<span class="text-red-400">DEFICIT -${parseFloat(h.bond_deficit_eth).toFixed(4)} ETH</span>`;
                 }
 
-                // Populate APY metrics if available
-                if (data.apy) {
-                    document.getElementById('reward-apy-28d').textContent = formatApy(data.apy.historical_reward_apy_28d);
-                    document.getElementById('reward-apy-ltd').textContent = formatApy(data.apy.historical_reward_apy_ltd);
-                    document.getElementById('bond-apy-28d').textContent = formatApy(data.apy.bond_apy);
-                    document.getElementById('bond-apy-ltd').textContent = formatApy(data.apy.bond_apy);
-                    document.getElementById('net-apy-28d').textContent = formatApy(data.apy.net_apy_28d);
-                    document.getElementById('net-apy-ltd').textContent = formatApy(data.apy.net_apy_ltd);
-
-                    // Show next distribution info if available
-                    if (data.apy.next_distribution_date || data.apy.next_distribution_est_eth) {
-                        if (data.apy.next_distribution_date) {
-                            const nextDate = new Date(data.apy.next_distribution_date);
-                            const options = { year: 'numeric', month: 'short', day: 'numeric' };
-                            document.getElementById('next-dist-date').textContent = nextDate.toLocaleDateString('en-US', options);
-                        }
-                        if (data.apy.next_distribution_est_eth) {
-                            document.getElementById('next-dist-eth').textContent = data.apy.next_distribution_est_eth.toFixed(4);
-                        }
-                        nextDistribution.classList.remove('hidden');
-                    }
-
-                    apySection.classList.remove('hidden');
-                    // Show history and withdrawal sections with toggles
-                    historySection.classList.remove('hidden');
-                    withdrawalSection.classList.remove('hidden');
+                // Stuck validators
+                if (h.stuck_validators_count === 0) {
+                    els['health-stuck'].innerHTML = '<span class="text-green-400">0</span>';
+                } else {
+                    els['health-stuck'].innerHTML = `<span class="text-red-400">${h.stuck_validators_count} (exit within 4 days!)</span>`;
                 }
 
-                // Display Active Since date if available
-                if (data.active_since) {
-                    const activeSince = new Date(data.active_since);
-                    const options = { year: 'numeric', month: 'short', day: 'numeric' };
-                    document.getElementById('active-since').textContent = activeSince.toLocaleDateString('en-US', options);
-                    document.getElementById('active-since-row').classList.remove('hidden');
+                // Slashed
+                if (h.slashed_validators_count === 0) {
+                    els['health-slashed'].innerHTML = '<span class="text-green-400">0</span>';
+                } else {
+                    els['health-slashed'].innerHTML = `<span class="text-red-400">${h.slashed_validators_count}</span>`;
                 }
 
-                // Populate health status if available
-                if (data.health) {
-                    const h = data.health;
-
-                    // Bond health
-                    if (h.bond_healthy) {
-                        document.getElementById('health-bond').innerHTML = '<span class="text-green-400">HEALTHY</span>';
-                    } else {
-                        document.getElementById('health-bond').innerHTML = `<span class="text-red-400">DEFICIT -${parseFloat(h.bond_deficit_eth).toFixed(4)} ETH</span>`;
-                    }
+                // At risk
+                if (h.validators_at_risk_count === 0) {
+                    els['health-at-risk'].innerHTML = '<span class="text-green-400">0</span>';
+                } else {
+                    els['health-at-risk'].innerHTML = `<span class="text-yellow-400">${h.validators_at_risk_count}</span>`;
+                }
 
-                    // Stuck validators
-                    if (h.stuck_validators_count === 0) {
-                        document.getElementById('health-stuck').innerHTML = '<span class="text-green-400">0</span>';
-                    } else {
-                        document.getElementById('health-stuck').innerHTML = `<span class="text-red-400">${h.stuck_validators_count} (exit within 4 days!)</span>`;
-                    }
+                // Strikes
+                const strikesDetailDiv = els['strikes-detail'];
+                const toggleStrikesBtn = els['toggle-strikes'];
+                const strikesList = els['strikes-list'];
 
-                    // Slashed
-                    if (h.slashed_validators_count === 0) {
-                        document.getElementById('health-slashed').innerHTML = '<span class="text-green-400">0</span>';
-                    } else {
-                        document.getElementById('health-slashed').innerHTML = `<span class="text-red-400">${h.slashed_validators_count}</span>`;
+                if (h.strikes.total_validators_with_strikes === 0) {
+                    els['health-strikes'].innerHTML = '<span class="text-green-400">0 validators</span>';
+                    strikesDetailDiv.classList.add('hidden');
+                } else {
+                    // Build strike status message
+                    const strikeParts = [];
+                    if (h.strikes.validators_at_risk > 0) {
+                        strikeParts.push(`${h.strikes.validators_at_risk} at ejection`);
                     }
-
-                    // At risk
-                    if (h.validators_at_risk_count === 0) {
-                        document.getElementById('health-at-risk').innerHTML = '<span class="text-green-400">0</span>';
-                    } else {
-                        document.getElementById('health-at-risk').innerHTML = `<span class="text-yellow-400">${h.validators_at_risk_count}</span>`;
+                    if (h.strikes.validators_near_ejection > 0) {
+                        strikeParts.push(`${h.strikes.validators_near_ejection} near ejection`);
                     }
+                    const strikeStatus = strikeParts.length > 0 ? strikeParts.join(', ') : 'monitoring';
+                    const strikeColor = h.strikes.validators_at_risk > 0 ? 'text-red-400' :
+                        (h.strikes.validators_near_ejection > 0 ? 'text-orange-400' : 'text-yellow-400');
+                    els['health-strikes'].innerHTML =
+                        `<span class="${strikeColor}">${h.strikes.total_validators_with_strikes} validators (${strikeStatus})</span>`;
 
-                    // Strikes
-                    const strikesDetailDiv = document.getElementById('strikes-detail');
-                    const toggleStrikesBtn = document.getElementById('toggle-strikes');
-                    const strikesList = document.getElementById('strikes-list');
-
-                    if (h.strikes.total_validators_with_strikes === 0) {
-                        document.getElementById('health-strikes').innerHTML = '<span class="text-green-400">0 validators</span>';
-                        strikesDetailDiv.classList.add('hidden');
-                    } else {
-                        // Build strike status message
-                        const strikeParts = [];
-                        if (h.strikes.validators_at_risk > 0) {
-                            strikeParts.push(`${h.strikes.validators_at_risk} at ejection`);
-                        }
-                        if (h.strikes.validators_near_ejection > 0) {
-                            strikeParts.push(`${h.strikes.validators_near_ejection} near ejection`);
-                        }
-                        const strikeStatus = strikeParts.length > 0 ? strikeParts.join(', ') : 'monitoring';
-                        const strikeColor = h.strikes.validators_at_risk > 0 ? 'text-red-400' :
-                            (h.strikes.validators_near_ejection > 0 ? 'text-orange-400' : 'text-yellow-400');
-                        document.getElementById('health-strikes').innerHTML =
-                            `<span class="${strikeColor}">${h.strikes.total_validators_with_strikes} validators (${strikeStatus})</span>`;
-
-                        // Show the toggle button for strikes detail
-                        strikesDetailDiv.classList.remove('hidden');
-                        let strikesLoaded = false;
-
-                        const createStrikeRow = (validator, frameDates, defaultThreshold) => {
-                            const vThreshold = validator.strike_threshold || defaultThreshold;
-                            const colorClass = validator.at_ejection_risk ? 'text-red-400' :
-                                (validator.strike_count === vThreshold - 1 ? 'text-orange-400' : 'text-yellow-400');
-                            const pubkey = typeof validator.pubkey === 'string' ? validator.pubkey : '';
-                            const shortPubkey = pubkey.length > 18 ? `${pubkey.slice(0, 10)}...${pubkey.slice(-8)}` : pubkey;
-
-                            const row = document.createElement('div');
-                            row.className = `flex items-center gap-2 py-1.5 border-b border-gray-700 last:border-0 ${colorClass}`;
-
-                            const pubkeyText = document.createElement('span');
-                            pubkeyText.className = 'font-mono text-xs';
-                            pubkeyText.textContent = shortPubkey;
-                            row.appendChild(pubkeyText);
-
-                            const copyButton = document.createElement('button');
-                            copyButton.type = 'button';
-                            copyButton.className = 'text-gray-400 hover:text-white text-xs';
-                            copyButton.title = 'Copy full pubkey';
-                            copyButton.textContent = 'copy';
-                            copyButton.addEventListener('click', async () => {
-                                const originalText = copyButton.textContent;
-                                try {
-                                    await navigator.clipboard.writeText(pubkey);
-                                    copyButton.textContent = 'copied';
-                                } catch (copyErr) {
-                                    copyButton.textContent = 'error';
-                                }
-                                setTimeout(() => {
-                                    copyButton.textContent = originalText;
-                                }, 1000);
-                            });
-                            row.appendChild(copyButton);
-
-                            const beaconLink = document.createElement('a');
-                            beaconLink.href = `https://beaconcha.in/validator/${encodeURIComponent(pubkey)}`;
-                            beaconLink.target = '_blank';
-                            beaconLink.rel = 'noopener';
-                            beaconLink.className = 'text-blue-400 hover:text-blue-300 text-sm';
-                            beaconLink.title = 'View on beaconcha.in';
-                            beaconLink.textContent = 'open';
-                            row.appendChild(beaconLink);
-
-                            const dots = document.createElement('span');
-                            dots.className = 'flex gap-0.5 text-base ml-1';
-                            const strikeArray = Array.isArray(validator.strikes) ? validator.strikes : [];
-                            strikeArray.forEach((strike, i) => {
-                                const frame = frameDates && frameDates[i];
-                                const dateRange = frame ? `${frame.start} - ${frame.end}` : `Frame ${i + 1}`;
-                                const tooltip = `${dateRange}: ${strike ? 'Strike' : 'OK'}`;
-
-                                const dot = document.createElement('span');
-                                dot.className = `${strike ? 'text-red-500' : 'text-green-500'} cursor-help`;
-                                dot.title = tooltip;
-                                dot.textContent = '●';
-                                dots.appendChild(dot);
-                            });
-                            row.appendChild(dots);
-
-                            const count = document.createElement('span');
-                            count.className = 'text-gray-400 text-xs';
-                            count.textContent = `(${validator.strike_count}/${vThreshold})`;
-                            row.appendChild(count);
-
-                            return row;
-                        };
-
-                        // Function to load strikes data
-                        const loadStrikesData = async () => {
-                            if (strikesLoaded) return;
-                            strikesList.textContent = 'Loading...';
-                            strikesList.classList.remove('hidden');
+                    // Show the toggle button for strikes detail
+                    strikesDetailDiv.classList.remove('hidden');
+                    let strikesLoaded = false;
+
+                    const createStrikeRow = (validator, frameDates, defaultThreshold) => {
+                        const vThreshold = validator.strike_threshold || defaultThreshold;
+                        const colorClass = validator.at_ejection_risk ? 'text-red-400' :
+                            (validator.strike_count === vThreshold - 1 ? 'text-orange-400' : 'text-yellow-400');
+                        const pubkey = typeof validator.pubkey === 'string' ? validator.pubkey : '';
+                        const shortPubkey = pubkey.length > 18 ? `${pubkey.slice(0, 10)}...${pubkey.slice(-8)}` : pubkey;
+
+                        const row = document.createElement('div');
+                        row.className = `flex items-center gap-2 py-1.5 border-b border-gray-700 last:border-0 ${colorClass}`;
+
+                        const pubkeyText = document.createElement('span');
+                        pubkeyText.className = 'font-mono text-xs';
+                        pubkeyText.textContent = shortPubkey;
+                        row.appendChild(pubkeyText);
+
+                        const copyButton = document.createElement('button');
+                        copyButton.type = 'button';
+                        copyButton.className = 'text-gray-400 hover:text-white text-xs';
+                        copyButton.title = 'Copy full pubkey';
+                        copyButton.textContent = 'copy';
+                        copyButton.addEventListener('click', async () => {
+                            const originalText = copyButton.textContent;
                             try {
-                                const opId = document.getElementById('operator-id').textContent;
-                                const strikesResp = await fetch(`/api/operator/${opId}/strikes`, { signal: pageAbortController.signal });
-                                const strikesData = await strikesResp.json();
-                                const threshold = strikesData.strike_threshold || 3;
-                                const validators = Array.isArray(strikesData.validators) ? strikesData.validators : [];
-                                strikesList.textContent = '';
-
-                                if (validators.length === 0) {
-                                    strikesList.textContent = 'No strike details available';
-                                    strikesLoaded = true;
-                                    toggleStrikesBtn.textContent = 'Hide validator details ▲';
-                                    return;
-                                }
-
-                                const rows = document.createDocumentFragment();
-                                validators.forEach((validator) => {
-                                    rows.appendChild(createStrikeRow(validator, strikesData.frame_dates, threshold));
-                                });
-                                strikesList.appendChild(rows);
+                                await navigator.clipboard.writeText(pubkey);
+                                copyButton.textContent = 'copied';
+                            } catch (copyErr) {
+                                copyButton.textContent = 'error';
+                            }
+                            setTimeout(() => {
+                                copyButton.textContent = originalText;
+                            }, 1000);
+                        });
+                        row.appendChild(copyButton);
+
+                        const beaconLink = document.createElement('a');
+                        beaconLink.href = `https://beaconcha.in/validator/${encodeURIComponent(pubkey)}`;
+                        beaconLink.target = '_blank';
+                        beaconLink.rel = 'noopener';
+                        beaconLink.className = 'text-blue-400 hover:text-blue-300 text-sm';
+                        beaconLink.title = 'View on beaconcha.in';
+                        beaconLink.textContent = 'open';
+                        row.appendChild(beaconLink);
+
+                        const dots = document.createElement('span');
+                        dots.className = 'flex gap-0.5 text-base ml-1';
+                        const strikeArray = Array.isArray(validator.strikes) ? validator.strikes : [];
+                        strikeArray.forEach((strike, i) => {
+                            const frame = frameDates && frameDates[i];
+                            const dateRange = frame ? `${frame.start} - ${frame.end}` : `Frame ${i + 1}`;
+                            const tooltip = `${dateRange}: ${strike ? 'Strike' : 'OK'}`;
+
+                            const dot = document.createElement('span');
+                            dot.className = `${strike ? 'text-red-500' : 'text-green-500'} cursor-help`;
+                            dot.title = tooltip;
+                            dot.textContent = '●';
+                            dots.appendChild(dot);
+                        });
+                        row.appendChild(dots);
+
+                        const count = document.createElement('span');
+                        count.className = 'text-gray-400 text-xs';
+                        count.textContent = `(${validator.strike_count}/${vThreshold})`;
+                        row.appendChild(count);
+
+                        return row;
+                    };
+
+                    // Function to load strikes data
+                    const loadStrikesData = async () => {
+                        if (strikesLoaded) return;
+                        strikesList.textContent = 'Loading...';
+                        strikesList.classList.remove('hidden');
+                        try {
+                            const opId = els['operator-id'].textContent;
+                            const strikesResp = await fetch(`/api/operator/${opId}/strikes`, { signal: pageAbortController.signal });
+                            const strikesData = await strikesResp.json();
+                            const threshold = strikesData.strike_threshold || 3;
+                            const validators = Array.isArray(strikesData.validators) ? strikesData.validators : [];
+                            strikesList.textContent = '';
+
+                            if (validators.length === 0) {
+                                strikesList.textContent = 'No strike details available';
                                 strikesLoaded = true;
                                 toggleStrikesBtn.textContent = 'Hide validator details ▲';
-                            } catch (err) {
-                                if (isAbortError(err)) return;  // Page is unloading, ignore
-                                strikesList.textContent = 'Failed to load strikes';
+                                return;
                             }
-                        };
-
-                        // Auto-load strikes data when there are strikes
-                        loadStrikesData();
 
-                        // Remove old listener to prevent memory leak
-                        if (toggleStrikesBtn._clickHandler) {
-                            toggleStrikesBtn.removeEventListener('click', toggleStrikesBtn._clickHandler);
+                            const rows = document.createDocumentFragment();
+                            validators.forEach((validator) => {
+                                rows.appendChild(createStrikeRow(validator, strikesData.frame_dates, threshold));
+                            });
+                            strikesList.appendChild(rows);
+                            strikesLoaded = true;
+                            toggleStrikesBtn.textContent = 'Hide validator details ▲';
+                        } catch (err) {
+                            if (isAbortError(err)) return;  // Page is unloading, ignore
+                            strikesList.textContent = 'Failed to load strikes';
                         }
-                        toggleStrikesBtn._clickHandler = async () => {
-                            if (strikesList.classList.contains('hidden')) {
-                                // Expand
-                                if (!strikesLoaded) {
-                                    await loadStrikesData();
-                                } else {
-                                    strikesList.classList.remove('hidden');
-                                }
-                                toggleStrikesBtn.textContent = 'Hide validator details ▲';
+                    };
+
+                    // Auto-load strikes data when there are strikes
+                    loadStrikesData();
+
+                    // Remove old listener to prevent memory leak
+                    if (toggleStrikesBtn._clickHandler) {
+                        toggleStrikesBtn.removeEventListener('click', toggleStrikesBtn._clickHandler);
+                    }
+                    toggleStrikesBtn._clickHandler = async () => {
+                        if (strikesList.classList.contains('hidden')) {
+                            // Expand
+                            if (!strikesLoaded) {
+                                await loadStrikesData();
                             } else {
-                                // Collapse
-                                strikesList.classList.add('hidden');
-                                toggleStrikesBtn.textContent = 'Show validator details ▼';
+                                strikesList.classList.remove('hidden');
                             }
-                        };
-                        toggleStrikesBtn.addEventListener('click', toggleStrikesBtn._clickHandler);
-                    }
-
-                    // Overall - color-coded by severity
-                    const strikeThreshold = h.strikes.strike_threshold || 3;
-                    if (!h.has_issues) {
-                        document.getElementById('health-overall').innerHTML = '<span class="text-green-400">No issues detected</span>';
-                    } else if (
-                        !h.bond_healthy ||
-                        h.stuck_validators_count > 0 ||
-                        h.slashed_validators_count > 0 ||
-                        h.validators_at_risk_count > 0 ||
-                        h.strikes.max_strikes >= strikeThreshold
-                    ) {
-                        // Critical issues (red)
-                        let message = 'Issues detected - action required!';
-                        if (h.strikes.max_strikes >= strikeThreshold) {
-                            message = `Validator ejectable (${h.strikes.validators_at_risk} at ${strikeThreshold}/${strikeThreshold} strikes)`;
+                            toggleStrikesBtn.textContent = 'Hide validator details ▲';
+                        } else {
+                            // Collapse
+                            strikesList.classList.add('hidden');
+                            toggleStrikesBtn.textContent = 'Show validator details ▼';
                         }
-                        document.getElementById('health-overall').innerHTML = `<span class="text-red-400">${message}</span>`;
-                    } else if (h.strikes.max_strikes === strikeThreshold - 1) {
-                        // Warning level 2 (orange) - one more strike = ejectable
-                        document.getElementById('health-overall').innerHTML =
-                            `<span class="text-orange-400">Warning - ${h.strikes.validators_near_ejection} validator(s) at ${strikeThreshold - 1}/${strikeThreshold} strikes</span>`;
-                    } else {
-                        // Warning level 1 (yellow) - has strikes but not critical
-                        document.getElementById('health-overall').innerHTML =
-                            '<span class="text-yellow-400">Warning - validator(s) have strikes</span>';
+                    };
+                    toggleStrikesBtn.addEventListener('click', toggleStrikesBtn._clickHandler);
+                }
+
+                // Overall - color-coded by severity
+                const strikeThreshold = h.strikes.strike_threshold || 3;
+                if (!h.has_issues) {
+                    els['health-overall'].innerHTML = '<span class="text-green-400">No issues detected</span>';
+                } else if (
+                    !h.bond_healthy ||
+                    h.stuck_validators_count > 0 ||
+                    h.slashed_validators_count > 0 ||
+                    h.validators_at_risk_count > 0 ||
+                    h.strikes.max_strikes >= strikeThreshold
+                ) {
+                    // Critical issues (red)
+                    let message = 'Issues detected - action required!';
+                    if (h.strikes.max_strikes >= strikeThreshold) {
+                        message = `Validator ejectable (${h.strikes.validators_at_risk} at ${strikeThreshold}/${strikeThreshold} strikes)`;
                     }
+                    els['health-overall'].innerHTML = `<span class="text-red-400">${message}</span>`;
+                } else if (h.strikes.max_strikes === strikeThreshold - 1) {
+                    // Warning level 2 (orange) - one more strike = ejectable
+                    els['health-overall'].innerHTML =
+                        `<span class="text-orange-400">Warning - ${h.strikes.validators_near_ejection} validator(s) at ${strikeThreshold - 1}/${strikeThreshold} strikes</span>`;
+                } else {
+                    // Warning level 1 (yellow) - has strikes but not critical
+                    els['health-overall'].innerHTML =
+                        '<span class="text-yellow-400">Warning - validator(s) have strikes</span>';
+                }
+
+                healthSection.classList.remove('hidden');
+            }
+        }
+
+        let isLoadingDetails = false;
+
+        loadDetailsBtn.addEventListener('click', async () => {
+            if (isLoadingDetails) return;
+            isLoadingDetails = true;
+
+            const operatorId = els['operator-id'].textContent;
+
+            // Show loading, hide button
+            loadDetailsBtn.classList.add('hidden');
+            detailsLoading.classList.remove('hidden');
+
+            try {
+                const response = await fetch(`/api/operator/${operatorId}?detailed=true`, { signal: pageAbortController.signal });
+                const data = await response.json();
+
+                detailsLoading.classList.add('hidden');
 
-                    healthSection.classList.remove('hidden');
+                if (!response.ok) {
+                    loadDetailsBtn.classList.remove('hidden');
+                    loadDetailsBtn.textContent = 'Failed - Click to Retry';
+                    return;
                 }
+
+                renderDetails(data);
             } catch (err) {
                 if (isAbortError(err)) return;  // Page is unloading, ignore
                 detailsLoading.classList.add('hidden');
@@ -1223,7 +1279,7 @@ def create_app() -> FastAPI:
                 return;
             }
 
-            const operatorId = document.getElementById('operator-id').textContent;
+            const operatorId = els['operator-id'].textContent;
             historyLoading.classList.remove('hidden');
             historyTable.classList.add('hidden');
 
@@ -1262,24 +1318,24 @@ def create_app() -> FastAPI:
                 const lifetimeRewardApy = data.apy.lifetime_reward_apy !== null && data.apy.lifetime_reward_apy !== undefined ? data.apy.lifetime_reward_apy.toFixed(2) + '%' : '--';
                 const lifetimeBondApy = data.apy.lifetime_bond_apy !== null && data.apy.lifetime_bond_apy !== undefined ? data.apy.lifetime_bond_apy.toFixed(2) + '%' : '--';
                 const lifetimeNetApy = data.apy.lifetime_net_apy !== null && data.apy.lifetime_net_apy !== undefined ? data.apy.lifetime_net_apy.toFixed(2) + '%' : '--';
-                historyTbody.innerHTML += `<tr class="border-t-2 border-gray-600 font-bold">
+                historyTbody.insertAdjacentHTML('beforeend', `<tr class="border-t-2 border-gray-600 font-bold">
                     <td class="py-2" colspan="2">Lifetime</td>
                     <td class="py-2 text-right text-yellow-400">${totalEth.toFixed(4)}</td>
                     <td class="py-2 text-right">--</td>
                     <td class="py-2 text-right text-green-400">${lifetimeRewardApy}</td>
                     <td class="py-2 text-right text-green-400">${lifetimeBondApy}</td>
                     <td class="py-2 text-right text-yellow-400">${lifetimeNetApy}</td>
-                </tr>`;
+                </tr>`);
 
                 // Reveal and populate lifetime APY columns
                 if (data.apy) {
-                    document.getElementById('apy-lifetime-header').classList.remove('hidden');
-                    document.getElementById('reward-apy-ltd').textContent = formatApy(data.apy.lifetime_reward_apy);
-                    document.getElementById('reward-apy-ltd').classList.remove('hidden');
-                    document.getElementById('bond-apy-ltd').textContent = formatApy(data.apy.lifetime_bond_apy);
-                    document.getElementById('bond-apy-ltd').classList.remove('hidden');
-                    document.getElementById('net-apy-ltd').textContent = formatApy(data.apy.lifetime_net_apy);
-                    document.getElementById('net-apy-ltd').classList.remove('hidden');
+                    els['apy-lifetime-header'].classList.remove('hidden');
+                    els['reward-apy-ltd'].textContent = formatApy(data.apy.lifetime_reward_apy);
+                    els['reward-apy-ltd'].classList.remove('hidden');
+                    els['bond-apy-ltd'].textContent = formatApy(data.apy.lifetime_bond_apy);
+                    els['bond-apy-ltd'].classList.remove('hidden');
+                    els['net-apy-ltd'].textContent = formatApy(data.apy.lifetime_net_apy);
+                    els['net-apy-ltd'].classList.remove('hidden');
                 }
 
                 historyTable.classList.remove('hidden');
@@ -1306,7 +1362,7 @@ def create_app() -> FastAPI:
                 return;
             }
 
-            const operatorId = document.getElementById('operator-id').textContent;
+            const operatorId = els['operator-id'].textContent;
             withdrawalLoading.classList.remove('hidden');
             withdrawalTable.classList.add('hidden');
 
@@ -1377,10 +1433,10 @@ def create_app() -> FastAPI:
                 if (ethTotal > 0) totalStr += (totalStr ? ' + ' : '') + ethTotal.toFixed(4) + ' ETH';
                 if (!totalStr) totalStr = '0';
 
-                withdrawalTbody.innerHTML += `<tr class="border-t-2 border-gray-600 font-bold">
+                withdrawalTbody.insertAdjacentHTML('beforeend', `<tr class="border-t-2 border-gray-600 font-bold">
                     <td class="py-2" colspan="3">Total Claimed</td>
                     <td class="py-2 text-right text-yellow-400" colspan="2">${totalStr}</td>
-                </tr>`;
+                </tr>`);
 
                 withdrawalTable.classList.remove('hidden');
                 withdrawalsLoaded = true;
@@ -1394,11 +1450,11 @@ def create_app() -> FastAPI:
         });
 
         // ===== SAVED OPERATORS FUNCTIONALITY =====
-        const savedOperatorsSection = document.getElementById('saved-operators-section');
-        const savedOperatorsList = document.getElementById('saved-operators-list');
-        const savedOperatorsLoading = document.getElementById('saved-operators-loading');
-        const refreshAllBtn = document.getElementById('refresh-all-btn');
-        const saveOperatorBtn = document.getElementById('save-operator-btn');
+        const savedOperatorsSection = els['saved-operators-section'];
+        const savedOperatorsList = els['saved-operators-list'];
+        const savedOperatorsLoading = els['saved-operators-loading'];
+        const refreshAllBtn = els['refresh-all-btn'];
+        const saveOperatorBtn = els['save-operator-btn'];
 
         let currentOperatorSaved = false;
         let savedOperatorsData = {};  // Store operator data by ID for quick lookup
@@ -1514,13 +1570,13 @@ def create_app() -> FastAPI:
             const opData = savedOperatorsData[operatorId];
             if (!opData) {
                 // Fallback to API fetch if data not in cache
-                document.getElementById('address').value = operatorId;
+                els['address'].value = operatorId;
                 form.dispatchEvent(new Event('submit', { bubbles: true, cancelable: true }));
                 return;
             }
 
             // Display cached data directly
-            document.getElementById('address').value = operatorId;
+            els['address'].value = operatorId;
             resetUI();
             displayOperatorData(opData);
 
@@ -1576,7 +1632,7 @@ def create_app() -> FastAPI:
                     }
 
                     // Update save button if viewing this operator
-                    const currentOpId = document.getElementById('operator-id').textContent;
+                    const currentOpId = els['operator-id'].textContent;
                     if (currentOpId == operatorId) {
                         currentOperatorSaved = false;
                         updateSaveButton();
@@ -1596,28 +1652,23 @@ def create_app() -> FastAPI:
             const originalText = refreshAllBtn.textContent;
             refreshAllBtn.disabled = true;
 
-            const cards = savedOperatorsList.querySelectorAll('[data-operator-id]');
-            const total = cards.length;
-            let current = 0;
+            refreshAllBtn.innerHTML = `<span class="inline-block animate-spin mr-1">&#8635;</span> Refreshing...`;
 
-            for (const card of cards) {
-                current++;
-                refreshAllBtn.innerHTML = `<span class="inline-block animate-spin mr-1">&#8635;</span> ${current}/${total}`;
-
-                const operatorId = card.dataset.operatorId;
-                try {
-                    const response = await fetch(`/api/operator/${operatorId}/refresh`, { method: 'POST', signal: pageAbortController.signal });
-                    if (response.ok) {
-                        const data = await response.json();
-                        if (data.data) {
-                            data.data._updated_at = new Date().toISOString();
-                            savedOperatorsData[operatorId] = data.data;  // Update stored data
-                            card.outerHTML = renderSavedOperatorCard(data.data);
-                        }
+            try {
+                const response = await fetch('/api/saved-operators/refresh', { method: 'POST', signal: pageAbortController.signal });
+                if (response.ok) {
+                    const result = await response.json();
+                    const updatedAt = new Date().toISOString();
+                    for (const [operatorId, data] of Object.entries(result.operators || {})) {
+                        data._updated_at = updatedAt;
+                        savedOperatorsData[operatorId] = data;  // Update stored data
+                        const card = savedOperatorsList.querySelector(`[data-operator-id="${operatorId}"]`);
+                        if (card) card.outerHTML = renderSavedOperatorCard(data);
                     }
-                } catch (err) {
-                    if (isAbortError(err)) break;  // Page is unloading, stop loop
-                    console.error(`Failed to refresh operator ${operatorId}:`, err);
+                }
+            } catch (err) {
+                if (!isAbortError(err)) {
+                    console.error('Failed to refresh saved operators:', err);
                 }
             }
 
@@ -1654,7 +1705,7 @@ def create_app() -> FastAPI:
 
         // Save/unsave operator button handler
         saveOperatorBtn.addEventListener('click', async () => {
-            const operatorId = document.getElementById('operator-id').textContent;
+            const operatorId = els['operator-id'].textContent;
             if (!operatorId) return;
 
             saveOperatorBtn.disabled = true;
@@ -1698,7 +1749,7 @@ def create_app() -> FastAPI:
         form.addEventListener('submit', async (e) => {
             // Wait a bit for the results to load, then check if saved
             setTimeout(async () => {
-                const operatorId = document.getElementById('operator-id').textContent;
+                const operatorId = els['operator-id'].textContent;
                 if (operatorId) {
                     await checkIfOperatorSaved(operatorId);
                 }
@@ -1710,7 +1761,117 @@ def create_app() -> FastAPI:
     </script>
 </body>
 </html>
-        """
-        return html.replace("__APP_VERSION__", __version__)
+        """.replace("__APP_VERSION__", __version__).encode("utf-8")
+
+# Strong validator for the page; it only changes when the app version or markup does
+_INDEX_ETAG = '"' + hashlib.blake2b(_INDEX_HTML, digest_size=8).hexdigest() + '"'
+_INDEX_CACHE_CONTROL = "public, max-age=300, stale-while-revalidate=86400"
+
+# Compressed once at max level since it is never recomputed; a different
+# encoding is a different representation, so it gets its own ETag
+_INDEX_HTML_GZIP = gzip.compress(_INDEX_HTML, compresslevel=9, mtime=0)
+_INDEX_GZIP_ETAG = _INDEX_ETAG[:-1] + '-gzip"'
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q=0 refusals."""
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+class _NegotiatingGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that respects an explicit gzip;q=0 refusal.
+
+    Starlette compresses whenever "gzip" appears anywhere in Accept-Encoding.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not _accepts_gzip(Headers(scope=scope).get("accept-encoding", "")):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Declared once at import; create_app() only includes it
+index_router = APIRouter()
+
+
+@index_router.get("/", response_class=HTMLResponse)
+async def index(request: Request):
+    """Serve the dashboard page, gzipped when accepted and 304 on a matching ETag."""
+    logger.debug("Serving index page")
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        content, etag = _INDEX_HTML_GZIP, _INDEX_GZIP_ETAG
+        headers = {"Content-Encoding": "gzip"}
+    else:
+        content, etag = _INDEX_HTML, _INDEX_ETAG
+        headers = {}
+    headers.update({"ETag": etag, "Cache-Control": _INDEX_CACHE_CONTROL, "Vary": "Accept-Encoding"})
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="text/html; charset=utf-8", headers=headers)
+
+
+def create_app() -> FastAPI:
+    """Create and configure the FastAPI application."""
+    app = FastAPI(
+        title="CSM Operator Dashboard",
+        description="Track your Lido CSM validator earnings",
+        version=__version__,
+        default_response_class=ORJSONResponse,
+    )
+
+    # Compress API JSON (detailed lookups with validator lists get large); the
+    # index page is already pre-compressed and passes through untouched.
+    # Added before the logging middleware so it sits inside it: that middleware
+    # re-streams bodies, which would hide their size from minimum_size.
+    app.add_middleware(_NegotiatingGZipMiddleware, minimum_size=512, compresslevel=5)
+
+    # Add request logging middleware
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        logger.info(f"Request: {request.method} {request.url.path}")
+        try:
+            response = await call_next(request)
+            logger.info(f"Response: {request.method} {request.url.path} -> {response.status_code}")
+            return response
+        except Exception as e:
+            logger.error(f"Request failed: {request.method} {request.url.path} -> {e}")
+            raise
+
+    app.include_router(router, prefix="/api")
+    app.include_router(index_router)
+
+    # Mount static files for favicon and images
+    img_dir = Path(__file__).parent.parent.parent / "img"
+    if img_dir.exists():
+        app.mount("/img", StaticFiles(directory=str(img_dir)), name="img")
+
+    background_tasks: list[asyncio.Task] = []
+
+    @app.on_event("startup")
+    async def startup_event():
+        logger.info("CSM Dashboard starting up")
+        background_tasks.append(asyncio.create_task(watch_rewards_tree()))
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        logger.info("CSM Dashboard shutting down")
+        for task in background_tasks:
+            task.cancel()
+        await asyncio.gather(*background_tasks, return_exceptions=True)
+        background_tasks.clear()
+        await close_client()
 
     return app
@@ -1,9 +1,23 @@
 """Identifier parsing and validation helpers for web routes."""
 
+import re
+from functools import lru_cache
+
 from fastapi import HTTPException
 from web3 import Web3
 
 MAX_OPERATOR_ID = 1_000_000
+ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+@lru_cache(maxsize=1024)
+def _has_valid_checksum(address: str) -> bool:
+    """EIP-55 check for mixed-case addresses (memoized: it hashes with Keccak)."""
+    body = address[2:]
+    if body.islower() or body.isupper():
+        # Single-case addresses carry no checksum
+        return True
+    return Web3.is_checksum_address(address)
 
 
 def parse_operator_identifier(identifier: str) -> tuple[str, int | str]:
@@ -15,8 +29,10 @@ def parse_operator_identifier(identifier: str) -> tuple[str, int | str]:
         return ("id", operator_id)
 
     if identifier.startswith("0x"):
-        if not Web3.is_address(identifier):
+        if not ADDRESS_RE.fullmatch(identifier) or not _has_valid_checksum(identifier):
             raise HTTPException(status_code=400, detail="Invalid Ethereum address")
-        return ("address", Web3.to_checksum_address(identifier))
+        # Addresses are compared case-insensitively, so return them lowercased
+        # rather than checksummed (one cache key per address)
+        return ("address", identifier.lower())
 
     raise HTTPException(status_code=400, detail="Invalid identifier format")
@@ -0,0 +1,33 @@
+"""Response classes shared by the web app and API routes."""
+
+import json
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def render_json(content: Any) -> bytes:
+    """Encode content as compact JSON bytes, with orjson where it can.
+
+    orjson rejects integers wider than 64 bits, which share amounts
+    (cumulative_rewards_shares etc.) reach for large operators; those payloads
+    fall back to the stdlib encoder with Starlette's JSONResponse settings.
+    """
+    try:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+        ).encode("utf-8")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse encoded with orjson instead of the stdlib json module.
+
+    FastAPI's own ORJSONResponse is deprecated in favour of response models,
+    which the API routes here don't declare (they return plain dicts).
+    """
+
+    def render(self, content: Any) -> bytes:
+        return render_json(content)
@@ -1,13 +1,17 @@
 """API endpoints for the web interface."""
 
+import hashlib
+import itertools
 import logging
 import time
+from decimal import Decimal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 logger = logging.getLogger(__name__)
 
 from ..core.version import __version__
+from ..data.cache import cached
 from ..data.database import (
     delete_operator,
     get_saved_operators,
@@ -16,8 +20,9 @@ from ..data.database import (
     update_operator_data,
 )
 from ..data.price import get_eth_price
-from ..services.operator_service import OperatorService
+from ..services.operator_service import OperatorService, invalidate_apy_metrics
 from .identifiers import parse_operator_identifier
+from .responses import render_json
 
 router = APIRouter()
 
@@ -25,6 +30,19 @@ router = APIRouter()
 _REFRESH_COOLDOWN_SECONDS = 60
 _last_refresh_time: dict[int, float] = {}
 
+# Concurrent full (history + withdrawals) lookups when refreshing all saved operators
+_REFRESH_ALL_CONCURRENCY = 4
+
+# Lets the browser reuse an operator lookup for repeat submits of the same input
+_OPERATOR_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=120"
+
+# How long a built operator response is reused for repeat lookups
+_OPERATOR_RESPONSE_TTL_SECONDS = 30
+
+# The operator list only changes when a new rewards tree is published
+_OPERATORS_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=600"
+_OPERATORS_RESPONSE_TTL_SECONDS = 600
+
 
 def _check_refresh_cooldown(operator_id: int) -> None:
     """Raise 429 if this operator was refreshed within the cooldown window."""
@@ -42,9 +60,19 @@ def _record_refresh(operator_id: int) -> None:
     _last_refresh_time[operator_id] = time.monotonic()
 
 
+def _invalidate_operator_response(operator_id: int) -> None:
+    """Drop cached /operator/{id} responses so the next lookup sees refreshed data.
+
+    Entries looked up by address simply age out with the short TTL.
+    """
+    for flags in itertools.product((False, True), repeat=3):
+        _operator_response_body.invalidate("id", operator_id, *flags)
+
+
 @router.get("/operator/{identifier}")
 async def get_operator(
     identifier: str,
+    request: Request,
     detailed: bool = Query(False, description="Include validator status from beacon chain"),
     history: bool = Query(False, description="Include all historical distribution frames"),
     withdrawals: bool = Query(False, description="Include withdrawal/claim history"),
@@ -59,9 +87,58 @@ async def get_operator(
     - Add ?withdrawals=true to include withdrawal/claim history
     """
     logger.info(f"Get operator: {identifier}, detailed={detailed}, history={history}, withdrawals={withdrawals}")
+    id_type, parsed_identifier = parse_operator_identifier(identifier)
+
+    body, etag = await _operator_response_body(id_type, parsed_identifier, detailed, history, withdrawals)
+    return _etag_response(request, body, etag, _OPERATOR_CACHE_CONTROL)
+
+
+def _etag_response(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """Return a pre-encoded JSON body, or an empty 304 if the client already has it."""
+    # Data only changes when a new rewards tree lands, so repeat views revalidate
+    # to an empty 304
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _weak_etag(body: bytes) -> str:
+    """Weak ETag for a JSON body (weak, because GZipMiddleware may re-encode it)."""
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _format_eth(value: float) -> str:
+    """Format an ETH amount as a plain decimal string, never in scientific notation.
+
+    Keeps the API's string format from when these fields were Decimals
+    ("0.00001" rather than str(float)'s "1e-05").
+    """
+    return format(Decimal(repr(value)).normalize(), "f")
+
+
+@cached(ttl=_OPERATOR_RESPONSE_TTL_SECONDS)
+async def _operator_response_body(
+    id_type: str, parsed_identifier: int | str, detailed: bool, history: bool, withdrawals: bool
+) -> tuple[bytes, str]:
+    """Build, encode and tag an /operator/{identifier} response.
+
+    Cached briefly so repeat lookups of a hot operator skip upstream work and
+    JSON encoding, and concurrent identical requests (double-clicks, several
+    viewers) share one build, including the address scan and active_since
+    lookup. Always call with positional arguments so the cache key is consistent.
+    """
+    result = await _build_operator_response(id_type, parsed_identifier, detailed, history, withdrawals)
+    body = render_json(result)
+    return body, _weak_etag(body)
+
+
+async def _build_operator_response(
+    id_type: str, parsed_identifier: int | str, detailed: bool, history: bool, withdrawals: bool
+) -> dict:
+    """Look up an operator and build the /operator/{identifier} response body."""
     service = OperatorService()
 
-    id_type, parsed_identifier = parse_operator_identifier(identifier)
     if id_type == "id":
         operator_id = parsed_identifier
         rewards = await service.get_operator_by_id(operator_id, detailed or history, history, withdrawals)
@@ -79,16 +156,16 @@ async def get_operator(
         "curve_id": rewards.curve_id,
         "operator_type": rewards.operator_type,
         "rewards": {
-            "current_bond_eth": str(rewards.current_bond_eth),
-            "required_bond_eth": str(rewards.required_bond_eth),
-            "excess_bond_eth": str(rewards.excess_bond_eth),
+            "current_bond_eth": _format_eth(rewards.current_bond_eth),
+            "required_bond_eth": _format_eth(rewards.required_bond_eth),
+            "excess_bond_eth": _format_eth(rewards.excess_bond_eth),
             "cumulative_rewards_shares": rewards.cumulative_rewards_shares,
-            "cumulative_rewards_eth": str(rewards.cumulative_rewards_eth),
+            "cumulative_rewards_eth": _format_eth(rewards.cumulative_rewards_eth),
             "distributed_shares": rewards.distributed_shares,
-            "distributed_eth": str(rewards.distributed_eth),
+            "distributed_eth": _format_eth(rewards.distributed_eth),
             "unclaimed_shares": rewards.unclaimed_shares,
-            "unclaimed_eth": str(rewards.unclaimed_eth),
-            "total_claimable_eth": str(rewards.total_claimable_eth),
+            "unclaimed_eth": _format_eth(rewards.unclaimed_eth),
+            "total_claimable_eth": _format_eth(rewards.total_claimable_eth),
         },
         "validators": {
             "total": rewards.total_validators,
@@ -119,7 +196,7 @@ async def get_operator(
     # Add APY metrics if available
     if rewards.apy:
         # Use actual excess bond for lifetime values (estimates for previous/current)
-        lifetime_bond = float(rewards.excess_bond_eth)
+        lifetime_bond = rewards.excess_bond_eth
         lifetime_net_total = (rewards.apy.lifetime_distribution_eth or 0) + lifetime_bond
         result["apy"] = {
             "previous_distribution_eth": rewards.apy.previous_distribution_eth,
@@ -243,11 +320,23 @@ async def get_operator(
 
 
 @router.get("/operators")
-async def list_operators():
+async def list_operators(request: Request):
     """List all operators with rewards in the current tree."""
+    body, etag = await _operators_response_body()
+    return _etag_response(request, body, etag, _OPERATORS_CACHE_CONTROL)
+
+
+@cached(ttl=_OPERATORS_RESPONSE_TTL_SECONDS)
+async def _operators_response_body() -> tuple[bytes, str]:
+    """Build, encode and tag the /operators response.
+
+    Cached so polling clients get stored bytes instead of a fresh scan of the
+    rewards tree and JSON encoding; concurrent misses share one build.
+    """
     service = OperatorService()
     operator_ids = await service.get_all_operators_with_rewards()
-    return {"count": len(operator_ids), "operator_ids": operator_ids}
+    body = render_json({"count": len(operator_ids), "operator_ids": operator_ids})
+    return body, _weak_etag(body)
 
 
 @router.get("/operator/{identifier}/strikes")
@@ -321,16 +410,16 @@ def _build_operator_data_dict(rewards) -> dict:
         "curve_id": rewards.curve_id,
         "operator_type": rewards.operator_type,
         "rewards": {
-            "current_bond_eth": str(rewards.current_bond_eth),
-            "required_bond_eth": str(rewards.required_bond_eth),
-            "excess_bond_eth": str(rewards.excess_bond_eth),
+            "current_bond_eth": _format_eth(rewards.current_bond_eth),
+            "required_bond_eth": _format_eth(rewards.required_bond_eth),
+            "excess_bond_eth": _format_eth(rewards.excess_bond_eth),
             "cumulative_rewards_shares": rewards.cumulative_rewards_shares,
-            "cumulative_rewards_eth": str(rewards.cumulative_rewards_eth),
+            "cumulative_rewards_eth": _format_eth(rewards.cumulative_rewards_eth),
             "distributed_shares": rewards.distributed_shares,
-            "distributed_eth": str(rewards.distributed_eth),
+            "distributed_eth": _format_eth(rewards.distributed_eth),
             "unclaimed_shares": rewards.unclaimed_shares,
-            "unclaimed_eth": str(rewards.unclaimed_eth),
-            "total_claimable_eth": str(rewards.total_claimable_eth),
+            "unclaimed_eth": _format_eth(rewards.unclaimed_eth),
+            "total_claimable_eth": _format_eth(rewards.total_claimable_eth),
         },
         "validators": {
             "total": rewards.total_validators,
@@ -530,7 +619,9 @@ async def refresh_operator_endpoint(identifier: str):
 
     _check_refresh_cooldown(operator_id)
 
-    # Fetch fresh data with history and withdrawals
+    # Fetch fresh data with history and withdrawals (recomputing the cached
+    # APY metrics too, in case the cached ones were built from partial data)
+    invalidate_apy_metrics(operator_id)
     rewards = await service.get_operator_by_id(
         operator_id,
         include_validators=True,
@@ -547,16 +638,68 @@ async def refresh_operator_endpoint(identifier: str):
     withdrawals_count = len(data.get("withdrawals", []))
     logger.info(f"Refreshing operator {operator_id}: {frames_count} frames, {withdrawals_count} withdrawals")
     _record_refresh(operator_id)
+    _invalidate_operator_response(operator_id)
     await update_operator_data(operator_id, data)
 
     return {"status": "refreshed", "operator_id": operator_id, "data": data}
 
 
+@router.post("/saved-operators/refresh")
+async def refresh_all_saved_operators():
+    """Refresh the cached data for every saved operator.
+
+    Operators are fetched concurrently (bounded) instead of one request per
+    operator. Operators still in their refresh cooldown are skipped.
+    """
+    saved = await get_saved_operators()
+    now = time.monotonic()
+    operator_ids = []
+    skipped = []
+    for op in saved:
+        operator_id = op.get("operator_id")
+        if operator_id is None:
+            continue
+        if now - _last_refresh_time.get(operator_id, 0.0) < _REFRESH_COOLDOWN_SECONDS:
+            skipped.append(operator_id)
+        else:
+            operator_ids.append(operator_id)
+
+    logger.info(f"Refreshing {len(operator_ids)} saved operators ({len(skipped)} in cooldown)")
+    for operator_id in operator_ids:
+        invalidate_apy_metrics(operator_id)
+    service = OperatorService()
+    results = await service.get_operators_batch(
+        operator_ids,
+        include_validators=True,
+        include_history=True,
+        include_withdrawals=True,
+        concurrency=_REFRESH_ALL_CONCURRENCY,
+    )
+
+    refreshed = {}
+    failed = []
+    for operator_id, rewards in zip(operator_ids, results):
+        if rewards is None:
+            failed.append(operator_id)
+            continue
+        data = _build_operator_data_dict(rewards)
+        _record_refresh(operator_id)
+        _invalidate_operator_response(operator_id)
+        await update_operator_data(operator_id, data)
+        refreshed[str(operator_id)] = data
+
+    return {"status": "refreshed", "operators": refreshed, "skipped": skipped, "failed": failed}
+
+
+# Probes hit this constantly; the body never changes, so skip JSON encoding
+_HEALTHY_BODY = b'{"status":"healthy"}'
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
     logger.debug("Health check called")
-    return {"status": "healthy"}
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
 
 
 @router.get("/price/eth")
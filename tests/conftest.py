@@ -21,9 +21,9 @@ def sample_bond_summary():
     return BondSummary(
         current_bond_wei=26269317414398397106,
         required_bond_wei=26200000000000000000,
-        current_bond_eth=Decimal("26.269317414398397106"),
-        required_bond_eth=Decimal("26.2"),
-        excess_bond_eth=Decimal("0.069317414398397106"),
+        current_bond_eth=26.269317414398397,
+        required_bond_eth=26.2,
+        excess_bond_eth=0.069317414398397,
     )
 
 
@@ -82,12 +82,12 @@ def sample_operator_rewards(sample_bond_summary, sample_health_status, sample_ap
         required_bond_eth=sample_bond_summary.required_bond_eth,
         excess_bond_eth=sample_bond_summary.excess_bond_eth,
         cumulative_rewards_shares=1234567890,
-        cumulative_rewards_eth=Decimal("10.96"),
+        cumulative_rewards_eth=10.96,
         distributed_shares=1000000000,
-        distributed_eth=Decimal("9.61"),
+        distributed_eth=9.61,
         unclaimed_shares=234567890,
-        unclaimed_eth=Decimal("1.35"),
-        total_claimable_eth=Decimal("1.419317414398397106"),
+        unclaimed_eth=1.35,
+        total_claimable_eth=1.419317414398397,
         total_validators=500,
         active_validators=500,
         exited_validators=0,
@@ -0,0 +1,117 @@
+"""Tests for the FastAPI app's index page."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.web.app import _accepts_gzip, create_app
+from src.web.responses import ORJSONResponse
+
+
+def test_index_sets_etag_and_cache_control():
+    client = TestClient(create_app())
+
+    response = client.get("/")
+
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert "max-age=300" in response.headers["cache-control"]
+    assert b"__APP_VERSION__" not in response.content
+
+
+def test_index_auto_load_details_is_an_explicit_toggle():
+    html = TestClient(create_app()).get("/").text
+
+    assert 'id="auto-load-details"' in html
+    # Only the toggle writes the preference, and unchecking it clears it
+    assert html.count("localStorage.setItem(AUTO_LOAD_DETAILS_KEY") == 1
+    assert "localStorage.removeItem(AUTO_LOAD_DETAILS_KEY)" in html
+
+
+def test_index_returns_304_for_matching_etag():
+    client = TestClient(create_app())
+    etag = client.get("/").headers["etag"]
+
+    response = client.get("/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+def test_index_serves_precompressed_gzip():
+    client = TestClient(create_app())
+
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    compressed = client.get("/", headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    # httpx transparently decodes the body
+    assert compressed.content == plain.content
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate, br", True),
+    ("br;q=1.0, GZIP;q=0.5", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("gzip; q=0.0, *", False),
+    ("*;q=0", False),
+    ("identity", False),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(header) is expected
+
+
+def test_index_respects_gzip_refusal():
+    client = TestClient(create_app())
+
+    response = client.get("/", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == client.get("/", headers={"Accept-Encoding": "identity"}).headers["etag"]
+
+
+def test_api_json_is_gzipped_when_accepted(monkeypatch):
+    from src.web import routes
+
+    # Stand-in payload big enough to cross the middleware's minimum size
+    monkeypatch.setattr(routes, "get_eth_price", AsyncMock(return_value="9" * 1000))
+    client = TestClient(create_app())
+
+    response = client.get("/api/price/eth", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json()["price"] == "9" * 1000
+
+    refused = client.get("/api/price/eth", headers={"Accept-Encoding": "gzip;q=0"})
+    assert "content-encoding" not in refused.headers
+
+
+def test_json_response_handles_integers_beyond_64_bits():
+    shares = 123456789012345678901234
+
+    assert ORJSONResponse({"shares": 1}).body == b'{"shares":1}'
+    assert ORJSONResponse({"shares": shares}).body == b'{"shares":%d}' % shares
+
+
+def test_health_check():
+    client = TestClient(create_app())
+
+    response = client.get("/api/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "healthy"}
+
+
+def test_small_api_responses_are_not_gzipped():
+    client = TestClient(create_app())
+
+    response = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
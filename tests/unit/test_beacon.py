@@ -0,0 +1,104 @@
+"""Tests for the beacon chain data provider."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.data import beacon
+from src.data.beacon import (
+    BeaconDataProvider,
+    ValidatorInfo,
+    ValidatorStatus,
+    aggregate_validator_status,
+    calculate_avg_effectiveness,
+    summarize_validators,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_validator_cache(monkeypatch):
+    monkeypatch.setattr(beacon, "_validator_cache", beacon._EpochValidatorCache())
+
+
+def _make_provider(api_key: str | None):
+    provider = BeaconDataProvider.__new__(BeaconDataProvider)
+    provider.settings = type("Settings", (), {"beacon_api_key": api_key})()
+    provider._get_validator_batch = AsyncMock(
+        side_effect=lambda batch: [ValidatorInfo(pubkey=pk) for pk in batch]
+    )
+    return provider
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("api_key", ["key", None])
+async def test_get_validators_by_pubkeys_batches_and_preserves_order(api_key, monkeypatch):
+    monkeypatch.setattr("src.data.beacon.asyncio.sleep", AsyncMock())
+    provider = _make_provider(api_key)
+    pubkeys = [f"0x{i:04x}" for i in range(250)]
+
+    validators = await provider.get_validators_by_pubkeys(pubkeys)
+
+    assert [v.pubkey for v in validators] == pubkeys
+    batch_sizes = [len(call.args[0]) for call in provider._get_validator_batch.call_args_list]
+    assert batch_sizes == [100, 100, 50]
+
+
+@pytest.mark.asyncio
+async def test_get_validators_by_pubkeys_empty():
+    provider = _make_provider(None)
+
+    assert await provider.get_validators_by_pubkeys([]) == []
+    provider._get_validator_batch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_validators_by_pubkeys_caches_within_epoch(monkeypatch):
+    epoch = 100
+    monkeypatch.setattr(beacon, "current_epoch", lambda: epoch)
+    provider = _make_provider("key")
+    provider._get_validator_batch = AsyncMock(
+        side_effect=lambda batch: [
+            ValidatorInfo(pubkey=pk, status=ValidatorStatus.ACTIVE_ONGOING) for pk in batch
+        ]
+    )
+
+    await provider.get_validators_by_pubkeys(["0xa", "0xb"])
+    validators = await provider.get_validators_by_pubkeys(["0xb", "0xa", "0xc"])
+
+    assert [v.pubkey for v in validators] == ["0xb", "0xa", "0xc"]
+    fetched = [call.args[0] for call in provider._get_validator_batch.call_args_list]
+    assert fetched == [("0xa", "0xb"), ("0xc",)]
+
+    # A new epoch invalidates everything
+    epoch = 101
+    await provider.get_validators_by_pubkeys(["0xa"])
+    assert provider._get_validator_batch.call_args_list[-1].args[0] == ("0xa",)
+
+
+@pytest.mark.asyncio
+async def test_get_validators_by_pubkeys_does_not_cache_unknown():
+    provider = _make_provider("key")  # Returns UNKNOWN status, as on fetch failure
+
+    await provider.get_validators_by_pubkeys(["0xa"])
+    await provider.get_validators_by_pubkeys(["0xa"])
+
+    assert provider._get_validator_batch.call_count == 2
+
+
+def test_summarize_validators_matches_separate_helpers():
+    validators = [
+        ValidatorInfo(pubkey="a", status=ValidatorStatus.ACTIVE_ONGOING, effectiveness=98.0),
+        ValidatorInfo(pubkey="b", status=ValidatorStatus.ACTIVE_EXITING, effectiveness=90.0),
+        ValidatorInfo(pubkey="c", status=ValidatorStatus.ACTIVE_SLASHED, effectiveness=50.0),
+        ValidatorInfo(pubkey="d", status=ValidatorStatus.PENDING_QUEUED),
+        ValidatorInfo(pubkey="e", status=ValidatorStatus.EXITED_UNSLASHED, effectiveness=99.0),
+        ValidatorInfo(pubkey="f", status=ValidatorStatus.EXITED_SLASHED),
+        ValidatorInfo(pubkey="g", status=ValidatorStatus.UNKNOWN),
+    ]
+
+    counts, avg = summarize_validators(validators)
+
+    assert counts == aggregate_validator_status(validators)
+    assert counts == {"active": 1, "pending": 1, "exiting": 1, "exited": 1, "slashed": 2, "unknown": 1}
+    assert avg == calculate_avg_effectiveness(validators)
+    assert summarize_validators([]) == (aggregate_validator_status([]), None)
@@ -1,10 +1,11 @@
 """Tests for the cache module."""
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import patch
 
-from src.data.cache import SimpleCache, _MISSING, cached, get_cache
+from src.data.cache import SimpleCache, _MISSING, cached, coalesced, get_cache
 
 
 class TestSimpleCache:
@@ -151,6 +152,132 @@ class TestCachedDecorator:
         assert result2 == 15
         assert call_count == 2  # Different kwargs = different cache key
 
+    @pytest.mark.asyncio
+    async def test_cached_decorator_coalesces_concurrent_calls(self):
+        """Test that concurrent calls with the same arguments share one execution."""
+        call_count = 0
+
+        @cached(ttl=300)
+        async def my_function(x):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        results = await asyncio.gather(*(my_function(5) for _ in range(5)), my_function(6))
+
+        assert results == [10, 10, 10, 10, 10, 12]
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_concurrent_failure_not_cached(self):
+        """Test that a failed shared call raises for every waiter and is retried later."""
+        call_count = 0
+
+        @cached(ttl=300)
+        async def flaky(x):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            if call_count == 1:
+                raise RuntimeError("boom")
+            return x
+
+        results = await asyncio.gather(flaky(1), flaky(1), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        assert await flaky(1) == 1
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_invalidate(self):
+        """Test that invalidate() drops only the entry for the given arguments."""
+        call_count = 0
+
+        @cached(ttl=300)
+        async def my_function(x):
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        await my_function(1)
+        await my_function(2)
+        my_function.invalidate(1)
+        await my_function(1)
+        await my_function(2)
+
+        assert call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_with_key_function(self):
+        """Test that a key function buckets arguments into shared entries."""
+        call_count = 0
+
+        @cached(ttl=300, key=lambda x: round(x))
+        async def my_function(x):
+            nonlocal call_count
+            call_count += 1
+            return x * 2
+
+        result1 = await my_function(5.1)
+        result2 = await my_function(4.9)
+        result3 = await my_function(7.0)
+
+        assert result1 == 10.2
+        assert result2 == 10.2  # Same bucket as 5.1
+        assert result3 == 14.0
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_decorator_invalidate_during_call(self):
+        """Test that invalidating while a call runs starts a fresh one and drops the stale result."""
+        version = 0
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        @cached(ttl=300)
+        async def fetch():
+            result = version
+            started.set()
+            await release.wait()
+            return result
+
+        stale = asyncio.ensure_future(fetch())
+        await started.wait()
+
+        version = 1
+        started.clear()
+        fetch.invalidate()
+        fresh = asyncio.ensure_future(fetch())
+        await asyncio.wait_for(started.wait(), 1)  # A fresh call, not the stale one
+        release.set()
+
+        assert await stale == 0
+        assert await fresh == 1
+        assert await fetch() == 1
+
+
+class TestCoalescedDecorator:
+    """Tests for the coalesced decorator."""
+
+    @pytest.mark.asyncio
+    async def test_coalesced_shares_running_call_but_keeps_no_result(self):
+        """Test that concurrent calls share one execution and later calls run again."""
+        call_count = 0
+
+        @coalesced()
+        async def my_function(x):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        assert await asyncio.gather(my_function(5), my_function(5)) == [10, 10]
+        assert call_count == 1
+
+        assert await my_function(5) == 10
+        assert call_count == 2  # Finished calls are not reused
+
 
 class TestGetCache:
     """Tests for the get_cache function."""
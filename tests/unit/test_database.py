@@ -1,6 +1,8 @@
 """Tests for the database module."""
 
 import asyncio
+import math
+
 import pytest
 
 import src.data.database as db_module
@@ -73,3 +75,40 @@ async def test_concurrent_init_db_initializes_only_once(tmp_path, monkeypatch):
 
 async def _async_return(value):
     return value
+
+
+@pytest.mark.asyncio
+async def test_saved_operator_round_trip_keeps_wide_integers(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "src.data.database.get_db_path", lambda: _async_return(tmp_path / "test.db")
+    )
+    data = {
+        "manager_address": "0xmanager",
+        "reward_address": "0xreward",
+        "rewards": {"cumulative_rewards_shares": 2**70, "unclaimed_eth": 0.5},
+    }
+
+    await db_module.save_operator(7, data)
+    (saved,) = await db_module.get_saved_operators()
+
+    assert saved["rewards"] == data["rewards"]
+    assert saved["rewards"]["cumulative_rewards_shares"] == 2**70
+
+
+@pytest.mark.asyncio
+async def test_saved_operator_round_trip_keeps_non_finite_floats(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "src.data.database.get_db_path", lambda: _async_return(tmp_path / "test.db")
+    )
+    data = {
+        "manager_address": "0xmanager",
+        "reward_address": "0xreward",
+        "performance": {"avg_effectiveness": float("nan"), "apy": float("inf")},
+    }
+
+    await db_module.save_operator(7, data)
+    saved_operators = await db_module.get_saved_operators()
+
+    assert len(saved_operators) == 1
+    assert math.isnan(saved_operators[0]["performance"]["avg_effectiveness"])
+    assert saved_operators[0]["performance"]["apy"] == float("inf")
@@ -0,0 +1,69 @@
+"""Tests for the shared HTTP client."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from src.data.http import close_client, get_client, loads_json_exact, parse_json, parse_json_exact
+
+
+class TestSharedClient:
+    """Tests for get_client/close_client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_reused_within_loop(self):
+        """Repeated calls on the same loop return the same pooled client."""
+        first = await get_client()
+        second = await get_client()
+        assert first is second
+        await close_client()
+
+    @pytest.mark.asyncio
+    async def test_close_client_forces_new_client(self):
+        """A closed client is replaced on the next call."""
+        first = await get_client()
+        await close_client()
+        assert first.is_closed
+
+        second = await get_client()
+        assert second is not first
+        await close_client()
+
+    def test_new_client_per_event_loop(self):
+        """Each asyncio.run() gets a client bound to its own loop."""
+        first = asyncio.run(get_client())
+        second = asyncio.run(get_client())
+        assert first is not second
+        asyncio.run(close_client())
+
+
+class TestParseJson:
+    """Tests for parse_json."""
+
+    def test_parses_response_body(self):
+        """Decodes the same value as response.json()."""
+        response = httpx.Response(200, json={"data": [{"pubkey": "0xabc", "balance": 32}]})
+        assert parse_json(response) == response.json()
+
+    def test_invalid_json_raises_stdlib_error(self):
+        """Invalid bodies raise an error existing json.JSONDecodeError handlers catch."""
+        response = httpx.Response(200, content=b"<html>rate limited</html>")
+        with pytest.raises(json.JSONDecodeError):
+            parse_json(response)
+
+    def test_exact_decoding_keeps_integers_beyond_64_bits(self):
+        """uint256 share amounts are not rounded through a float."""
+        shares = 123456789012345678901234
+        response = httpx.Response(
+            200, content=b'{"CSM Operator 1": {"cumulativeFeeShares": %d, "proof": ["0x12"]}}' % shares
+        )
+        assert parse_json_exact(response)["CSM Operator 1"]["cumulativeFeeShares"] == shares
+
+    @pytest.mark.parametrize("literal", [
+        b"-9223372036854775809",  # One below the i64 minimum, only 19 digits
+        b"18446744073709551616",  # One above the u64 maximum
+    ])
+    def test_exact_decoding_keeps_integers_just_outside_64_bits(self, literal):
+        assert loads_json_exact(b'{"shares": %s}' % literal) == {"shares": int(literal)}
@@ -21,9 +21,9 @@ class TestParseOperatorIdentifier:
         assert exc.value.detail == "Invalid operator ID"
 
     def test_parses_and_normalizes_eth_address(self):
-        kind, value = parse_operator_identifier("0x00000000219ab540356cbb839cbe05303d7705fa")
+        kind, value = parse_operator_identifier("0x00000000219AB540356CBB839CBE05303D7705FA")
         assert kind == "address"
-        assert value == "0x00000000219ab540356cBB839Cbe05303d7705Fa"
+        assert value == "0x00000000219ab540356cbb839cbe05303d7705fa"
 
     def test_rejects_malformed_eth_address(self):
         with pytest.raises(HTTPException) as exc:
@@ -36,3 +36,20 @@ class TestParseOperatorIdentifier:
             parse_operator_identifier("not-an-id-or-address")
         assert exc.value.status_code == 400
         assert exc.value.detail == "Invalid identifier format"
+
+    def test_rejects_non_hex_address(self):
+        with pytest.raises(HTTPException) as exc:
+            parse_operator_identifier("0x00000000219ab540356cbb839cbe05303d7705fg")
+        assert exc.value.status_code == 400
+
+    def test_accepts_checksummed_address(self):
+        kind, value = parse_operator_identifier("0x00000000219ab540356cBB839Cbe05303d7705Fa")
+        assert kind == "address"
+        assert value == "0x00000000219ab540356cbb839cbe05303d7705fa"
+
+    def test_rejects_address_with_bad_checksum(self):
+        # Valid checksum is ...cBB839Cbe05303d7705Fa; one letter's case flipped
+        with pytest.raises(HTTPException) as exc:
+            parse_operator_identifier("0x00000000219ab540356cBB839Cbe05303d7705FA")
+        assert exc.value.status_code == 400
+        assert exc.value.detail == "Invalid Ethereum address"
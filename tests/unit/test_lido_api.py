@@ -0,0 +1,63 @@
+"""Tests for historical APR lookups in the Lido API provider."""
+
+from src.data.lido_api import LidoAPIProvider, _index_apr_data
+
+
+def _apr_data():
+    return [
+        {"block": "100", "apr": "3.0", "blockTime": "1000"},
+        {"block": "200", "apr": "4.0", "blockTime": "2000"},
+        {"block": "bad", "apr": "9.0", "blockTime": "bad"},
+        {"block": "300", "apr": "5.0", "blockTime": "3000"},
+        {"block": "400", "apr": "oops", "blockTime": "4000"},
+    ]
+
+
+class TestGetAprForBlock:
+    """Tests for get_apr_for_block."""
+
+    def test_exact_and_between_blocks(self):
+        provider = LidoAPIProvider()
+        data = _apr_data()
+        assert provider.get_apr_for_block(data, 200) == 4.0
+        assert provider.get_apr_for_block(data, 299) == 4.0
+        assert provider.get_apr_for_block(data, 10_000) is None  # invalid APR at block 400
+
+    def test_before_first_report(self):
+        provider = LidoAPIProvider()
+        assert provider.get_apr_for_block(_apr_data(), 99) is None
+
+    def test_empty_data(self):
+        assert LidoAPIProvider().get_apr_for_block([], 100) is None
+
+
+class TestGetAverageAprForRange:
+    """Tests for get_average_apr_for_range."""
+
+    def test_average_within_range(self):
+        provider = LidoAPIProvider()
+        assert provider.get_average_apr_for_range(_apr_data(), 1000, 3000) == 4.0
+
+    def test_invalid_aprs_are_skipped(self):
+        provider = LidoAPIProvider()
+        assert provider.get_average_apr_for_range(_apr_data(), 2500, 5000) == 5.0
+
+    def test_falls_back_to_closest_before_range(self):
+        provider = LidoAPIProvider()
+        assert provider.get_average_apr_for_range(_apr_data(), 2100, 2900) == 4.0
+
+    def test_range_before_all_reports(self):
+        provider = LidoAPIProvider()
+        assert provider.get_average_apr_for_range(_apr_data(), 0, 500) is None
+
+    def test_index_rebuilt_for_new_data(self):
+        provider = LidoAPIProvider()
+        assert provider.get_average_apr_for_range(_apr_data(), 1000, 1000) == 3.0
+        other = [{"block": "1", "apr": "7.5", "blockTime": "1000"}]
+        assert provider.get_average_apr_for_range(other, 1000, 1000) == 7.5
+
+    def test_range_average_is_memoized(self):
+        provider = LidoAPIProvider()
+        data = _apr_data()
+        provider.get_average_apr_for_range(data, 1000, 3000)
+        assert _index_apr_data(data)._range_averages == {(1000, 3000): 4.0}
@@ -0,0 +1,148 @@
+"""Tests for the on-chain data provider."""
+
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from requests.exceptions import ReadTimeout
+from web3.exceptions import BadResponseFormat
+
+from src.data import onchain
+from src.data.onchain import OnChainDataProvider
+
+
+@pytest.fixture(autouse=True)
+def clear_keys_cache():
+    onchain._deposited_keys_cache.clear()
+
+
+def _make_provider():
+    provider = OnChainDataProvider.__new__(OnChainDataProvider)
+    provider.csmodule = MagicMock(address="0xcsm")
+    provider.get_signing_keys = AsyncMock(
+        side_effect=lambda operator_id, start, count: [f"key{i}" for i in range(start, start + count)]
+    )
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_get_deposited_signing_keys_fetches_only_new_keys():
+    provider = _make_provider()
+
+    assert await provider.get_deposited_signing_keys(5, 3) == ["key0", "key1", "key2"]
+    assert await provider.get_deposited_signing_keys(5, 5) == [f"key{i}" for i in range(5)]
+
+    calls = [call.args for call in provider.get_signing_keys.call_args_list]
+    assert calls == [(5, 0, 3), (5, 3, 2)]
+
+
+@pytest.mark.asyncio
+async def test_get_deposited_signing_keys_reuses_cached_keys():
+    provider = _make_provider()
+    await provider.get_deposited_signing_keys(5, 4)
+
+    assert await provider.get_deposited_signing_keys(5, 4) == [f"key{i}" for i in range(4)]
+    assert await provider.get_deposited_signing_keys(5, 2) == ["key0", "key1"]
+    assert provider.get_signing_keys.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_deposited_keys_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(onchain._deposited_keys_cache, "_max_size", 2)
+    provider = _make_provider()
+
+    for operator_id in (1, 2, 3):
+        await provider.get_deposited_signing_keys(operator_id, 1)
+
+    assert onchain._deposited_keys_cache.size == 2
+    await provider.get_deposited_signing_keys(1, 1)  # Evicted, fetched again
+    assert provider.get_signing_keys.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_signing_keys_caps_concurrent_batches():
+    lock = threading.Lock()
+    in_flight = max_in_flight = 0
+
+    def get_signing_keys(operator_id, start, count):
+        def call():
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return bytes(48 * count)
+
+        return MagicMock(call=call)
+
+    provider = OnChainDataProvider.__new__(OnChainDataProvider)
+    provider.csmodule = MagicMock()
+    provider.csmodule.functions.getSigningKeys = get_signing_keys
+
+    keys = await provider.get_signing_keys(5, 0, 1000)
+
+    assert len(keys) == 1000
+    assert max_in_flight <= onchain.SIGNING_KEYS_BATCH_CONCURRENCY
+
+
+def test_providers_share_web3_and_contracts_per_rpc_url():
+    first = OnChainDataProvider("http://localhost:8545")
+    second = OnChainDataProvider("http://localhost:8545")
+    other = OnChainDataProvider("http://localhost:8546")
+
+    assert first.w3 is second.w3
+    assert first.csmodule is second.csmodule
+    assert first._data_warnings is not second._data_warnings
+    assert other.w3 is not first.w3
+
+
+def _make_batch_provider(rpc_url, execute):
+    provider = OnChainDataProvider.__new__(OnChainDataProvider)
+    provider._rpc_url = rpc_url
+    provider.steth = MagicMock()
+    provider.steth.functions.getPooledEthByShares = lambda shares: shares
+    batch = MagicMock()
+    batch.execute = execute
+    provider.w3 = MagicMock()
+    provider.w3.batch_requests.return_value.__enter__.return_value = batch
+    provider.shares_to_eth = AsyncMock(side_effect=lambda s: s / 10**18)
+    return provider, batch
+
+
+@pytest.mark.asyncio
+async def test_shares_to_eth_many_sends_one_batch():
+    provider, batch = _make_batch_provider(
+        "http://batch-ok", lambda: [2 * 10**18, 4 * 10**18]
+    )
+
+    result = await provider.shares_to_eth_many((10**18, 0, 2 * 10**18, 10**18))
+
+    assert result == (2, 0, 4, 2)
+    assert [call.args for call in batch.add.call_args_list] == [(10**18,), (2 * 10**18,)]
+    provider.shares_to_eth.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_shares_to_eth_many_falls_back_when_batches_rejected():
+    execute = MagicMock(side_effect=BadResponseFormat("Batch response must be formatted as a list"))
+    provider, _ = _make_batch_provider("http://batch-rejected", execute)
+
+    assert await provider.shares_to_eth_many((10**18, 3 * 10**18)) == (1, 3)
+    assert await provider.shares_to_eth_many((5 * 10**18,)) == (5,)
+    assert execute.call_count == 1  # Not re-probed once the RPC rejected a batch
+    onchain._batch_unsupported_rpcs.discard("http://batch-rejected")
+
+
+@pytest.mark.asyncio
+async def test_shares_to_eth_many_keeps_batching_after_transient_error():
+    execute = MagicMock(side_effect=[ReadTimeout("timed out"), [7 * 10**18]])
+    provider, _ = _make_batch_provider("http://batch-flaky", execute)
+
+    assert await provider.shares_to_eth_many((6 * 10**18,)) == (6,)  # Fell back once
+    assert await provider.shares_to_eth_many((7 * 10**18,)) == (7,)
+    assert execute.call_count == 2
+    assert "http://batch-flaky" not in onchain._batch_unsupported_rpcs
+    provider.shares_to_eth.assert_awaited_once_with(6 * 10**18)
@@ -1,6 +1,23 @@
 """Unit tests for operator service helper logic."""
 
-from src.services.operator_service import allocate_claimed_shares_to_frames
+import asyncio
+from dataclasses import replace
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.types import APYMetrics, BondSummary, NodeOperator, RewardsInfo
+from src.data.beacon import ValidatorInfo, ValidatorStatus, epoch_to_datetime
+from src.data.cache import get_cache
+from src.data.ipfs_logs import FrameData, IPFSLogProvider
+from src.data.onchain import OperatorReads
+from src.services import operator_service
+from src.services.operator_service import (
+    OperatorService,
+    allocate_claimed_shares_to_frames,
+    invalidate_apy_metrics,
+)
 
 
 def test_allocate_claimed_shares_partial_oldest_first():
@@ -35,3 +52,288 @@ def test_allocate_claimed_shares_zero_or_negative():
 
     assert allocate_claimed_shares_to_frames(frame_shares, 0) == [0, 0, 0]
     assert allocate_claimed_shares_to_frames(frame_shares, -5) == [0, 0, 0]
+
+
+def _make_service():
+    """Build an OperatorService with all network-facing providers mocked."""
+    service = OperatorService.__new__(OperatorService)
+    service.onchain = MagicMock()
+    service.onchain._data_warnings = []
+    service.onchain.batch_operator_reads = AsyncMock(return_value=OperatorReads(
+        operator=NodeOperator(
+            node_operator_id=7,
+            total_added_keys=2,
+            total_withdrawn_keys=0,
+            total_deposited_keys=2,
+            total_vetted_keys=2,
+            stuck_validators_count=0,
+            depositable_validators_count=0,
+            target_limit=0,
+            target_limit_mode=0,
+            total_exited_keys=0,
+            enqueued_count=0,
+            manager_address="0xmanager",
+            proposed_manager_address="0x0",
+            reward_address="0xreward",
+            proposed_reward_address="0x0",
+            extended_manager_permissions=False,
+        ),
+        curve_id=2,
+        bond=BondSummary(
+            current_bond_wei=3 * 10**18,
+            required_bond_wei=2 * 10**18,
+            current_bond_eth=3.0,
+            required_bond_eth=2.0,
+            excess_bond_eth=1.0,
+        ),
+        distributed_shares=40,
+    ))
+    service.onchain.get_operator_type_name = MagicMock(return_value="Permissionless")
+    service.onchain.shares_to_eth = AsyncMock(side_effect=lambda s: Decimal(s) / 10)
+    service.onchain.shares_to_eth_many = AsyncMock(
+        side_effect=lambda shares: tuple(Decimal(s) / 10 for s in shares)
+    )
+    service.onchain.get_and_clear_warnings = MagicMock(return_value=[])
+    service.rewards_tree = MagicMock()
+    service.rewards_tree.get_operator_rewards = AsyncMock(
+        return_value=RewardsInfo(cumulative_fee_shares=100, proof=[])
+    )
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_operator_by_id_summary():
+    service = _make_service()
+
+    rewards = await service.get_operator_by_id(7)
+
+    assert rewards.node_operator_id == 7
+    assert rewards.operator_type == "Permissionless"
+    assert rewards.cumulative_rewards_shares == 100
+    assert rewards.unclaimed_shares == 60
+    assert rewards.unclaimed_eth == 6.0
+    assert rewards.distributed_eth == 4.0
+    assert rewards.total_claimable_eth == 7.0
+    assert rewards.active_validators == 2
+
+
+@pytest.mark.asyncio
+async def test_get_operator_by_id_coalesces_concurrent_lookups():
+    service = _make_service()
+    calls = 0
+
+    reads = service.onchain.batch_operator_reads.return_value
+
+    async def slow_reads(operator_id):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return reads
+
+    service.onchain.batch_operator_reads = AsyncMock(side_effect=slow_reads)
+    service._get_validator_details = AsyncMock(return_value=[])
+    service.calculate_apy_metrics = AsyncMock(return_value=APYMetrics())
+    service.calculate_health_status = AsyncMock(return_value=None)
+
+    results = await asyncio.gather(
+        service.get_operator_by_id(7),
+        service.get_operator_by_id(7, False),
+        service.get_operator_by_id(7, True),
+    )
+
+    assert results[0] is results[1]
+    assert calls == 2  # Different include_validators flag is a separate lookup
+    await service.get_operator_by_id(7)
+    assert calls == 3  # Finished lookups are not reused
+
+
+def _withdrawn_validator(index: int, activation_epoch: int) -> ValidatorInfo:
+    return ValidatorInfo(
+        pubkey=f"0x{index:096x}",
+        index=index,
+        status=ValidatorStatus.WITHDRAWAL_DONE,
+        activation_epoch=activation_epoch,
+        exit_epoch=activation_epoch + 1000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_operator_by_id_fully_exited_keeps_beacon_fields():
+    operator_service._withdrawn_validators_cache.clear()
+    service = _make_service()
+    reads = service.onchain.batch_operator_reads.return_value
+    service.onchain.batch_operator_reads.return_value = replace(
+        reads, operator=replace(reads.operator, total_exited_keys=2)
+    )
+    service._get_validator_details = AsyncMock(
+        return_value=[_withdrawn_validator(1, 300), _withdrawn_validator(2, 100)]
+    )
+    service.calculate_apy_metrics = AsyncMock(return_value=APYMetrics())
+    service.calculate_health_status = AsyncMock(return_value=None)
+
+    rewards = await service.get_operator_by_id(7, include_validators=True)
+    again = await service.get_operator_by_id(7, include_validators=True)
+
+    # Exited operators still show their beacon-derived status and history
+    assert rewards.validators_by_status["exited"] == 2
+    assert rewards.validators_by_status["active"] == 0
+    assert rewards.active_since == epoch_to_datetime(100)
+    assert [v.index for v in rewards.validator_details] == [1, 2]
+    # All withdrawn is final, so the second lookup doesn't hit the beacon chain
+    assert again.validator_details == rewards.validator_details
+    service._get_validator_details.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_get_operator_by_id_unknown_operator_returns_none():
+    from web3.exceptions import ContractLogicError
+
+    service = _make_service()
+    service.onchain.batch_operator_reads = AsyncMock(side_effect=ContractLogicError("reverted"))
+
+    assert await service.get_operator_by_id(999) is None
+
+
+@pytest.mark.asyncio
+async def test_get_operators_batch_preserves_order_and_bounds_concurrency():
+    service = OperatorService.__new__(OperatorService)
+    in_flight = 0
+    peak = 0
+
+    async def fake_get_operator_by_id(operator_id, *args):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if operator_id == 3:
+            raise RuntimeError("rpc error")
+        return operator_id * 10
+
+    service.get_operator_by_id = fake_get_operator_by_id
+
+    results = await service.get_operators_batch([1, 2, 3, 4, 5], concurrency=2)
+
+    assert results == [10, 20, None, 40, 50]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_calculate_apy_metrics_dust_bond_skips_history():
+    get_cache().clear()
+    service = _make_service()
+    service.lido_api = MagicMock()
+    service.lido_api.get_steth_apr = AsyncMock(return_value={"apr": 2.5})
+    service.onchain.get_distribution_log_history = AsyncMock()
+    service.onchain.get_historical_apr_data = AsyncMock(return_value=[{"timestamp": 1, "apr": 2.4}])
+
+    apy = await service.calculate_apy_metrics(7, 0.001)
+
+    assert apy.bond_apy == 2.5
+    assert apy.net_apy_28d == 2.5
+    assert apy.frames is None
+    assert apy.uses_historical_apr is True
+    assert apy.current_bond_eth is None
+    service.onchain.get_distribution_log_history.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_calculate_apy_metrics_unbonded_skips_lido_api():
+    get_cache().clear()
+    service = _make_service()
+    service.lido_api = MagicMock()
+    service.lido_api.get_steth_apr = AsyncMock()
+
+    apy = await service.calculate_apy_metrics(7, 0.0)
+
+    assert apy.bond_apy is None
+    assert apy.net_apy_28d is None
+    service.lido_api.get_steth_apr.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_calculate_apy_metrics_frames_use_float_math():
+    get_cache().clear()
+    service = _make_service()
+    service.lido_api = MagicMock()
+    service.lido_api.get_steth_apr = AsyncMock(return_value={"apr": 3.0})
+    service.lido_api.get_average_apr_for_range = MagicMock(return_value=None)
+    service.onchain.get_distribution_log_history = AsyncMock(return_value=[{"block": 1, "logCid": "a"}])
+    service.onchain.get_historical_apr_data = AsyncMock(return_value=[])
+    # 28-day frames (6300 epochs) paying 1 ETH each
+    frames = [
+        FrameData(start_epoch=0, end_epoch=6300, log_cid="a", block_number=1,
+                  distributed_rewards=10, validator_count=2),
+        FrameData(start_epoch=6300, end_epoch=12600, log_cid="b", block_number=2,
+                  distributed_rewards=10, validator_count=2),
+    ]
+    service.ipfs_logs = IPFSLogProvider.__new__(IPFSLogProvider)
+    service.ipfs_logs.get_operator_history = AsyncMock(return_value=(frames, 0))
+
+    apy = await service.calculate_apy_metrics(7, 2.0)
+
+    assert apy.current_distribution_eth == 1.0
+    assert apy.current_distribution_apy == round(0.5 * 365 / 28 * 100, 2)
+    assert apy.current_bond_eth == round(2.0 * 0.03 * 28 / 365, 6)
+    assert apy.lifetime_distribution_eth == 2.0
+    assert isinstance(apy.lifetime_bond_eth, float)
+    assert apy.net_apy_28d == round(apy.current_distribution_apy + 3.0, 2)
+
+
+@pytest.mark.asyncio
+async def test_get_withdrawal_history_builds_events():
+    service = _make_service()
+    service.onchain.get_node_operator = AsyncMock(return_value=MagicMock(reward_address="0xreward"))
+    service.onchain.get_withdrawal_history = AsyncMock(return_value=[
+        {"block_number": 10, "timestamp": "2025-01-01T00:00:00+00:00", "shares": 5 * 10**17,
+         "eth_value": 0.5, "tx_hash": "0xabc"},
+    ])
+
+    events = await service.get_withdrawal_history(7)
+
+    assert events[0].model_dump() == {
+        "block_number": 10,
+        "timestamp": "2025-01-01T00:00:00+00:00",
+        "shares": 5 * 10**17,
+        "eth_value": 0.5,
+        "tx_hash": "0xabc",
+        "withdrawal_type": "stETH",
+        "request_id": None,
+        "status": None,
+        "claimed_eth": None,
+        "claim_tx_hash": None,
+        "claim_timestamp": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_calculate_apy_metrics_cached_result_keeps_warnings():
+    get_cache().clear()
+    first, second = _make_service(), _make_service()
+    compute = AsyncMock(side_effect=lambda *args: (
+        first.onchain._data_warnings.append("IPFS failed") or APYMetrics(bond_apy=3.0)
+    ))
+    first._compute_apy_metrics = second._compute_apy_metrics = compute
+
+    await first.calculate_apy_metrics(7, 2.0)
+    await second.calculate_apy_metrics(7, 2.0)
+
+    assert compute.await_count == 1
+    assert first.onchain._data_warnings == ["IPFS failed"]
+    assert second.onchain._data_warnings == ["IPFS failed"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_apy_metrics_forces_recompute():
+    get_cache().clear()
+    service = _make_service()
+    service._compute_apy_metrics = AsyncMock(return_value=APYMetrics())
+
+    await service.calculate_apy_metrics(7, 2.0)
+    invalidate_apy_metrics(7)
+    await service.calculate_apy_metrics(7, 2.0)
+    invalidate_apy_metrics()
+    await service.calculate_apy_metrics(7, 2.0)
+    await service.calculate_apy_metrics(8, 2.0)
+
+    assert service._compute_apy_metrics.await_count == 4
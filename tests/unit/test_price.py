@@ -0,0 +1,59 @@
+"""Tests for the ETH price fetcher."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.data import price
+
+
+def _mock_client(status_code=200, usd=3000.0):
+    """Build a fake shared client whose get() yields to the loop before responding."""
+    response = httpx.Response(status_code, json={"ethereum": {"usd": usd}})
+
+    async def get(*args, **kwargs):
+        await asyncio.sleep(0)
+        return response
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=get)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_price_cache():
+    price._price_cache = price._PriceCache()
+    yield
+
+
+class TestGetEthPrice:
+    """Tests for get_eth_price single-flight caching."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_fetch_once(self):
+        client = _mock_client()
+        with patch("src.data.price.get_client", AsyncMock(return_value=client)):
+            results = await asyncio.gather(*[price.get_eth_price() for _ in range(10)])
+
+        assert results == [3000.0] * 10
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_is_shared_by_waiters(self):
+        client = _mock_client(status_code=429)
+        with patch("src.data.price.get_client", AsyncMock(return_value=client)):
+            results = await asyncio.gather(*[price.get_eth_price() for _ in range(5)])
+
+        assert results == [None] * 5
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_cache_skips_fetch(self):
+        client = _mock_client()
+        with patch("src.data.price.get_client", AsyncMock(return_value=client)):
+            await price.get_eth_price()
+            await price.get_eth_price()
+
+        assert client.get.await_count == 1
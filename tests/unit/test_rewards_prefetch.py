@@ -0,0 +1,96 @@
+"""Tests for the background rewards tree prefetch."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+from src.data.cache import get_cache
+from src.data.rewards_tree import RewardsTreeProvider
+from src.services import rewards_prefetch
+
+OLD_TREE = {"CSM Operator 1": {}}
+NEW_TREE = {"CSM Operator 1": {}, "CSM Operator 2": {}}
+
+
+async def _run_polls(cids, refresh_results=None, tree=None, after_poll=None):
+    """Run watch_rewards_tree for len(cids) polls and return the tree provider."""
+    onchain = MagicMock()
+    onchain.get_tree_cid = AsyncMock(side_effect=cids)
+    if tree is None:
+        tree = MagicMock()
+        tree.fetch_rewards_data = AsyncMock(return_value=OLD_TREE)
+        tree.refresh = AsyncMock(side_effect=refresh_results)
+    polls = 0
+
+    async def fake_sleep(_):
+        nonlocal polls
+        polls += 1
+        if after_poll is not None:
+            await after_poll(polls)
+        if polls == len(cids):
+            raise asyncio.CancelledError
+
+    with (
+        patch.object(rewards_prefetch, "OnChainDataProvider", return_value=onchain),
+        patch.object(rewards_prefetch, "RewardsTreeProvider", return_value=tree),
+        patch.object(rewards_prefetch.asyncio, "sleep", fake_sleep),
+    ):
+        with pytest.raises(asyncio.CancelledError):
+            await rewards_prefetch.watch_rewards_tree()
+    return tree
+
+
+@pytest.mark.asyncio
+async def test_watch_rewards_tree_refreshes_on_new_cid():
+    tree = await _run_polls(["cid1", "cid1", "cid2", "cid2"], [NEW_TREE])
+
+    tree.fetch_rewards_data.assert_awaited_once()
+    tree.refresh.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_watch_rewards_tree_retries_until_tree_published():
+    tree = await _run_polls(["cid1", "cid2", "cid2", "cid2"], [OLD_TREE, NEW_TREE])
+
+    # Retried once after the stale download, then the CID was marked handled
+    assert tree.refresh.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_watch_rewards_tree_accepts_unchanged_tree_eventually():
+    polls = rewards_prefetch.MAX_UNCHANGED_TREE_POLLS + 2
+    tree = await _run_polls(["cid1"] + ["cid2"] * polls, [OLD_TREE] * polls)
+
+    assert tree.refresh.await_count == rewards_prefetch.MAX_UNCHANGED_TREE_POLLS
+
+
+@pytest.mark.asyncio
+async def test_watch_rewards_tree_handles_new_tree_already_in_cache(httpx_mock):
+    get_cache().clear()
+    served = {"tree": OLD_TREE}
+    downloads = 0
+
+    def serve(request):
+        nonlocal downloads
+        downloads += 1
+        return httpx.Response(200, json=served["tree"])
+
+    httpx_mock.add_callback(serve, is_reusable=True)
+    provider = RewardsTreeProvider()
+
+    async def after_poll(polls):
+        if polls == 1:
+            # A request-path lookup re-downloads the tree after the new one is
+            # published but before the watcher sees the CID change
+            served["tree"] = NEW_TREE
+            provider.fetch_rewards_data.invalidate(provider)
+            await provider.fetch_rewards_data()
+
+    await _run_polls(["cid1", "cid2", "cid2", "cid2"], tree=provider, after_poll=after_poll)
+
+    # Warm-up, the request-path download, then a single refresh for cid2
+    assert downloads == 3
+    assert await provider.fetch_rewards_data() == NEW_TREE
+    get_cache().clear()
@@ -0,0 +1,127 @@
+"""Tests for API route helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from starlette.requests import Request
+
+from src.core.types import OperatorRewards
+from src.data.cache import get_cache
+from src.web import routes
+
+
+def _rewards() -> OperatorRewards:
+    return OperatorRewards(
+        node_operator_id=7,
+        manager_address="0xmanager",
+        reward_address="0xreward",
+        current_bond_eth=2.0,
+        required_bond_eth=2.0,
+        excess_bond_eth=0.0,
+        cumulative_rewards_shares=0,
+        cumulative_rewards_eth=0.0,
+        distributed_shares=0,
+        distributed_eth=0.0,
+        unclaimed_shares=0,
+        unclaimed_eth=0.0,
+        total_claimable_eth=0.0,
+        total_validators=0,
+        active_validators=0,
+        exited_validators=0,
+    )
+
+
+def _request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.fixture
+def service(monkeypatch):
+    get_cache().clear()
+    service = MagicMock()
+
+    async def slow_lookup(*args):
+        await asyncio.sleep(0.01)
+        return _rewards()
+
+    service.get_operator_by_id = AsyncMock(side_effect=slow_lookup)
+    monkeypatch.setattr(routes, "OperatorService", MagicMock(return_value=service))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_get_operator_coalesces_and_caches_responses(service):
+    results = await asyncio.gather(
+        routes.get_operator("7", _request(), False, False, False),
+        routes.get_operator("7", _request(), False, False, False),
+        routes.get_operator("7", _request(), True, False, False),
+    )
+
+    assert results[0].body == results[1].body
+    assert b'"operator_id":7' in results[0].body
+    assert service.get_operator_by_id.await_count == 2  # detailed is a separate entry
+    assert results[0].headers["cache-control"].startswith("private, max-age=30")
+
+    await routes.get_operator("7", _request(), False, False, False)
+    assert service.get_operator_by_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_operator_response_forces_rebuild(service):
+    await routes.get_operator("7", _request(), True, False, False)
+
+    routes._invalidate_operator_response(7)
+    await routes.get_operator("7", _request(), True, False, False)
+
+    assert service.get_operator_by_id.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_operator_returns_304_for_matching_etag(service):
+    first = await routes.get_operator("7", _request(), False, False, False)
+    etag = first.headers["etag"]
+
+    revalidated = await routes.get_operator("7", _request(etag), False, False, False)
+
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
+    assert revalidated.headers["etag"] == etag
+
+
+@pytest.mark.asyncio
+async def test_list_operators_reuses_encoded_body(service):
+    service.get_all_operators_with_rewards = AsyncMock(return_value=[1, 2, 5])
+
+    first, second = await asyncio.gather(
+        routes.list_operators(_request()), routes.list_operators(_request())
+    )
+    revalidated = await routes.list_operators(_request(first.headers["etag"]))
+
+    assert first.body == b'{"count":3,"operator_ids":[1,2,5]}'
+    assert second.body == first.body
+    assert revalidated.status_code == 304
+    assert service.get_all_operators_with_rewards.await_count == 1
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0.0, "0"),
+    (2.0, "2"),
+    (1.5, "1.5"),
+    (1e-05, "0.00001"),
+    (1e-18, "0.000000000000000001"),
+])
+def test_format_eth_never_uses_scientific_notation(value, expected):
+    assert routes._format_eth(value) == expected
+
+
+@pytest.mark.asyncio
+async def test_operator_response_formats_small_eth_amounts(service):
+    service.get_operator_by_id.side_effect = None
+    service.get_operator_by_id.return_value = _rewards().model_copy(update={"unclaimed_eth": 1e-05})
+
+    response = await routes.get_operator("7", _request(), False, False, False)
+
+    assert b'"unclaimed_eth":"0.00001"' in response.body
+    assert b'"excess_bond_eth":"0"' in response.body
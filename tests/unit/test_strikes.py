@@ -162,3 +162,10 @@ class TestPubkeyValidation:
         assert len(strikes) == 1
         assert strikes[0].pubkey == valid_pubkey
         assert strikes[0].strike_count == 2
+
+    def test_providers_share_csstrikes_contract(self, tmp_path):
+        """The contract object is built once, not per provider instance."""
+        first = StrikesProvider(cache_dir=tmp_path)
+        second = StrikesProvider(cache_dir=tmp_path)
+
+        assert first.csstrikes is second.csstrikes
@@ -15,6 +15,7 @@ from src.core.types import (
     StrikeSummary,
     WithdrawalEvent,
 )
+from src.data.beacon import ValidatorInfo, ValidatorStatus
 
 
 class TestBondSummary:
@@ -23,22 +24,22 @@ class TestBondSummary:
     def test_bond_summary_creation(self, sample_bond_summary):
         """Test creating a BondSummary instance."""
         assert sample_bond_summary.current_bond_wei == 26269317414398397106
-        assert sample_bond_summary.current_bond_eth == Decimal("26.269317414398397106")
-        assert sample_bond_summary.excess_bond_eth == Decimal("0.069317414398397106")
+        assert sample_bond_summary.current_bond_eth == pytest.approx(26.269317414398397)
+        assert sample_bond_summary.excess_bond_eth == pytest.approx(0.069317414398397)
 
-    def test_bond_summary_decimal_precision(self):
-        """Test that Decimal values maintain full precision."""
+    def test_bond_summary_wei_is_exact(self):
+        """Test that wei values stay exact while ETH values are display floats."""
         bond = BondSummary(
             current_bond_wei=26269317414398397106,
             required_bond_wei=26200000000000000000,
-            current_bond_eth=Decimal("26.269317414398397106"),
-            required_bond_eth=Decimal("26.200000000000000000"),
-            excess_bond_eth=Decimal("0.069317414398397106"),
+            current_bond_eth=26269317414398397106 / 1e18,
+            required_bond_eth=26.2,
+            excess_bond_eth=69317414398397106 / 1e18,
         )
 
-        # Verify full precision is maintained
-        assert str(bond.current_bond_eth) == "26.269317414398397106"
-        assert str(bond.excess_bond_eth) == "0.069317414398397106"
+        assert bond.current_bond_wei - bond.required_bond_wei == 69317414398397106
+        assert isinstance(bond.current_bond_eth, float)
+        assert f"{bond.excess_bond_eth:.6f}" == "0.069317"
 
 
 class TestStrikeSummary:
@@ -269,10 +270,10 @@ class TestOperatorRewards:
         assert sample_operator_rewards.curve_id == 2
         assert sample_operator_rewards.total_validators == 500
 
-    def test_operator_rewards_decimal_precision(self, sample_operator_rewards):
-        """Test that Decimal fields maintain full precision."""
-        # Convert to string to verify full precision
-        assert "269317414398397106" in str(sample_operator_rewards.current_bond_eth)
+    def test_operator_rewards_eth_fields_are_floats(self, sample_operator_rewards):
+        """Test that ETH display fields are plain floats."""
+        assert isinstance(sample_operator_rewards.current_bond_eth, float)
+        assert f"{sample_operator_rewards.current_bond_eth:.6f}" == "26.269317"
         assert str(sample_operator_rewards.unclaimed_eth) == "1.35"
 
     def test_operator_rewards_with_withdrawals(self, sample_operator_rewards, sample_withdrawal_event):
@@ -287,3 +288,18 @@ class TestOperatorRewards:
         assert sample_operator_rewards.health is not None
         assert sample_operator_rewards.health.bond_healthy is True
         assert sample_operator_rewards.health.strikes.strike_threshold == 3
+
+    def test_operator_rewards_validator_details_serialization(self, sample_operator_rewards):
+        """Test that validator details serialize via ValidatorInfo.to_dict()."""
+        validator = ValidatorInfo(
+            pubkey="0xabc",
+            index=42,
+            status=ValidatorStatus.ACTIVE_ONGOING,
+            balance_gwei=31_000_000_000,
+        )
+        sample_operator_rewards.validator_details = [validator]
+
+        dumped = sample_operator_rewards.model_dump()["validator_details"]
+
+        assert dumped == [validator.to_dict()]
+        assert dumped[0]["at_risk"] is True